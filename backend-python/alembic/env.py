@@ -14,6 +14,10 @@ sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..'
 # Import Base and all models
 from app.db.schema import Base
 from app.db.models.news import News  # Import all models here
+from app.db.models.news_job import NewsJob
+from app.db.models.social_outbox import SocialOutbox
+from app.db.models.proposition import Proposition, PropositionAuthor
+from app.db.models.sync_watermark import SyncWatermark
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,45 @@
+"""create_news_jobs_table
+
+Revision ID: 3c8e2f1a9b70
+Revises: 1b127661301b
+Create Date: 2026-10-17 10:12:31.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8e2f1a9b70'
+down_revision: Union[str, None] = '1b127661301b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('news_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('proposition_id', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('next_run_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('locked_by', sa.String(length=100), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('news_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_news_jobs_proposition_id'), 'news_jobs', ['proposition_id'], unique=True)
+    op.create_index('ix_news_jobs_status_next_run_at', 'news_jobs', ['status', 'next_run_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_news_jobs_status_next_run_at', table_name='news_jobs')
+    op.drop_index(op.f('ix_news_jobs_proposition_id'), table_name='news_jobs')
+    op.drop_table('news_jobs')
@@ -0,0 +1,44 @@
+"""create_social_outbox_table
+
+Revision ID: 7d4b1e9c2a55
+Revises: 3c8e2f1a9b70
+Create Date: 2026-10-17 15:40:12.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4b1e9c2a55'
+down_revision: Union[str, None] = '3c8e2f1a9b70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('social_outbox',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('news_id', sa.UUID(), nullable=False),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('post_url', sa.String(length=500), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_social_outbox_news_id'), 'social_outbox', ['news_id'], unique=True)
+    op.create_index('ix_social_outbox_status_next_attempt_at', 'social_outbox', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_social_outbox_status_next_attempt_at', table_name='social_outbox')
+    op.drop_index(op.f('ix_social_outbox_news_id'), table_name='social_outbox')
+    op.drop_table('social_outbox')
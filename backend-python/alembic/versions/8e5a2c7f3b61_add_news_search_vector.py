@@ -0,0 +1,42 @@
+"""add_news_search_vector
+
+Revision ID: 8e5a2c7f3b61
+Revises: 7d4b1e9c2a55
+Create Date: 2026-10-17 15:02:47.318260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e5a2c7f3b61'
+down_revision: Union[str, None] = '7d4b1e9c2a55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('portuguese', coalesce((extra_metadata -> 'tags')::text, '')), 'B') || "
+    "setweight(to_tsvector('portuguese', coalesce(summary, '')), 'C') || "
+    "setweight(to_tsvector('portuguese', coalesce(full_content, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    op.add_column('news', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_news_search_vector', 'news', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_news_search_vector', table_name='news', postgresql_using='gin')
+    op.drop_column('news', 'search_vector')
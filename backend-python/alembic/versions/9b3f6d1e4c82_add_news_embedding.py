@@ -0,0 +1,38 @@
+"""add_news_embedding
+
+Revision ID: 9b3f6d1e4c82
+Revises: 8e5a2c7f3b61
+Create Date: 2026-10-17 16:40:09.771533
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3f6d1e4c82'
+down_revision: Union[str, None] = '8e5a2c7f3b61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.add_column('news', sa.Column('embedding', Vector(1536), nullable=True))
+    op.create_index(
+        'ix_news_embedding_hnsw',
+        'news',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_news_embedding_hnsw', table_name='news', postgresql_using='hnsw')
+    op.drop_column('news', 'embedding')
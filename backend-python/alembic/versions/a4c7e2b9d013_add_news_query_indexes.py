@@ -0,0 +1,42 @@
+"""add_news_query_indexes
+
+Revision ID: a4c7e2b9d013
+Revises: 9b3f6d1e4c82
+Create Date: 2026-10-17 18:05:52.140377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2b9d013'
+down_revision: Union[str, None] = '9b3f6d1e4c82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the indexes build
+    with op.get_context().autocommit_block():
+        op.create_index('ix_news_created_at_id', 'news', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_news_uf_author_created_at_id', 'news', ['uf_author', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_news_news_type_created_at_id', 'news', ['news_type', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_news_engagement_score_id', 'news', [sa.text('engagement_score DESC'), sa.text('id DESC')], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+        # Superseded by the composite indexes above (same leading column)
+        op.drop_index('ix_news_uf_author', table_name='news', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_news_news_type', table_name='news', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_news_engagement_score', table_name='news', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_news_engagement_score'), 'news', ['engagement_score'], unique=False)
+    op.create_index(op.f('ix_news_news_type'), 'news', ['news_type'], unique=False)
+    op.create_index(op.f('ix_news_uf_author'), 'news', ['uf_author'], unique=False)
+    op.drop_index('ix_news_engagement_score_id', table_name='news')
+    op.drop_index('ix_news_news_type_created_at_id', table_name='news')
+    op.drop_index('ix_news_uf_author_created_at_id', table_name='news')
+    op.drop_index('ix_news_created_at_id', table_name='news')
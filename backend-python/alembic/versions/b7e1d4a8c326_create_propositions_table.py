@@ -0,0 +1,54 @@
+"""create_propositions_table
+
+Revision ID: b7e1d4a8c326
+Revises: a4c7e2b9d013
+Create Date: 2026-10-17 19:20:14.338201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1d4a8c326'
+down_revision: Union[str, None] = 'a4c7e2b9d013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('propositions',
+    sa.Column('id_proposicao', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('sigla', sa.String(length=20), nullable=True),
+    sa.Column('numero', sa.Integer(), nullable=True),
+    sa.Column('ano', sa.Integer(), nullable=True),
+    sa.Column('ementa', sa.Text(), nullable=True),
+    sa.Column('ementa_detalhada', sa.Text(), nullable=True),
+    sa.Column('palavra_chave', sa.Text(), nullable=True),
+    sa.Column('data_apresentacao', sa.DateTime(), nullable=False),
+    sa.Column('url_teor_proposicao', sa.String(length=500), nullable=True),
+    sa.Column('url_principal', sa.String(length=500), nullable=True),
+    sa.Column('url_posterior', sa.String(length=500), nullable=True),
+    sa.Column('sigla_uf_autor', sa.String(length=2), nullable=True),
+    sa.Column('nome_autor', sa.String(length=200), nullable=True),
+    sa.Column('sigla_partido', sa.String(length=50), nullable=True),
+    sa.Column('tipo_autor', sa.String(length=100), nullable=True),
+    sa.Column('synced_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id_proposicao')
+    )
+    op.create_index('ix_propositions_data_apresentacao_id', 'propositions', ['data_apresentacao', 'id_proposicao'], unique=False)
+    op.create_table('sync_watermarks',
+    sa.Column('source', sa.String(length=50), nullable=False),
+    sa.Column('last_date', sa.DateTime(), nullable=False),
+    sa.Column('last_id', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('source')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_watermarks')
+    op.drop_index('ix_propositions_data_apresentacao_id', table_name='propositions')
+    op.drop_table('propositions')
@@ -0,0 +1,78 @@
+"""add_proposition_mirror_indexes
+
+Revision ID: c5f2a9e7d148
+Revises: b7e1d4a8c326
+Create Date: 2026-10-17 20:02:47.905316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f2a9e7d148'
+down_revision: Union[str, None] = 'b7e1d4a8c326'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table('proposition_authors',
+    sa.Column('id_proposicao', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('nome_autor', sa.String(length=200), nullable=True),
+    sa.Column('sigla_uf_autor', sa.String(length=2), nullable=True),
+    sa.Column('sigla_partido', sa.String(length=50), nullable=True),
+    sa.Column('tipo_autor', sa.String(length=100), nullable=True),
+    sa.ForeignKeyConstraint(['id_proposicao'], ['propositions.id_proposicao'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_proposicao', 'position')
+    )
+    op.create_index('ix_proposition_authors_sigla_uf_autor_id', 'proposition_authors', ['sigla_uf_autor', 'id_proposicao'], unique=False)
+
+    # Authors already staged (primary author only)
+    op.execute(
+        "INSERT INTO proposition_authors (id_proposicao, position, nome_autor, sigla_uf_autor, sigla_partido, tipo_autor) "
+        "SELECT id_proposicao, 0, nome_autor, sigla_uf_autor, sigla_partido, tipo_autor FROM propositions"
+    )
+
+    op.create_index(
+        'ix_propositions_ano_data_apresentacao_id',
+        'propositions',
+        [sa.text('ano DESC'), sa.text('data_apresentacao DESC'), sa.text('id_proposicao DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_propositions_sigla_ano_data_apresentacao_id',
+        'propositions',
+        ['sigla', sa.text('ano DESC'), sa.text('data_apresentacao DESC'), sa.text('id_proposicao DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_propositions_palavra_chave_trgm',
+        'propositions',
+        ['palavra_chave'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'palavra_chave': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_propositions_ementa_trgm',
+        'propositions',
+        ['ementa'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'ementa': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_propositions_ementa_trgm', table_name='propositions')
+    op.drop_index('ix_propositions_palavra_chave_trgm', table_name='propositions')
+    op.drop_index('ix_propositions_sigla_ano_data_apresentacao_id', table_name='propositions')
+    op.drop_index('ix_propositions_ano_data_apresentacao_id', table_name='propositions')
+    op.drop_index('ix_proposition_authors_sigla_uf_autor_id', table_name='proposition_authors')
+    op.drop_table('proposition_authors')
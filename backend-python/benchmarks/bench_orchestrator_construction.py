@@ -0,0 +1,64 @@
+"""
+Benchmark: per-request cost of building NewsOrchestratorService.
+
+Compares building every service per request (what get_orchestrator used to do)
+with reusing the lifespan-managed ServiceContainer, where only the
+AsyncSession-bound parts are created per request.
+
+    uv run python benchmarks/bench_orchestrator_construction.py [iterations]
+"""
+
+import os
+import sys
+import time
+
+# Constructing the OpenAI model needs a key, but no request is ever sent
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.ai_news_generator_service import AINewsGeneratorService
+from app.services.container import ServiceContainer
+from app.services.embedding_service import OpenAIEmbeddingService
+from app.services.news_orchestrator_service import NewsOrchestratorService
+from app.services.pdf_cache_service import PDFCacheService
+from app.services.pdf_processor_service import PDFProcessorService
+from app.services.storage_service import SupabaseStorageService
+
+
+def per_request_services() -> NewsOrchestratorService:
+    services = ServiceContainer.__new__(ServiceContainer)
+    services.pdf_processor = PDFProcessorService()
+    services.pdf_cache = PDFCacheService()
+    services.storage = SupabaseStorageService()
+    services.ai_generator = AINewsGeneratorService()
+    services.embedder = OpenAIEmbeddingService()
+    return NewsOrchestratorService(AsyncSession(), services)
+
+
+def shared_services(services: ServiceContainer) -> NewsOrchestratorService:
+    return NewsOrchestratorService(AsyncSession(), services)
+
+
+def measure(label: str, build, iterations: int) -> float:
+    build()  # warm up imports and caches
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build()
+    per_call_us = (time.perf_counter() - start) / iterations * 1_000_000
+    print(f"{label:<28} {per_call_us:>10.1f} µs/request")
+    return per_call_us
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    services = ServiceContainer()
+
+    print(f"Building NewsOrchestratorService ({iterations} iterations)")
+    before = measure("services per request", per_request_services, iterations)
+    after = measure("shared ServiceContainer", lambda: shared_services(services), iterations)
+    print(f"Overhead removed: {before - after:.1f} µs/request ({before / after:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
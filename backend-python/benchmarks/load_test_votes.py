@@ -0,0 +1,106 @@
+"""
+Load test: concurrent PATCH /news/{id}/vote calls against a running API.
+
+Fires `--votes` votes (roughly `--up-ratio` of them upvotes) with
+`--concurrency` requests in flight, then checks the stored counters moved by
+exactly the number of successful votes and reports latency percentiles.
+
+    uv run python benchmarks/load_test_votes.py <news_id> --votes 5000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def get_counts(client: httpx.AsyncClient, news_id: str) -> tuple[int, int, int]:
+    response = await client.get(f"/api/v1/news/{news_id}")
+    response.raise_for_status()
+    news = response.json()
+    return news["upvotes"], news["downvotes"], news["engagement_score"]
+
+
+async def run(args) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60.0) as client:
+        up_before, down_before, _ = await get_counts(client, args.news_id)
+
+        up_every = max(1, round(1 / args.up_ratio)) if args.up_ratio > 0 else 0
+        vote_types = [
+            "upvote" if up_every and i % up_every == 0 else "downvote"
+            for i in range(args.votes)
+        ]
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies: list[float] = []
+        sent = {"upvote": 0, "downvote": 0}
+        errors = 0
+
+        async def vote(vote_type: str):
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await client.patch(
+                        f"/api/v1/news/{args.news_id}/vote",
+                        json={"vote_type": vote_type}
+                    )
+                    response.raise_for_status()
+                    sent[vote_type] += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(vote(v) for v in vote_types))
+        elapsed = time.perf_counter() - started
+
+        # Let buffered votes flush (matters when the API runs several worker processes)
+        await asyncio.sleep(args.settle)
+        up_after, down_after, score_after = await get_counts(client, args.news_id)
+
+    print(f"Votes: {args.votes} ({errors} errors) in {elapsed:.1f}s -> {args.votes / elapsed:.0f} req/s")
+    print(
+        f"Latency ms: p50={statistics.median(latencies):.1f} "
+        f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f} "
+        f"max={max(latencies):.1f}"
+    )
+
+    exact = (
+        up_after - up_before == sent["upvote"]
+        and down_after - down_before == sent["downvote"]
+        and score_after == up_after - down_after
+    )
+    print(
+        f"Upvotes +{up_after - up_before} (expected {sent['upvote']}), "
+        f"downvotes +{down_after - down_before} (expected {sent['downvote']}), "
+        f"engagement_score {score_after} (expected {up_after - down_after})"
+    )
+    print("Counts exact" if exact else "LOST UPDATES: counts don't match")
+    return 0 if exact and not errors else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("news_id")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--votes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--settle", type=float, default=1.0, help="Seconds to wait before re-reading counts")
+    parser.add_argument("--up-ratio", type=float, default=0.5, help="Fraction of upvotes (0-1)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,42 @@
 """News API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from uuid import UUID
 import logging
-from datetime import datetime
 
 from app.db.session import get_db
 from app.services.news_orchestrator_service import NewsOrchestratorService
+from app.services.container import ServiceContainer
 from app.repositories.news_repository import NewsRepository
-from app.services.twitter_service import TwitterService
+from app.repositories.news_job_repository import NewsJobRepository
+from app.services.vote_buffer_service import VoteBufferService
+from app.services.embedding_service import news_embedding_text
+from app.services.response_cache_service import (
+    CachedResponse,
+    FEED_TAG,
+    TOP_TAG,
+    compute_etag,
+    get_response_cache,
+    invalidate_responses,
+    news_tag
+)
 from app.core.config import config
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.news_responses import (
     NewsResponse,
     NewsListResponse,
     PaginatedNewsResponse,
     PaginationMetadata,
     VoteRequest,
+    PropositionIdsRequest,
+    MissingPropositionsResponse,
     ProcessingResultResponse,
     BatchProcessingResponse,
+    JobEnqueueResponse,
+    NewsJobResponse,
     SocialPublishCheckResponse
 )
 
@@ -36,9 +53,106 @@ async def get_news_repo(db: AsyncSession = Depends(get_db)) -> NewsRepository:
     return NewsRepository(db)
 
 
-async def get_orchestrator(db: AsyncSession = Depends(get_db)) -> NewsOrchestratorService:
-    """Dependency to get orchestrator service"""
-    return NewsOrchestratorService(db)
+async def get_job_repo(db: AsyncSession = Depends(get_db)) -> NewsJobRepository:
+    """Dependency to get news job repository"""
+    return NewsJobRepository(db)
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """Dependency to get the process-wide services built in the app lifespan"""
+    return request.app.state.services
+
+
+async def get_orchestrator(
+    db: AsyncSession = Depends(get_db),
+    services: ServiceContainer = Depends(get_services)
+) -> NewsOrchestratorService:
+    """Dependency to get orchestrator service (only the session is per request)"""
+    return NewsOrchestratorService(db, services)
+
+
+def with_buffered_votes(response: NewsResponse, request: Request) -> NewsResponse:
+    """Add votes accepted but not yet flushed by the vote buffer to the counters"""
+    vote_buffer: Optional[VoteBufferService] = getattr(request.app.state, "vote_buffer", None)
+    if vote_buffer is None:
+        return response
+    
+    pending_up, pending_down = vote_buffer.pending(response.id)
+    if not pending_up and not pending_down:
+        return response
+    return response.model_copy(update={
+        "upvotes": response.upvotes + pending_up,
+        "downvotes": response.downvotes + pending_down,
+        "engagement_score": response.engagement_score + pending_up - pending_down
+    })
+
+
+news_list_adapter = TypeAdapter(list[NewsListResponse])
+
+
+async def get_or_build(
+    key: str,
+    tags: list[str],
+    ttl_seconds: float,
+    build: Callable[[], Awaitable[bytes]]
+) -> CachedResponse:
+    """
+    Serve a serialized response from the response cache, building it on a miss.
+    
+    Exceptions from build (e.g. 404) propagate and nothing is cached. Cache
+    backend errors fall back to building the response.
+    """
+    cache = get_response_cache()
+    try:
+        entry = await cache.get(key)
+        if entry is not None:
+            return entry
+        # Snapshot versions before reading, so a concurrent write invalidates this entry
+        versions = await cache.versions(tags)
+    except Exception as e:
+        logger.warning(f"Response cache read failed for {key}: {e}")
+        body = await build()
+        return CachedResponse(body=body, etag=compute_etag(body))
+    
+    body = await build()
+    entry = CachedResponse(body=body, etag=compute_etag(body), versions=versions)
+    try:
+        await cache.set(key, entry, ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Response cache write failed for {key}: {e}")
+    return entry
+
+
+def etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """JSON response with ETag; 304 when the client already has this version"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_etags or "*" in client_etags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def get_news_detail_response(
+    news_id: UUID,
+    news_repo: NewsRepository
+) -> NewsResponse:
+    """Cached NewsResponse for a news (raises 404), without buffered votes"""
+    
+    async def build() -> bytes:
+        news = await news_repo.get_by_id(news_id)
+        if not news:
+            raise HTTPException(status_code=404, detail="News not found")
+        return NewsResponse.model_validate(news).model_dump_json().encode()
+    
+    entry = await get_or_build(
+        f"news:{news_id}",
+        [news_tag(news_id)],
+        config.response_cache_detail_ttl_seconds,
+        build
+    )
+    return NewsResponse.model_validate_json(entry.body)
 
 
 # Note: More specific routes MUST come before parameterized routes
@@ -65,6 +179,8 @@ async def generate_news_batch(
     
     successful = sum(1 for r in results if r.get("success"))
     failed = len(results) - successful
+    if successful:
+        await invalidate_responses(FEED_TAG, TOP_TAG)
     
     return BatchProcessingResponse(
         total=len(results),
@@ -74,37 +190,83 @@ async def generate_news_batch(
     )
 
 
-@router.post("/generate/background")
+@router.post("/generate/background", response_model=JobEnqueueResponse)
 async def generate_news_background(
-    background_tasks: BackgroundTasks,
     propositions: list[dict],
-    max_concurrent: int = Query(default=3, ge=1, le=10)
+    job_repo: NewsJobRepository = Depends(get_job_repo)
 ):
     """
-    Generate news in background task (async, returns immediately).
+    Enqueue propositions for background generation (returns immediately).
+    
+    Jobs are persisted in the news_jobs table and processed by the
+    news worker process (python -m app.workers.news_worker). Enqueuing is
+    idempotent per proposition: already queued or processed propositions
+    are skipped, failed ones are retried.
     
     Args:
         propositions: List of proposition data
-        max_concurrent: Maximum concurrent processing
         
     Returns:
-        Acknowledgment message
+        Number of enqueued and skipped propositions
+    """
+    valid = [p for p in propositions if p.get("id_proposicao") is not None]
+    logger.info(f"Enqueuing {len(valid)} propositions for background processing")
+    
+    queued = await job_repo.enqueue(valid, max_attempts=config.news_job_max_attempts)
+    
+    return JobEnqueueResponse(
+        message=f"{len(queued)} propositions queued for background processing",
+        status="queued",
+        enqueued=len(queued),
+        skipped=len(propositions) - len(queued)
+    )
+
+
+@router.get("/jobs/{proposition_id}", response_model=NewsJobResponse)
+async def get_news_job(
+    proposition_id: int,
+    job_repo: NewsJobRepository = Depends(get_job_repo)
+):
+    """
+    Get the background generation job for a proposition.
+    
+    Args:
+        proposition_id: ID of the proposition (from BigQuery)
+        
+    Returns:
+        Job status, attempts and last error
     """
-    logger.info(f"Queuing {len(propositions)} propositions for background processing")
+    job = await job_repo.get_by_proposition_id(proposition_id)
     
-    async def process_task():
-        # Create new DB session for background task
-        from app.db.session import async_session_maker
-        async with async_session_maker() as session:
-            orchestrator = NewsOrchestratorService(session)
-            await orchestrator.batch_process(propositions, max_concurrent)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No job found for proposition {proposition_id}"
+        )
     
-    background_tasks.add_task(process_task)
+    return NewsJobResponse.model_validate(job)
+
+
+@router.post("/propositions/missing", response_model=MissingPropositionsResponse)
+async def get_missing_propositions(
+    request: PropositionIdsRequest,
+    news_repo: NewsRepository = Depends(get_news_repo)
+):
+    """
+    Check many propositions at once and return those without news.
+    
+    Args:
+        request: List of proposition IDs (from BigQuery)
+        
+    Returns:
+        Proposition IDs that haven't been processed yet
+    """
+    missing = await news_repo.get_missing_proposition_ids(request.proposition_ids)
     
-    return {
-        "message": f"Background processing started for {len(propositions)} propositions",
-        "status": "queued"
-    }
+    return MissingPropositionsResponse(
+        total=len(request.proposition_ids),
+        missing=missing
+    )
 
 
 @router.post("/generate/{proposition_id}", response_model=ProcessingResultResponse)
@@ -129,13 +291,17 @@ async def generate_news_for_proposition(
     if not result["success"]:
         raise HTTPException(status_code=500, detail=result.get("error", "Processing failed"))
     
+    await invalidate_responses(FEED_TAG, TOP_TAG)
     return result
 
 
 @router.get("", response_model=PaginatedNewsResponse)
 async def list_news(
+    request: Request,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None),
+    include_total: bool = Query(default=True),
     uf: Optional[str] = Query(default=None, max_length=2),
     news_type: Optional[str] = Query(default=None),
     keywords: Optional[str] = Query(default=None),
@@ -146,54 +312,93 @@ async def list_news(
     """
     List news with filters and pagination.
     
+    Every response carries `next_cursor`; passing it back as `cursor` fetches
+    the following page by keyset, which costs the same at any depth. Cursor
+    pages skip the count, so `total`/`pages` are only returned on the first
+    page (and can be skipped there too with include_total=false).
+    
+    Responses are cached for RESPONSE_CACHE_LIST_TTL_SECONDS (new and deleted
+    news invalidate them; vote counts may lag by up to the TTL) and carry an
+    ETag for If-None-Match revalidation.
+    
     Args:
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored when cursor is given)
         limit: Items per page (1-100)
+        cursor: Opaque cursor from a previous response's next_cursor
+        include_total: Count matching news (first page only)
         uf: Filter by UF (state)
         news_type: Filter by news type (PL, PEC, etc.)
-        keywords: Search in title/summary
-        order_by: Field to order by
+        keywords: Full-text search in title/tags/summary/content
+        order_by: Field to order by ("relevance" ranks keyword matches)
         order_direction: asc or desc
         
     Returns:
         Paginated news list
+
     """
-    result = await news_repo.list_all(
-        page=page,
-        limit=limit,
-        uf=uf,
-        news_type=news_type,
-        keywords=keywords,
-        order_by=order_by,
-        order_direction=order_direction
-    )
-    
-    # Unpack the tuple returned by list_all
-    news_list, total = result
-    
-    pages = (total + limit - 1) // limit if total > 0 else 1
-    
-    pagination = PaginationMetadata(
-        page=page,
-        limit=limit,
-        total=total,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
-    
-    # Convert to response models
-    items = [NewsListResponse.model_validate(news) for news in news_list]
-    
-    return PaginatedNewsResponse(
-        items=items,
-        pagination=pagination
-    )
+    ranked = order_by == "relevance" and bool(keywords)
+    if not ranked and order_by not in NewsRepository.SORTABLE_COLUMNS:
+        order_by = "created_at"
+    
+    after = None
+    if cursor:
+        if ranked:
+            raise HTTPException(status_code=400, detail="Cursor pagination is not available for relevance ordering")
+        try:
+            after = decode_cursor(cursor, order_by, order_direction)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    async def build() -> bytes:
+        news_list, total, has_next = await news_repo.list_all(
+            page=page,
+            limit=limit,
+            uf=uf,
+            news_type=news_type,
+            keywords=keywords,
+            order_by=order_by,
+            order_direction=order_direction,
+            after=after,
+            include_total=include_total and after is None
+        )
+        
+        pages = None
+        if total is not None:
+            pages = (total + limit - 1) // limit if total > 0 else 1
+        
+        next_cursor = None
+        if has_next and not ranked:
+            last = news_list[-1]
+            next_cursor = encode_cursor(order_by, order_direction, getattr(last, order_by), last.id)
+        
+        pagination = PaginationMetadata(
+            page=page if after is None else None,
+            limit=limit,
+            total=total,
+            pages=pages,
+            has_next=has_next,
+            has_prev=after is not None or page > 1,
+            next_cursor=next_cursor
+        )
+        
+        # Convert to response models
+        items = [NewsListResponse.from_row(row) for row in news_list]
+        
+        return PaginatedNewsResponse(
+            items=items,
+            pagination=pagination
+        ).model_dump_json().encode()
+    
+    # Same parameters in any order share one entry
+    key = "feed:" + "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    entry = await get_or_build(key, [FEED_TAG], config.response_cache_list_ttl_seconds, build)
+    return etag_response(request, entry.body, entry.etag)
 
 
 @router.get("/proposition/{proposition_id}", response_model=NewsResponse)
 async def get_news_by_proposition(
     proposition_id: int,
+    request: Request,
     news_repo: NewsRepository = Depends(get_news_repo)
 ):
     """
@@ -205,48 +410,72 @@ async def get_news_by_proposition(
     Returns:
         Full news details
     """
-    news = await news_repo.get_by_proposition_id(proposition_id)
     
-    if not news:
-        raise HTTPException(
-            status_code=404, 
-            detail=f"News not found for proposition {proposition_id}"
-        )
-    
-    return NewsResponse.model_validate(news)
+    async def build() -> bytes:
+        news_id = (await news_repo.get_ids_by_proposition_ids([proposition_id])).get(proposition_id)
+        if not news_id:
+            raise HTTPException(
+                status_code=404, 
+                detail=f"News not found for proposition {proposition_id}"
+            )
+        return str(news_id).encode()
+    
+    # proposition -> news id only changes when the news is deleted (which bumps the feed tag)
+    entry = await get_or_build(
+        f"proposition:{proposition_id}",
+        [FEED_TAG],
+        config.response_cache_detail_ttl_seconds,
+        build
+    )
+    return await news_detail_etag_response(UUID(entry.body.decode()), request, news_repo)
 
 
 @router.get("/{news_id}", response_model=NewsResponse)
 async def get_news_detail(
     news_id: UUID,
+    request: Request,
     news_repo: NewsRepository = Depends(get_news_repo)
 ):
     """
     Get detailed information about a specific news.
     
+    Cached until the news is voted on, published or deleted, with ETag
+    support for If-None-Match revalidation.
+    
     Args:
         news_id: UUID of the news
         
     Returns:
         Full news details
     """
-    news = await news_repo.get_by_id(news_id)
-    
-    if not news:
-        raise HTTPException(status_code=404, detail="News not found")
-    
-    return NewsResponse.model_validate(news)
+    return await news_detail_etag_response(news_id, request, news_repo)
+
+
+async def news_detail_etag_response(
+    news_id: UUID,
+    request: Request,
+    news_repo: NewsRepository
+) -> Response:
+    """Cached news detail plus buffered votes, as an ETag response"""
+    response = with_buffered_votes(await get_news_detail_response(news_id, news_repo), request)
+    body = response.model_dump_json().encode()
+    return etag_response(request, body, compute_etag(body))
 
 
 @router.patch("/{news_id}/vote", response_model=NewsResponse)
 async def vote_on_news(
     news_id: UUID,
     vote: VoteRequest,
+    request: Request,
     news_repo: NewsRepository = Depends(get_news_repo)
 ):
     """
     Vote on a news (upvote or downvote).
-    Auto-posts to Twitter/X when vote threshold is reached.
+    Queues a Twitter/X post in the social outbox when the vote threshold is
+    reached (published by the social dispatcher worker).
+    
+    Votes are buffered and written in batches (see VoteBufferService); the
+    response already includes the votes that are still buffered.
     
     Args:
         news_id: UUID of the news
@@ -255,70 +484,108 @@ async def vote_on_news(
     Returns:
         Updated news with new vote counts
     """
-    news = await news_repo.get_by_id(news_id)
-    
-    if not news:
-        raise HTTPException(status_code=404, detail="News not found")
-    
+    vote_buffer: Optional[VoteBufferService] = getattr(request.app.state, "vote_buffer", None)
     logger.info(f"Processing vote for news {news_id}: {vote.vote_type}")
-    updated_news = await news_repo.update_votes(news_id, vote.vote_type)
     
-    # Check if should post to Twitter
-    total_votes = updated_news.upvotes + updated_news.downvotes
-    threshold = config.twitter_vote_threshold
+    if vote_buffer is None:
+        updated_news = await news_repo.update_votes(
+            news_id,
+            vote.vote_type,
+            social_threshold=config.twitter_vote_threshold
+        )
+        if not updated_news:
+            raise HTTPException(status_code=404, detail="News not found")
+        
+        await invalidate_responses(news_tag(news_id), TOP_TAG)
+        return NewsResponse.model_validate(updated_news)
     
-    logger.info(f"Vote check - Total votes: {total_votes}, Threshold: {threshold}, Twitter URL: {updated_news.twitter_post_url}")
+    # Served from the response cache when possible (also checks the news exists)
+    news = await get_news_detail_response(news_id, news_repo)
     
-    if total_votes >= threshold and not updated_news.twitter_post_url:
-        logger.info(f"Attempting to post news {news_id} to Twitter...")
-        try:
-            twitter_service = TwitterService()
-            
-            if twitter_service.client:
-                twitter_url = twitter_service.post_news_to_twitter(updated_news)
-                
-                logger.info(f"Successfully posted to Twitter: {twitter_url}")
-                
-                # Update news with Twitter URL in the same session
-                updated_news.twitter_post_url = twitter_url
-                updated_news.published_to_social = True
-                updated_news.social_publish_date = datetime.utcnow()
-                updated_news.updated_at = datetime.utcnow()
-                
-                # Add footer to full_content
-                footer = f"\n\n---\n📱 Acompanhe a discussão no X: {twitter_url}"
-                updated_news.full_content = updated_news.full_content + footer
-                
-                await news_repo.session.commit()
-                await news_repo.session.refresh(updated_news)
-                
-                logger.info(f"News {news_id} updated with Twitter URL in database")
-            else:
-                logger.warning(f"Twitter client not initialized - skipping post for news {news_id}")
-        except Exception as e:
-            logger.error(f"Failed to post news {news_id} to Twitter: {e}", exc_info=True)
-            # Don't fail the vote if Twitter posting fails - continue normally
-    
-    return NewsResponse.model_validate(updated_news)
+    vote_buffer.add(news_id, vote.vote_type)
+    
+    return with_buffered_votes(news, request)
 
 
 @router.get("/top/engagement", response_model=list[NewsListResponse])
 async def get_top_engagement(
+    request: Request,
     limit: int = Query(default=10, ge=1, le=50),
     news_repo: NewsRepository = Depends(get_news_repo)
 ):
     """
     Get top news by engagement score.
     
+    Cached until votes are written (ETag support for If-None-Match).
+    
     Args:
         limit: Number of news to return (1-50)
         
     Returns:
         List of news ordered by engagement
     """
-    news_list = await news_repo.get_top_engagement(limit)
     
-    return [NewsListResponse.model_validate(news) for news in news_list]
+    async def build() -> bytes:
+        news_list = await news_repo.get_top_engagement(limit)
+        return news_list_adapter.dump_json([NewsListResponse.from_row(row) for row in news_list])
+    
+    entry = await get_or_build(f"top:{limit}", [TOP_TAG], config.response_cache_list_ttl_seconds, build)
+    return etag_response(request, entry.body, entry.etag)
+
+
+@router.get("/search/semantic", response_model=list[NewsListResponse])
+async def semantic_search(
+    q: str = Query(..., min_length=2, max_length=500),
+    limit: int = Query(default=10, ge=1, le=50),
+    news_repo: NewsRepository = Depends(get_news_repo),
+    services: ServiceContainer = Depends(get_services)
+):
+    """
+    Search news by meaning instead of exact words (pgvector).
+    
+    Args:
+        q: Free-text query
+        limit: Number of news to return (1-50)
+        
+    Returns:
+        News ordered by similarity to the query
+    """
+    embedding = await services.embedder.embed_query(q)
+    news_list = await news_repo.search_by_embedding(embedding, limit)
+    
+    return [NewsListResponse.from_row(row) for row in news_list]
+
+
+@router.get("/{news_id}/related", response_model=list[NewsListResponse])
+async def get_related_news(
+    news_id: UUID,
+    limit: int = Query(default=5, ge=1, le=20),
+    news_repo: NewsRepository = Depends(get_news_repo),
+    services: ServiceContainer = Depends(get_services)
+):
+    """
+    Get news similar to a given news.
+    
+    Args:
+        news_id: UUID of the news
+        limit: Number of news to return (1-20)
+        
+    Returns:
+        Most similar news, excluding the news itself
+    """
+    embedding = await news_repo.get_embedding(news_id)
+    
+    if embedding is None:
+        news = await news_repo.get_by_id(news_id)
+        if not news:
+            raise HTTPException(status_code=404, detail="News not found")
+        # Not embedded yet (backfill pending): embed on the fly
+        tags = (news.extra_metadata or {}).get("tags")
+        embedding = await services.embedder.embed_query(news_embedding_text(news.title, news.summary, tags))
+    
+    news_list = await news_repo.search_by_embedding(embedding, limit, exclude_id=news_id)
+    
+    return [NewsListResponse.from_row(row) for row in news_list]
 
 
 @router.post("/{news_id}/check-social-publish", response_model=SocialPublishCheckResponse)
@@ -348,6 +615,7 @@ async def check_social_publish(
     
     if should_publish:
         await news_repo.mark_published_to_social(news_id)
+        await invalidate_responses(FEED_TAG, TOP_TAG, news_tag(news_id))
         message = f"News marked for social publishing (engagement: {news.engagement_score})"
     elif news.published_to_social:
         message = f"Already published on {news.social_publish_date}"
@@ -382,5 +650,6 @@ async def delete_news(
         raise HTTPException(status_code=404, detail="News not found")
     
     await news_repo.delete(news_id)
+    await invalidate_responses(FEED_TAG, TOP_TAG, news_tag(news_id))
     
     return {"message": "News deleted successfully", "id": str(news_id)}
@@ -1,13 +1,34 @@
 from typing import Optional, List
+import asyncio
 from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import config
+from app.db.session import get_db
 from app.models.proposition import Proposition
+from app.repositories.proposition_repository import PropositionRepository
 from app.services.proposition_service import PropositionService
+from app.services.proposition_export_service import iter_ndjson, run_export_query
+from app.services.proposition_source import PropositionSource
 
 router = APIRouter()
 
 def get_proposition_service() -> PropositionService:
     return PropositionService()
 
+async def get_proposition_repo(db: AsyncSession = Depends(get_db)) -> PropositionRepository:
+    return PropositionRepository(db)
+
+# Set once the local mirror has a sync watermark (it is never removed afterwards)
+_mirror_synced = False
+
+async def mirror_synced(proposition_repo: PropositionRepository) -> bool:
+    """Whether app.workers.proposition_sync has filled the local mirror at least once"""
+    global _mirror_synced
+    if not _mirror_synced:
+        _mirror_synced = await proposition_repo.get_watermark(PropositionSource.name) is not None
+    return _mirror_synced
+
 @router.get("/propositions", response_model=List[Proposition])
 async def get_propositions(
     keywords: Optional[str] = Query(None, description="Keywords to filter by"),
@@ -15,10 +36,22 @@ async def get_propositions(
     type: Optional[str] = Query(None, description="Proposition type to filter by"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     perPage: int = Query(20, ge=1, description="Number of items per page"),
-    service: PropositionService = Depends(get_proposition_service)
+    service: PropositionService = Depends(get_proposition_service),
+    proposition_repo: PropositionRepository = Depends(get_proposition_repo)
 ):
+    # Local mirror kept up to date by app.workers.proposition_sync (BigQuery until its first run)
+    if config.proposition_listing_source == "local" and await mirror_synced(proposition_repo):
+        propositions = await proposition_repo.list_filtered(
+            keywords=keywords, uf=uf, sigla=type, page=page, limit=perPage
+        )
+        return [proposition.to_payload() for proposition in propositions]
+
     try:
-        return service.list_propositions(keywords=keywords, uf=uf, type=type, page=page, per_page=perPage)
+        # BigQuery client is blocking, keep it off the event loop
+        return await asyncio.to_thread(
+            service.list_propositions,
+            keywords=keywords, uf=uf, type=type, page=page, per_page=perPage
+        )
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except ValueError as e:
@@ -26,3 +59,30 @@ async def get_propositions(
     except Exception as e:
         print(f"Error executing query: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/propositions/export")
+async def export_propositions(
+    from_year: Optional[int] = Query(None, description="First presentation year (inclusive)"),
+    to_year: Optional[int] = Query(None, description="Last presentation year (inclusive)")
+):
+    """
+    Stream every proposition from BigQuery as NDJSON (one JSON object per line).
+
+    Rows are fetched and written one result page at a time, so memory stays
+    constant whatever the export size. For Parquet use the CLI:
+    python -m app.workers.proposition_export --format parquet
+    """
+    # Run the query before streaming, so its errors are a 500 instead of a truncated download
+    try:
+        rows = await asyncio.to_thread(run_export_query, from_year, to_year)
+    except Exception as e:
+        print(f"Error executing export query: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # StreamingResponse iterates the (blocking) generator in a worker thread
+    return StreamingResponse(
+        iter_ndjson(rows),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="propositions.ndjson"'}
+    )
@@ -19,6 +19,94 @@ class Config(BaseSettings):
     twitter_bearer_token: str = Field(default="")
     twitter_vote_threshold: int = Field(default=10)
 
+    # Votes are buffered in memory and flushed in batches every N ms (0 = write each vote)
+    vote_buffer_flush_ms: int = Field(default=200)
+
+    # Response cache for hot read endpoints ("memory" per process, "redis" shared, or "off")
+    response_cache_backend: str = Field(default="memory")
+    response_cache_redis_url: str = Field(default="redis://localhost:6379/0")
+    response_cache_max_entries: int = Field(default=10000)
+    response_cache_list_ttl_seconds: float = Field(default=10.0)
+    response_cache_detail_ttl_seconds: float = Field(default=60.0)
+
+    # GET /propositions source: "bigquery" (live query) or "local" (propositions table, filled by
+    # app.workers.proposition_sync; BigQuery is still used until the first sync has run)
+    proposition_listing_source: str = Field(default="bigquery")
+
+    # BigQuery proposition listing results cache (0 TTL disables it)
+    proposition_cache_ttl_seconds: float = Field(default=600.0)
+    proposition_cache_max_entries: int = Field(default=1000)
+
+    # Rows per BigQuery result page in streaming exports (bounds the export memory)
+    proposition_export_page_size: int = Field(default=10000)
+
+    # Incremental proposition sync into the local propositions table
+    # ("bigquery", or "fixture" to read PROPOSITION_FIXTURE_PATH, a JSON/NDJSON file)
+    proposition_source: str = Field(default="bigquery")
+    proposition_fixture_path: str = Field(default="")
+    proposition_sync_batch_size: int = Field(default=500)
+    proposition_sync_start_date: str = Field(default="2025-01-01")
+    # Seconds between runs of the sync worker (0 = run once and exit)
+    proposition_sync_interval_seconds: float = Field(default=0.0)
+
+    # Social outbox dispatcher (posts news that crossed the vote threshold)
+    social_outbox_batch_size: int = Field(default=10)
+    social_outbox_poll_interval_seconds: float = Field(default=2.0)
+    social_outbox_max_attempts: int = Field(default=5)
+    social_outbox_backoff_base_seconds: float = Field(default=30.0)
+    social_outbox_backoff_max_seconds: float = Field(default=1800.0)
+
+    # News generation job queue
+    news_job_max_attempts: int = Field(default=5)
+    news_job_backoff_base_seconds: float = Field(default=30.0)
+    news_job_backoff_max_seconds: float = Field(default=3600.0)
+    news_job_lock_timeout_seconds: int = Field(default=900)
+    news_worker_concurrency: int = Field(default=3)
+    news_worker_poll_interval_seconds: float = Field(default=5.0)
+
+    # Batch pipeline (workers per stage; LLM concurrency is the batch max_concurrent)
+    pipeline_download_workers: int = Field(default=4)
+    pipeline_extract_workers: int = Field(default=2)
+    pipeline_upload_workers: int = Field(default=4)
+    pipeline_persist_batch_size: int = Field(default=20)
+    pipeline_persist_flush_seconds: float = Field(default=0.5)
+    pipeline_queue_size: int = Field(default=10)
+
+    # PDF downloads (shared HTTP/2 client)
+    pdf_download_max_bytes: int = Field(default=50 * 1024 * 1024)
+    pdf_download_max_retries: int = Field(default=3)
+    pdf_download_backoff_base_seconds: float = Field(default=1.0)
+    pdf_download_backoff_max_seconds: float = Field(default=30.0)
+    pdf_download_max_connections: int = Field(default=20)
+    pdf_download_max_connections_per_host: int = Field(default=6)
+
+    # On-disk cache for downloaded PDFs and extracted text (empty dir or 0 bytes disables it)
+    pdf_cache_dir: str = Field(default=".cache/pdfs")
+    pdf_cache_max_bytes: int = Field(default=2 * 1024 * 1024 * 1024)
+
+    # PDF storage backend ("supabase" or "local" for development/tests)
+    storage_backend: str = Field(default="supabase")
+    storage_local_dir: str = Field(default=".storage")
+    storage_local_base_url: str = Field(default="")
+    storage_multipart_threshold_bytes: int = Field(default=20 * 1024 * 1024)
+    storage_max_connections: int = Field(default=10)
+
+    # PDF text extraction (process pool; 0 workers = one per CPU, 0 pages = no cap)
+    pdf_extract_workers: int = Field(default=2)
+    pdf_extract_timeout_seconds: float = Field(default=120.0)
+    pdf_extract_max_pages: int = Field(default=200)
+
+    # News generation input (documents above the direct limit are chunked and summarized first)
+    news_direct_max_tokens: int = Field(default=6000)
+    news_chunk_max_tokens: int = Field(default=3000)
+    news_document_token_budget: int = Field(default=60000)
+    news_map_concurrency: int = Field(default=4)
+
+    # News embeddings for semantic search ("openai" or "hash", a deterministic local embedder)
+    embedding_backend: str = Field(default="openai")
+    embedding_model: str = Field(default="text-embedding-3-small")
+    embedding_batch_size: int = Field(default=64)
+
     @property
     def db_url(self):
         return f"sqlite:///./{self.db_name}"
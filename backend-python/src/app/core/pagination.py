@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+
+def encode_cursor(order_by: str, order_direction: str, value: Any, row_id: UUID) -> str:
+    """
+    Opaque keyset cursor pointing right after a row.
+
+    Args:
+        order_by: Column the listing is sorted by
+        order_direction: asc or desc
+        value: The row's value for order_by
+        row_id: The row's id (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    elif isinstance(value, date):
+        value = {"d": value.isoformat()}
+    payload = json.dumps([order_by, order_direction, value, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, order_direction: str) -> Tuple[Any, UUID]:
+    """
+    Decode a cursor created by encode_cursor for the same ordering.
+
+    Returns:
+        (value, row_id) of the last row already returned
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_order_by, cursor_direction, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"]) if "dt" in value else date.fromisoformat(value["d"])
+        row_id = UUID(row_id)
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if (cursor_order_by, cursor_direction) != (order_by, order_direction):
+        raise ValueError("Cursor does not match the requested ordering")
+    return value, row_id
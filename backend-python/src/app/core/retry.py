@@ -0,0 +1,17 @@
+import random
+
+
+def compute_backoff(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """
+    Exponential backoff with jitter for a failed attempt.
+
+    Args:
+        attempt: Number of attempts already made (1-indexed)
+        base_seconds: Delay after the first failure
+        max_seconds: Upper bound for the delay
+
+    Returns:
+        Delay in seconds before the next attempt
+    """
+    delay = min(max_seconds, base_seconds * (2 ** max(attempt - 1, 0)))
+    return delay / 2 + random.uniform(0, delay / 2)
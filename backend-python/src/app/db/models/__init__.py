@@ -1,5 +1,9 @@
 """Database models package"""
 
 from app.db.models.news import News
+from app.db.models.news_job import NewsJob, NewsJobStatus
+from app.db.models.social_outbox import SocialOutbox, SocialOutboxStatus
+from app.db.models.proposition import Proposition, PropositionAuthor
+from app.db.models.sync_watermark import SyncWatermark
 
-__all__ = ["News"]
+__all__ = ["News", "NewsJob", "NewsJobStatus", "SocialOutbox", "SocialOutboxStatus", "Proposition", "PropositionAuthor", "SyncWatermark"]
@@ -1,12 +1,29 @@
 """News SQLAlchemy model for storing AI-generated news articles from propositions"""
 
-from sqlalchemy import Column, String, Text, Integer, Date, Boolean, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Integer, Date, Boolean, DateTime, JSON, Computed, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import deferred
+from pgvector.sqlalchemy import Vector
 from datetime import datetime
 import uuid
 from app.db.schema import Base
 
 
+# Size of the news embedding vectors (text-embedding-3-small)
+EMBEDDING_DIMENSIONS = 1536
+
+# Text search configuration used for the search_vector column and queries
+SEARCH_CONFIG = "portuguese"
+
+# Weighted document: title (A), tags (B), summary (C), full content (D)
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('portuguese', coalesce((extra_metadata -> 'tags')::text, '')), 'B') || "
+    "setweight(to_tsvector('portuguese', coalesce(summary, '')), 'C') || "
+    "setweight(to_tsvector('portuguese', coalesce(full_content, '')), 'D')"
+)
+
+
 class News(Base):
     """
     Model for news articles generated from legislative propositions.
@@ -28,13 +45,13 @@ class News(Base):
     presentation_date = Column(Date, nullable=False)
     
     # Proposition author
-    uf_author = Column(String(2), nullable=True, index=True)
+    uf_author = Column(String(2), nullable=True)
     author_name = Column(String(100), nullable=True)
     party = Column(String(50), nullable=True)
     author_type = Column(String(50), nullable=True)
     
     # Classification
-    news_type = Column(String(10), nullable=False, index=True)  # PL, PEC, EMP, etc
+    news_type = Column(String(10), nullable=False)  # PL, PEC, EMP, etc
     original_ementa = Column(Text, nullable=False)
     
     # PDF storage
@@ -44,7 +61,7 @@ class News(Base):
     # Engagement and voting
     upvotes = Column(Integer, default=0, nullable=False)
     downvotes = Column(Integer, default=0, nullable=False)
-    engagement_score = Column(Integer, default=0, nullable=False, index=True)
+    engagement_score = Column(Integer, default=0, nullable=False)
     
     # Social media publication
     published_to_social = Column(Boolean, default=False, nullable=False)
@@ -58,5 +75,33 @@ class News(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    # Full-text search (Portuguese), maintained by PostgreSQL and indexed with GIN.
+    # Deferred so list queries don't load it.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True
+    ))
+    
+    # Semantic search embedding of title/summary/tags (pgvector, HNSW index)
+    embedding = deferred(Column(Vector(EMBEDDING_DIMENSIONS), nullable=True))
+    
+    __table_args__ = (
+        # Listing: filter + ORDER BY created_at DESC, id DESC (also serves keyset cursors)
+        Index("ix_news_created_at_id", created_at.desc(), id.desc()),
+        Index("ix_news_uf_author_created_at_id", uf_author, created_at.desc(), id.desc()),
+        Index("ix_news_news_type_created_at_id", news_type, created_at.desc(), id.desc()),
+        # /top/engagement
+        Index("ix_news_engagement_score_id", engagement_score.desc(), id.desc()),
+        Index("ix_news_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_news_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"}
+        ),
+    )
+    
     def __repr__(self):
         return f"<News(id={self.id}, title='{self.title[:50]}...', proposition_id={self.proposition_id})>"
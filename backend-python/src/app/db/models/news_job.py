@@ -0,0 +1,54 @@
+"""NewsJob SQLAlchemy model for the durable news generation queue"""
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+from app.db.schema import Base
+
+
+class NewsJobStatus:
+    """Possible states of a news generation job"""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class NewsJob(Base):
+    """
+    Queued request to generate news for a single proposition.
+    Jobs are idempotent per proposition_id and claimed by workers
+    with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+    __tablename__ = "news_jobs"
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Job payload (proposition data from BigQuery)
+    proposition_id = Column(Integer, nullable=False, unique=True, index=True)
+    payload = Column(JSON, nullable=False)
+
+    # Execution state
+    status = Column(String(20), nullable=False, default=NewsJobStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    next_run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Result
+    news_id = Column(UUID(as_uuid=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_news_jobs_status_next_run_at", "status", "next_run_at"),
+    )
+
+    def __repr__(self):
+        return f"<NewsJob(id={self.id}, proposition_id={self.proposition_id}, status='{self.status}')>"
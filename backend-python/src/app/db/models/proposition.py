@@ -0,0 +1,123 @@
+"""Proposition SQLAlchemy model - local copy of the BigQuery propositions"""
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db.schema import Base
+
+
+class Proposition(Base):
+    """
+    Proposition staged from BigQuery by the incremental sync
+    (app.workers.proposition_sync), one row per id_proposicao.
+    Column names follow the BigQuery dataset; the author columns hold the
+    primary author, all authors are in proposition_authors.
+    GET /propositions is served from this table.
+    """
+    __tablename__ = "propositions"
+
+    # Primary Key (id_proposicao from BigQuery)
+    id_proposicao = Column(Integer, primary_key=True, autoincrement=False)
+
+    sigla = Column(String(20), nullable=True)
+    numero = Column(Integer, nullable=True)
+    ano = Column(Integer, nullable=True)
+    ementa = Column(Text, nullable=True)
+    ementa_detalhada = Column(Text, nullable=True)
+    palavra_chave = Column(Text, nullable=True)
+    data_apresentacao = Column(DateTime, nullable=False)
+    url_teor_proposicao = Column(String(500), nullable=True)
+    url_principal = Column(String(500), nullable=True)
+    url_posterior = Column(String(500), nullable=True)
+
+    # Primary author
+    sigla_uf_autor = Column(String(2), nullable=True)
+    nome_autor = Column(String(200), nullable=True)
+    sigla_partido = Column(String(50), nullable=True)
+    tipo_autor = Column(String(100), nullable=True)
+
+    # Timestamps
+    synced_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # All authors, primary first (loaded with the proposition in one extra query)
+    authors = relationship(
+        "PropositionAuthor",
+        order_by="PropositionAuthor.position",
+        lazy="selectin",
+        passive_deletes=True
+    )
+
+    __table_args__ = (
+        # Same order as the sync watermark
+        Index("ix_propositions_data_apresentacao_id", data_apresentacao, id_proposicao),
+        # GET /propositions (ORDER BY ano DESC, optionally filtered by sigla)
+        Index("ix_propositions_ano_data_apresentacao_id", ano.desc(), data_apresentacao.desc(), id_proposicao.desc()),
+        Index("ix_propositions_sigla_ano_data_apresentacao_id", sigla, ano.desc(), data_apresentacao.desc(), id_proposicao.desc()),
+        # Substring keyword search (ILIKE '%...%'), requires pg_trgm
+        Index(
+            "ix_propositions_palavra_chave_trgm",
+            palavra_chave,
+            postgresql_using="gin",
+            postgresql_ops={"palavra_chave": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_propositions_ementa_trgm",
+            ementa,
+            postgresql_using="gin",
+            postgresql_ops={"ementa": "gin_trgm_ops"}
+        ),
+    )
+
+    def to_payload(self) -> dict:
+        """Proposition dict in the BigQuery row format expected by the news generator"""
+        return {
+            "id_proposicao": self.id_proposicao,
+            "sigla": self.sigla,
+            "numero": self.numero,
+            "ano": self.ano,
+            "ementa": self.ementa,
+            "ementa_detalhada": self.ementa_detalhada,
+            "palavra_chave": self.palavra_chave,
+            "dataApresentacao": self.data_apresentacao.isoformat(),
+            "url_teor_proposicao": self.url_teor_proposicao,
+            "url_principal": self.url_principal,
+            "url_posterior": self.url_posterior,
+            "sigla_uf_autor": self.sigla_uf_autor,
+            "nome_autor": self.nome_autor,
+            "sigla_partido": self.sigla_partido,
+            "tipo_autor": self.tipo_autor,
+            "autores": [
+                {
+                    "nome_autor": author.nome_autor,
+                    "sigla_uf_autor": author.sigla_uf_autor,
+                    "sigla_partido": author.sigla_partido,
+                    "tipo_autor": author.tipo_autor,
+                }
+                for author in self.authors
+            ],
+        }
+
+    def __repr__(self):
+        return f"<Proposition(id_proposicao={self.id_proposicao}, sigla='{self.sigla}', numero={self.numero}, ano={self.ano})>"
+
+
+class PropositionAuthor(Base):
+    """Author of a staged proposition (the BigQuery author JOIN, one row per author)"""
+    __tablename__ = "proposition_authors"
+
+    # Primary Key
+    id_proposicao = Column(Integer, ForeignKey("propositions.id_proposicao", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, primary_key=True, autoincrement=False)  # 0 = primary author
+
+    nome_autor = Column(String(200), nullable=True)
+    sigla_uf_autor = Column(String(2), nullable=True)
+    sigla_partido = Column(String(50), nullable=True)
+    tipo_autor = Column(String(100), nullable=True)
+
+    __table_args__ = (
+        # UF filter of GET /propositions (any author from the UF)
+        Index("ix_proposition_authors_sigla_uf_autor_id", sigla_uf_autor, id_proposicao),
+    )
+
+    def __repr__(self):
+        return f"<PropositionAuthor(id_proposicao={self.id_proposicao}, position={self.position}, nome_autor='{self.nome_autor}')>"
@@ -0,0 +1,52 @@
+"""SocialOutbox SQLAlchemy model for the transactional social media outbox"""
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+from app.db.schema import Base
+
+
+class SocialOutboxStatus:
+    """Possible states of a social media post"""
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class SocialOutbox(Base):
+    """
+    Pending social media post for a news, written in the same transaction as
+    the vote that crossed the threshold. Unique per news_id, so a news can
+    never be queued (or posted) twice.
+    """
+    __tablename__ = "social_outbox"
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    news_id = Column(UUID(as_uuid=True), nullable=False, unique=True, index=True)
+    channel = Column(String(20), nullable=False, default="twitter")
+
+    # Delivery state
+    status = Column(String(20), nullable=False, default=SocialOutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Result
+    post_url = Column(String(500), nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_social_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<SocialOutbox(id={self.id}, news_id={self.news_id}, status='{self.status}')>"
@@ -0,0 +1,24 @@
+"""SyncWatermark SQLAlchemy model for incremental ingestion"""
+
+from sqlalchemy import Column, String, Integer, DateTime
+from datetime import datetime
+from app.db.schema import Base
+
+
+class SyncWatermark(Base):
+    """
+    Position of an incremental sync: the (last_date, last_id) of the newest
+    row already staged. The next run only pulls rows after it.
+    """
+    __tablename__ = "sync_watermarks"
+
+    # Primary Key (name of the synced source, e.g. "propositions")
+    source = Column(String(50), primary_key=True)
+
+    last_date = Column(DateTime, nullable=False)
+    last_id = Column(Integer, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SyncWatermark(source='{self.source}', last_date={self.last_date}, last_id={self.last_id})>"
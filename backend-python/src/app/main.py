@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI
@@ -6,10 +7,34 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import propositions, news
 from app.core.config import config
 from app.core.logging import setup_logging
+from app.db.session import async_session_maker
+from app.services.container import ServiceContainer
+from app.services.proposition_service import close_bigquery_client
+from app.services.vote_buffer_service import VoteBufferService
 
 setup_logging()
 
-app = FastAPI(title=config.app_name)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the AI agent, storage and PDF clients once per process
+    app.state.services = ServiceContainer()
+    
+    # Write-behind vote aggregation (VOTE_BUFFER_FLUSH_MS=0 writes each vote directly)
+    app.state.vote_buffer = None
+    if config.vote_buffer_flush_ms > 0:
+        app.state.vote_buffer = VoteBufferService(async_session_maker)
+        await app.state.vote_buffer.start()
+    
+    yield
+    
+    if app.state.vote_buffer is not None:
+        await app.state.vote_buffer.stop()
+    await app.state.services.close()
+    close_bigquery_client()
+
+
+app = FastAPI(title=config.app_name, lifespan=lifespan)
 
 # Configuração de CORS
 app.add_middleware(
@@ -72,3 +72,30 @@ REQUISITOS DO CONTEÚDO:
 
 Gere a notícia completa em formato estruturado.
 """
+
+SECTION_SYSTEM_PROMPT = """
+Você é um analista legislativo. Você recebe trechos de uma proposição legislativa longa e
+resume cada trecho de forma fiel e objetiva, para que um jornalista escreva depois uma
+matéria sobre o documento inteiro.
+
+REGRAS IMPORTANTES:
+- Preserve números de artigos, valores, prazos, percentuais e grupos afetados
+- Não invente informações que não estejam no trecho
+- Não escreva a matéria: apenas resuma o conteúdo
+"""
+
+SECTION_SUMMARY_PROMPT = """
+Resuma a parte {part} de {total_parts} da proposição {proposition_number}.
+
+Ementa oficial: {ementa}
+
+TRECHO:
+{section_text}
+
+Escreva um resumo de até {max_words} palavras com o que este trecho estabelece ou altera,
+quem é afetado e os detalhes concretos (artigos, valores, prazos).
+"""
+
+SUMMARIZED_DOCUMENT_HEADER = """
+(Documento longo: abaixo estão os resumos de cada parte, na ordem do documento original.)
+"""
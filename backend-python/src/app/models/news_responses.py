@@ -38,6 +38,12 @@ class NewsListResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_row(cls, row) -> "NewsListResponse":
+        """Build from a projected DB row (values come typed from the DB, so validation is skipped)"""
+        mapping = row._mapping
+        return cls.model_construct(**{name: mapping[name] for name in cls.model_fields})
 
 
 class NewsResponse(BaseModel):
@@ -72,13 +78,14 @@ class NewsResponse(BaseModel):
 
 
 class PaginationMetadata(BaseModel):
-    """Pagination information"""
-    page: int
+    """Pagination information (page, total and pages are omitted on cursor pages)"""
+    page: Optional[int] = None
     limit: int
-    total: int
-    pages: int
+    total: Optional[int] = None
+    pages: Optional[int] = None
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 
 class PaginatedNewsResponse(BaseModel):
@@ -92,6 +99,17 @@ class VoteRequest(BaseModel):
     vote_type: str = Field(..., pattern="^(upvote|downvote)$")
 
 
+class PropositionIdsRequest(BaseModel):
+    """Request model for bulk proposition lookups"""
+    proposition_ids: list[int] = Field(..., max_length=1000)
+
+
+class MissingPropositionsResponse(BaseModel):
+    """Proposition IDs that don't have news yet"""
+    total: int
+    missing: list[int]
+
+
 class ProcessingResultResponse(BaseModel):
     """Result of news generation processing"""
     success: bool
@@ -110,6 +128,31 @@ class BatchProcessingResponse(BaseModel):
     results: list[ProcessingResultResponse]
 
 
+class JobEnqueueResponse(BaseModel):
+    """Result of enqueuing propositions for background generation"""
+    message: str
+    status: str
+    enqueued: int
+    skipped: int
+
+
+class NewsJobResponse(BaseModel):
+    """State of a queued news generation job"""
+    id: UUID
+    proposition_id: int
+    status: str
+    attempts: int
+    max_attempts: int
+    next_run_at: datetime
+    last_error: Optional[str] = None
+    news_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
 class SocialPublishCheckResponse(BaseModel):
     """Response for social media publish check"""
     should_publish: bool
@@ -1,6 +1,12 @@
 from pydantic import BaseModel
 from typing import Optional
 
+class PropositionAuthor(BaseModel):
+    nome_autor: Optional[str] = None
+    sigla_uf_autor: Optional[str] = None
+    sigla_partido: Optional[str] = None
+    tipo_autor: Optional[str] = None
+
 class Proposition(BaseModel):
     id_proposicao: Optional[int] = None
     sigla: Optional[str] = None
@@ -17,3 +23,5 @@ class Proposition(BaseModel):
     nome_autor: Optional[str] = None
     sigla_partido: Optional[str] = None
     tipo_autor: Optional[str] = None
+    # All authors; the flat author fields above hold the primary (first) one
+    autores: list[PropositionAuthor] = []
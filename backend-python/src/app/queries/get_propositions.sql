@@ -1,3 +1,17 @@
+-- One row per proposition: authors are aggregated before the JOIN, so
+-- co-authored propositions are not repeated once per author. The primary
+-- author (first of `autores`, same ordering as group_authors in
+-- proposition_source.py) fills the flat author columns.
+WITH autores AS (
+  SELECT
+    id_proposicao,
+    ARRAY_AGG(
+      STRUCT(nome_autor, sigla_uf_autor, sigla_partido, tipo_autor)
+      ORDER BY nome_autor, sigla_partido, sigla_uf_autor, tipo_autor
+    ) AS autores
+  FROM basedosdados.br_camara_dados_abertos.proposicao_autor
+  GROUP BY id_proposicao
+)
 SELECT 
   prop.id_proposicao ,
   prop.sigla,
@@ -10,10 +24,11 @@ SELECT
   prop.url_teor_proposicao,
   prop.url_principal,
   prop.url_posterior,
-  autor.sigla_uf_autor,
-  autor.nome_autor,
-  autor.sigla_partido,
-  autor.tipo_autor
+  autor.autores[SAFE_OFFSET(0)].sigla_uf_autor AS sigla_uf_autor,
+  autor.autores[SAFE_OFFSET(0)].nome_autor AS nome_autor,
+  autor.autores[SAFE_OFFSET(0)].sigla_partido AS sigla_partido,
+  autor.autores[SAFE_OFFSET(0)].tipo_autor AS tipo_autor,
+  autor.autores
 FROM basedosdados.br_camara_dados_abertos.proposicao_microdados prop
-join basedosdados.br_camara_dados_abertos.proposicao_autor autor on prop.id_proposicao = autor.id_proposicao
+join autores autor on prop.id_proposicao = autor.id_proposicao
 WHERE 1=1
@@ -0,0 +1,40 @@
+-- One row per proposition (authors aggregated as in get_propositions.sql),
+-- so LIMIT never splits a proposition's authors across batches.
+WITH autores AS (
+  SELECT
+    id_proposicao,
+    ARRAY_AGG(
+      STRUCT(nome_autor, sigla_uf_autor, sigla_partido, tipo_autor)
+      ORDER BY nome_autor, sigla_partido, sigla_uf_autor, tipo_autor
+    ) AS autores
+  FROM basedosdados.br_camara_dados_abertos.proposicao_autor
+  GROUP BY id_proposicao
+)
+SELECT *
+FROM (
+  SELECT 
+    prop.id_proposicao ,
+    prop.sigla,
+    prop.numero,
+    prop.ano,
+    prop.ementa,
+    prop.ementa_detalhada,
+    prop.palavra_chave,
+    DATETIME(prop.data, COALESCE(prop.horario, TIME '00:00:00')) AS dataApresentacao,
+    prop.url_teor_proposicao,
+    prop.url_principal,
+    prop.url_posterior,
+    autor.autores[SAFE_OFFSET(0)].sigla_uf_autor AS sigla_uf_autor,
+    autor.autores[SAFE_OFFSET(0)].nome_autor AS nome_autor,
+    autor.autores[SAFE_OFFSET(0)].sigla_partido AS sigla_partido,
+    autor.autores[SAFE_OFFSET(0)].tipo_autor AS tipo_autor,
+    autor.autores
+  FROM basedosdados.br_camara_dados_abertos.proposicao_microdados prop
+  join autores autor on prop.id_proposicao = autor.id_proposicao
+  -- Prunes the year partitions before the watermark
+  WHERE prop.ano >= EXTRACT(YEAR FROM @since_date)
+)
+WHERE dataApresentacao > @since_date
+   OR (dataApresentacao = @since_date AND id_proposicao > @since_id)
+ORDER BY dataApresentacao, id_proposicao
+LIMIT @limit
@@ -1,5 +1,8 @@
 """Repositories package"""
 
 from app.repositories.news_repository import NewsRepository
+from app.repositories.news_job_repository import NewsJobRepository
+from app.repositories.social_outbox_repository import SocialOutboxRepository
+from app.repositories.proposition_repository import PropositionRepository
 
-__all__ = ["NewsRepository"]
+__all__ = ["NewsRepository", "NewsJobRepository", "SocialOutboxRepository", "PropositionRepository"]
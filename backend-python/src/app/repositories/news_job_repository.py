@@ -0,0 +1,177 @@
+"""News job repository for the durable generation queue"""
+
+from sqlalchemy import select, update, or_, and_, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.news_job import NewsJob, NewsJobStatus
+from typing import Optional, List
+from uuid import UUID
+from datetime import datetime, timedelta
+
+
+class NewsJobRepository:
+    """Repository for enqueuing, claiming and finishing news generation jobs"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, propositions: List[dict], max_attempts: int) -> List[int]:
+        """
+        Enqueue one job per proposition.
+
+        Idempotent per proposition_id: pending, running and done jobs are left
+        untouched, failed jobs are reset so they can be retried.
+
+        Returns:
+            Proposition IDs that were (re)queued
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique_props = {prop["id_proposicao"]: prop for prop in propositions}
+
+        rows = [
+            {
+                "proposition_id": prop["id_proposicao"],
+                "payload": prop,
+                "status": NewsJobStatus.PENDING,
+                "attempts": 0,
+                "max_attempts": max_attempts,
+                "next_run_at": datetime.utcnow(),
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow(),
+            }
+            for prop in unique_props.values()
+        ]
+        if not rows:
+            return []
+
+        stmt = insert(NewsJob).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NewsJob.proposition_id],
+            set_={
+                "payload": stmt.excluded.payload,
+                "status": NewsJobStatus.PENDING,
+                "attempts": 0,
+                "max_attempts": stmt.excluded.max_attempts,
+                "next_run_at": stmt.excluded.next_run_at,
+                "last_error": None,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=NewsJob.status == NewsJobStatus.FAILED,
+        ).returning(NewsJob.proposition_id)
+
+        result = await self.session.execute(stmt)
+        queued = list(result.scalars().all())
+        await self.session.commit()
+        return queued
+
+    async def claim(
+        self,
+        worker_id: str,
+        limit: int,
+        lock_timeout_seconds: int
+    ) -> List[NewsJob]:
+        """
+        Claim up to `limit` runnable jobs for this worker.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers never
+        claim the same job. Running jobs whose lock expired (crashed worker)
+        are claimable again while they have attempts left; the ones that used
+        them all (e.g. a PDF that kills the worker every time) are failed.
+        """
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=lock_timeout_seconds)
+
+        # A worker that dies mid-job never reaches mark_failed
+        await self.session.execute(
+            update(NewsJob)
+            .where(
+                NewsJob.status == NewsJobStatus.RUNNING,
+                NewsJob.locked_at < stale_before,
+                NewsJob.attempts >= NewsJob.max_attempts
+            )
+            .values(
+                status=NewsJobStatus.FAILED,
+                locked_at=None,
+                locked_by=None,
+                last_error=func.concat(
+                    "Worker lock expired after ", NewsJob.attempts, " attempts (worker crashed or was killed)"
+                ),
+                updated_at=now
+            )
+        )
+
+        result = await self.session.execute(
+            select(NewsJob)
+            .where(
+                or_(
+                    and_(
+                        NewsJob.status == NewsJobStatus.PENDING,
+                        NewsJob.next_run_at <= now
+                    ),
+                    and_(
+                        NewsJob.status == NewsJobStatus.RUNNING,
+                        NewsJob.locked_at < stale_before,
+                        NewsJob.attempts < NewsJob.max_attempts
+                    )
+                )
+            )
+            .order_by(NewsJob.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = list(result.scalars().all())
+
+        for job in jobs:
+            job.status = NewsJobStatus.RUNNING
+            job.attempts += 1
+            job.locked_at = now
+            job.locked_by = worker_id
+            job.updated_at = now
+
+        await self.session.commit()
+        return jobs
+
+    async def mark_done(self, job_id: UUID, news_id: Optional[str]) -> None:
+        """Mark job as successfully processed"""
+        await self.session.execute(
+            update(NewsJob)
+            .where(NewsJob.id == job_id)
+            .values(
+                status=NewsJobStatus.DONE,
+                news_id=UUID(news_id) if news_id else None,
+                locked_at=None,
+                locked_by=None,
+                last_error=None,
+                updated_at=datetime.utcnow()
+            )
+        )
+        await self.session.commit()
+
+    async def mark_failed(self, job: NewsJob, error: str, retry_delay_seconds: float) -> None:
+        """
+        Record a failed attempt.
+
+        The job goes back to pending with a delayed next_run_at, or to failed
+        once max_attempts is reached.
+        """
+        exhausted = job.attempts >= job.max_attempts
+        await self.session.execute(
+            update(NewsJob)
+            .where(NewsJob.id == job.id)
+            .values(
+                status=NewsJobStatus.FAILED if exhausted else NewsJobStatus.PENDING,
+                next_run_at=datetime.utcnow() + timedelta(seconds=retry_delay_seconds),
+                locked_at=None,
+                locked_by=None,
+                last_error=error,
+                updated_at=datetime.utcnow()
+            )
+        )
+        await self.session.commit()
+
+    async def get_by_proposition_id(self, proposition_id: int) -> Optional[NewsJob]:
+        """Get job by proposition ID"""
+        result = await self.session.execute(
+            select(NewsJob).where(NewsJob.proposition_id == proposition_id)
+        )
+        return result.scalar_one_or_none()
@@ -1,10 +1,13 @@
 """News repository for database operations"""
 
-from sqlalchemy import select, delete, func, or_
+from sqlalchemy import Row, select, update, delete, func, any_, bindparam, values, column, tuple_, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.models.news import News
-from typing import Optional, List
-from uuid import UUID
+from app.db.models.news import News, SEARCH_CONFIG
+from app.repositories.social_outbox_repository import SocialOutboxRepository
+from typing import Any, Optional, List, Dict, Tuple
+from uuid import UUID, uuid4
 from datetime import datetime
 
 
@@ -18,10 +21,57 @@ class NewsRepository:
         """Create a new news article"""
         news = News(**news_data)
         self.session.add(news)
+        # All column defaults are client-side, so no refresh is needed after commit
         await self.session.commit()
-        await self.session.refresh(news)
         return news
     
+    async def bulk_create(self, news_items: List[dict]) -> Dict[int, UUID]:
+        """
+        Insert many news articles in a single statement.
+        
+        Uses INSERT ... ON CONFLICT (proposition_id) DO NOTHING, so propositions
+        that already have news are skipped instead of failing the whole batch.
+        
+        Returns:
+            Mapping of proposition_id -> news id for the rows actually inserted
+        """
+        if not news_items:
+            return {}
+        
+        now = datetime.utcnow()
+        rows = [
+            {"id": uuid4(), "created_at": now, "updated_at": now, **item}
+            for item in news_items
+        ]
+        
+        stmt = (
+            insert(News)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[News.proposition_id])
+            .returning(News.proposition_id, News.id)
+        )
+        result = await self.session.execute(stmt)
+        inserted = {proposition_id: news_id for proposition_id, news_id in result.all()}
+        await self.session.commit()
+        return inserted
+    
+    async def get_ids_by_proposition_ids(self, proposition_ids: List[int]) -> Dict[int, UUID]:
+        """Get news ids for the given proposition IDs (only those that have news), in one query"""
+        if not proposition_ids:
+            return {}
+        result = await self.session.execute(
+            select(News.proposition_id, News.id)
+            .where(News.proposition_id == any_(
+                bindparam("proposition_ids", list(set(proposition_ids)), type_=ARRAY(Integer))
+            ))
+        )
+        return {proposition_id: news_id for proposition_id, news_id in result.all()}
+    
+    async def get_missing_proposition_ids(self, proposition_ids: List[int]) -> List[int]:
+        """Return the proposition IDs that don't have news yet (input order preserved)"""
+        existing = await self.get_ids_by_proposition_ids(proposition_ids)
+        return [pid for pid in dict.fromkeys(proposition_ids) if pid not in existing]
+    
     async def get_by_id(self, news_id: UUID) -> Optional[News]:
         """Get news by ID"""
         result = await self.session.execute(
@@ -36,6 +86,20 @@ class NewsRepository:
         )
         return result.scalar_one_or_none()
     
+    # Columns loaded for list views (everything NewsListResponse needs, no large text/JSON)
+    LIST_COLUMNS = (
+        News.id, News.title, News.summary, News.proposition_number, News.proposition_id,
+        News.presentation_date, News.uf_author, News.author_name, News.party, News.author_type,
+        News.news_type, News.upvotes, News.downvotes, News.engagement_score,
+        News.published_to_social, News.twitter_post_url, News.created_at
+    )
+    
+    # Columns accepted by order_by (non-nullable, so keyset comparisons are well defined)
+    SORTABLE_COLUMNS = (
+        "created_at", "updated_at", "presentation_date", "engagement_score",
+        "upvotes", "downvotes", "title", "proposition_id"
+    )
+    
     async def list_all(
         self,
         page: int = 1,
@@ -44,71 +108,219 @@ class NewsRepository:
         news_type: Optional[str] = None,
         keywords: Optional[str] = None,
         order_by: str = "created_at",
-        order_direction: str = "desc"
-    ) -> tuple[List[News], int]:
-        """List news with filters and pagination"""
+        order_direction: str = "desc",
+        after: Optional[Tuple[Any, UUID]] = None,
+        include_total: bool = True
+    ) -> tuple[List[Row], Optional[int], bool]:
+        """
+        List news with filters and pagination.
         
-        query = select(News)
+        Only LIST_COLUMNS (plus the order_by column) are loaded, as plain rows
+        instead of ORM objects.
+        
+        With `after` (the order value and id of the last row already seen) the
+        page is fetched by keyset - WHERE (order_column, id) < (value, id) - so
+        deep pages cost the same as the first one; `page` is ignored then.
+        Otherwise OFFSET pagination is used.
+        
+        `keywords` is a Portuguese full-text query (websearch syntax: quoted
+        phrases, OR, -word) matched against the GIN-indexed search_vector.
+        order_by="relevance" ranks the matches (OFFSET pagination only).
+        
+        Returns:
+            (items, total, has_next); total is None when include_total is False
+        """
         
         # Apply filters
+        filters = []
         if uf:
-            query = query.where(News.uf_author == uf)
+            filters.append(News.uf_author == uf)
         
         if news_type:
-            query = query.where(News.news_type == news_type)
+            filters.append(News.news_type == news_type)
         
+        ts_query = None
         if keywords:
-            search_pattern = f"%{keywords}%"
-            query = query.where(
-                or_(
-                    News.title.ilike(search_pattern),
-                    News.summary.ilike(search_pattern)
-                )
-            )
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, keywords)
+            filters.append(News.search_vector.op("@@")(ts_query))
         
         # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar()
+        total = None
+        if include_total:
+            count_query = select(func.count()).select_from(News).where(*filters)
+            total_result = await self.session.execute(count_query)
+            total = total_result.scalar()
         
-        # Ordering
-        order_column = getattr(News, order_by, News.created_at)
+        # Ordering (id breaks ties so every row has a stable position)
+        columns = list(self.LIST_COLUMNS)
+        if order_by == "relevance" and ts_query is not None:
+            order_column = func.ts_rank_cd(News.search_vector, ts_query)
+        elif order_by in self.SORTABLE_COLUMNS:
+            order_column = getattr(News, order_by)
+            if order_column not in columns:
+                # Needed to build the next cursor
+                columns.append(order_column)
+        else:
+            order_column = News.created_at
+        
+        query = select(*columns).where(*filters)
         if order_direction == "desc":
-            query = query.order_by(order_column.desc())
+            query = query.order_by(order_column.desc(), News.id.desc())
         else:
-            query = query.order_by(order_column.asc())
+            query = query.order_by(order_column.asc(), News.id.asc())
         
-        # Pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        # Pagination (one extra row tells whether there is a next page)
+        if after is not None and order_by in self.SORTABLE_COLUMNS:
+            key = tuple_(order_column, News.id)
+            after_key = tuple_(*after)
+            query = query.where(key < after_key if order_direction == "desc" else key > after_key)
+        else:
+            query = query.offset((page - 1) * limit)
+        query = query.limit(limit + 1)
         
         result = await self.session.execute(query)
-        items = result.scalars().all()
+        items = list(result.all())
         
-        return list(items), total
+        return items[:limit], total, len(items) > limit
+    
+    async def search_by_embedding(
+        self,
+        embedding: List[float],
+        limit: int = 10,
+        exclude_id: Optional[UUID] = None
+    ) -> List[Row]:
+        """Nearest news by cosine distance (served by the HNSW index), LIST_COLUMNS only"""
+        query = select(*self.LIST_COLUMNS).where(News.embedding.is_not(None))
+        if exclude_id is not None:
+            query = query.where(News.id != exclude_id)
+        query = query.order_by(News.embedding.cosine_distance(embedding)).limit(limit)
+        
+        result = await self.session.execute(query)
+        return list(result.all())
+    
+    async def get_embedding(self, news_id: UUID) -> Optional[List[float]]:
+        """Stored embedding of a news (None if missing or not embedded yet)"""
+        result = await self.session.execute(
+            select(News.embedding).where(News.id == news_id)
+        )
+        embedding = result.scalar_one_or_none()
+        return None if embedding is None else list(embedding)
+    
+    async def list_without_embedding(self, limit: int = 100) -> List[Tuple[UUID, str, str, Optional[dict]]]:
+        """(id, title, summary, extra_metadata) of news that still need an embedding"""
+        result = await self.session.execute(
+            select(News.id, News.title, News.summary, News.extra_metadata)
+            .where(News.embedding.is_(None))
+            .order_by(News.created_at)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+    
+    async def set_embeddings(self, embeddings: Dict[UUID, List[float]]) -> None:
+        """Store many embeddings with one executemany UPDATE"""
+        if not embeddings:
+            return
+        await self.session.execute(
+            update(News),
+            [{"id": news_id, "embedding": embedding} for news_id, embedding in embeddings.items()]
+        )
+        await self.session.commit()
     
     async def update_votes(
         self,
         news_id: UUID,
-        vote_type: str
+        vote_type: str,
+        social_threshold: Optional[int] = None
     ) -> Optional[News]:
-        """Update votes and recalculate engagement score"""
-        news = await self.get_by_id(news_id)
-        if not news:
-            return None
+        """
+        Update votes and recalculate engagement score.
         
-        if vote_type == "upvote":
-            news.upvotes += 1
-        elif vote_type == "downvote":
-            news.downvotes += 1
+        Single atomic UPDATE ... RETURNING, so concurrent votes never lose
+        increments and each vote is one round trip. If this vote makes the
+        total cross social_threshold, a social post is queued in the outbox
+        within the same transaction.
+        """
+        upvote = 1 if vote_type == "upvote" else 0
+        downvote = 1 if vote_type == "downvote" else 0
         
-        news.engagement_score = news.upvotes - news.downvotes
-        news.updated_at = datetime.utcnow()
+        result = await self.session.execute(
+            update(News)
+            .where(News.id == news_id)
+            .values(
+                upvotes=News.upvotes + upvote,
+                downvotes=News.downvotes + downvote,
+                engagement_score=(News.upvotes + upvote) - (News.downvotes + downvote),
+                updated_at=datetime.utcnow()
+            )
+            .returning(News)
+            .execution_options(populate_existing=True)
+        )
+        news = result.scalar_one_or_none()
+        
+        if news and social_threshold is not None and not news.twitter_post_url:
+            total = news.upvotes + news.downvotes
+            if total - 1 < social_threshold <= total:
+                await SocialOutboxRepository(self.session).add([news.id])
         
         await self.session.commit()
-        await self.session.refresh(news)
         return news
     
+    async def apply_vote_deltas(
+        self,
+        deltas: Dict[UUID, Tuple[int, int]],
+        social_threshold: Optional[int] = None
+    ) -> List[Tuple[UUID, int, int, Optional[str]]]:
+        """
+        Apply buffered vote increments for many news in one statement.
+        
+        UPDATE news ... FROM (VALUES (id, up, down), ...) so a whole flush is a
+        single round trip and each row is locked once. News whose total votes
+        cross social_threshold in this update get a social post queued in the
+        outbox within the same transaction.
+        
+        Args:
+            deltas: news_id -> (upvotes, downvotes) to add
+            social_threshold: Total votes that trigger a social post
+            
+        Returns:
+            (id, upvotes, downvotes, twitter_post_url) for each updated row
+        """
+        if not deltas:
+            return []
+        
+        vote_values = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("up", Integer),
+            column("down", Integer),
+            name="vote_deltas"
+        ).data([(news_id, up, down) for news_id, (up, down) in deltas.items()])
+        
+        result = await self.session.execute(
+            update(News)
+            .where(News.id == vote_values.c.id)
+            .values(
+                upvotes=News.upvotes + vote_values.c.up,
+                downvotes=News.downvotes + vote_values.c.down,
+                engagement_score=(News.upvotes + vote_values.c.up) - (News.downvotes + vote_values.c.down),
+                updated_at=datetime.utcnow()
+            )
+            .returning(News.id, News.upvotes, News.downvotes, News.twitter_post_url)
+            .execution_options(synchronize_session=False)
+        )
+        rows = [tuple(row) for row in result.all()]
+        
+        if social_threshold is not None:
+            crossed = [
+                news_id
+                for news_id, upvotes, downvotes, twitter_post_url in rows
+                if not twitter_post_url
+                and upvotes + downvotes - sum(deltas[news_id]) < social_threshold <= upvotes + downvotes
+            ]
+            await SocialOutboxRepository(self.session).add(crossed)
+        
+        await self.session.commit()
+        return rows
+    
     async def mark_published_to_social(self, news_id: UUID) -> Optional[News]:
         """Mark news as published to social media"""
         news = await self.get_by_id(news_id)
@@ -123,14 +335,14 @@ class NewsRepository:
         await self.session.refresh(news)
         return news
     
-    async def get_top_engagement(self, limit: int = 10) -> List[News]:
-        """Get top news by engagement score"""
+    async def get_top_engagement(self, limit: int = 10) -> List[Row]:
+        """Get top news by engagement score (LIST_COLUMNS only)"""
         result = await self.session.execute(
-            select(News)
-            .order_by(News.engagement_score.desc())
+            select(*self.LIST_COLUMNS)
+            .order_by(News.engagement_score.desc(), News.id.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return list(result.all())
     
     async def delete(self, news_id: UUID) -> bool:
         """Delete news article"""
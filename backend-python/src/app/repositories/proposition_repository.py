@@ -0,0 +1,162 @@
+"""Proposition repository for the local propositions table and its sync watermark"""
+
+from sqlalchemy import select, delete, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.proposition import Proposition, PropositionAuthor
+from app.db.models.sync_watermark import SyncWatermark
+from app.services.proposition_source import AUTHOR_FIELDS, group_authors
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+
+# Columns copied as-is from the BigQuery rows
+PROPOSITION_FIELDS = [
+    "sigla", "numero", "ano", "ementa", "ementa_detalhada", "palavra_chave",
+    "url_teor_proposicao", "url_principal", "url_posterior",
+    *AUTHOR_FIELDS,
+]
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class PropositionRepository:
+    """Repository for staging synced propositions and listing them"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_watermark(self, source: str) -> Optional[Tuple[datetime, int]]:
+        """(last_date, last_id) of the newest staged row, or None before the first sync"""
+        result = await self.session.execute(
+            select(SyncWatermark.last_date, SyncWatermark.last_id)
+            .where(SyncWatermark.source == source)
+        )
+        row = result.first()
+        return (row.last_date, row.last_id) if row else None
+
+    async def stage(self, source: str, rows: List[Dict[str, Any]], watermark: Tuple[datetime, int]) -> None:
+        """
+        Upsert a batch of source rows and advance the watermark, in one transaction.
+
+        Rows are grouped per proposition first (group_authors), so fanned-out
+        author rows are merged; every distinct author is stored in
+        proposition_authors, primary author first.
+
+        A crash between batches resumes from the last committed batch; rows
+        are upserted, so re-reading part of a batch is harmless.
+        """
+        now = datetime.utcnow()
+        values: Dict[int, dict] = {}
+        authors: Dict[int, List[dict]] = {}
+        for row in group_authors(rows):
+            prop_id = row["id_proposicao"]
+            values[prop_id] = {
+                "id_proposicao": prop_id,
+                "data_apresentacao": row["dataApresentacao"],
+                **{field: row.get(field) for field in PROPOSITION_FIELDS},
+                "synced_at": now,
+            }
+            authors[prop_id] = row["autores"]
+
+        if values:
+            stmt = insert(Proposition).values(list(values.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Proposition.id_proposicao],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in ["data_apresentacao", *PROPOSITION_FIELDS, "synced_at"]
+                }
+            )
+            await self.session.execute(stmt)
+
+            # Replace the authors of the staged propositions
+            await self.session.execute(
+                delete(PropositionAuthor).where(PropositionAuthor.id_proposicao.in_(list(values)))
+            )
+            author_rows = [
+                {"id_proposicao": prop_id, "position": position, **author}
+                for prop_id, prop_authors in authors.items()
+                for position, author in enumerate(prop_authors)
+            ]
+            if author_rows:
+                await self.session.execute(insert(PropositionAuthor).values(author_rows))
+
+        last_date, last_id = watermark
+        stmt = insert(SyncWatermark).values(source=source, last_date=last_date, last_id=last_id, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SyncWatermark.source],
+            set_={"last_date": last_date, "last_id": last_id, "updated_at": now}
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def get_payloads(self, proposition_ids: List[int]) -> List[dict]:
+        """Staged propositions in the format expected by the news generator"""
+        if not proposition_ids:
+            return []
+        result = await self.session.execute(
+            select(Proposition)
+            .where(Proposition.id_proposicao.in_(proposition_ids))
+            .order_by(Proposition.data_apresentacao, Proposition.id_proposicao)
+        )
+        return [proposition.to_payload() for proposition in result.scalars().all()]
+
+    async def list_filtered(
+        self,
+        keywords: Optional[str] = None,
+        uf: Optional[str] = None,
+        sigla: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20
+    ) -> List[Proposition]:
+        """
+        Staged propositions, newest year first (GET /propositions).
+
+        Args:
+            keywords: Substring of palavra_chave or ementa (case-insensitive, trigram indexes)
+            uf: UF of any of the authors
+            sigla: Proposition type (PL, PEC, ...)
+            page: Page number (1-indexed)
+            limit: Items per page
+
+        Returns:
+            One Proposition per id_proposicao (author columns hold the primary author)
+        """
+        query = select(Proposition)
+
+        if keywords:
+            pattern = f"%{escape_like(keywords)}%"
+            query = query.where(or_(
+                Proposition.palavra_chave.ilike(pattern, escape="\\"),
+                Proposition.ementa.ilike(pattern, escape="\\")
+            ))
+
+        if uf:
+            query = query.where(
+                select(PropositionAuthor.id_proposicao)
+                .where(
+                    PropositionAuthor.id_proposicao == Proposition.id_proposicao,
+                    PropositionAuthor.sigla_uf_autor == uf
+                )
+                .exists()
+            )
+
+        if sigla:
+            query = query.where(Proposition.sigla == sigla)
+
+        query = (
+            query
+            .order_by(
+                Proposition.ano.desc(),
+                Proposition.data_apresentacao.desc(),
+                Proposition.id_proposicao.desc()
+            )
+            .offset((page - 1) * limit)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
@@ -0,0 +1,135 @@
+"""Social outbox repository for queued social media posts"""
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.news import News
+from app.db.models.social_outbox import SocialOutbox, SocialOutboxStatus
+from typing import List, Optional
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta
+
+
+class SocialOutboxRepository:
+    """Repository for writing and dispatching social media outbox entries"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, news_ids: List[UUID]) -> None:
+        """
+        Queue a post for each news (ignored if the news is already queued).
+
+        Does not commit: it joins the caller's transaction, so the entry is
+        stored atomically with the vote that crossed the threshold.
+        """
+        if not news_ids:
+            return
+        now = datetime.utcnow()
+        await self.session.execute(
+            insert(SocialOutbox)
+            .values([
+                {
+                    "id": uuid4(),
+                    "news_id": news_id,
+                    "channel": "twitter",
+                    "status": SocialOutboxStatus.PENDING,
+                    "attempts": 0,
+                    "next_attempt_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for news_id in dict.fromkeys(news_ids)
+            ])
+            .on_conflict_do_nothing(index_elements=[SocialOutbox.news_id])
+        )
+
+    async def claim(self, limit: int) -> List[SocialOutbox]:
+        """
+        Claim up to `limit` due entries with SELECT ... FOR UPDATE SKIP LOCKED.
+
+        Claimed entries move to sending. Entries left in sending by a crashed
+        dispatcher are not retried automatically: the post may already be
+        live, and posting twice is worse than not posting.
+        """
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            select(SocialOutbox)
+            .where(
+                SocialOutbox.status == SocialOutboxStatus.PENDING,
+                SocialOutbox.next_attempt_at <= now
+            )
+            .order_by(SocialOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        entries = list(result.scalars().all())
+
+        for entry in entries:
+            entry.status = SocialOutboxStatus.SENDING
+            entry.attempts += 1
+            entry.locked_at = now
+            entry.updated_at = now
+
+        await self.session.commit()
+        return entries
+
+    async def mark_sent(
+        self,
+        entry: SocialOutbox,
+        post_url: str,
+        content_footer: Optional[str] = None
+    ) -> None:
+        """
+        Close the entry and, in the same transaction, store the post URL on the
+        news with content_footer appended (pass None when the news already
+        has it).
+        """
+        now = datetime.utcnow()
+        if content_footer is not None:
+            await self.session.execute(
+                update(News)
+                .where(News.id == entry.news_id)
+                .values(
+                    twitter_post_url=post_url,
+                    published_to_social=True,
+                    social_publish_date=now,
+                    full_content=News.full_content + content_footer,
+                    updated_at=now
+                )
+            )
+        await self.session.execute(
+            update(SocialOutbox)
+            .where(SocialOutbox.id == entry.id)
+            .values(
+                status=SocialOutboxStatus.SENT,
+                post_url=post_url,
+                sent_at=now,
+                locked_at=None,
+                last_error=None,
+                updated_at=now
+            )
+        )
+        await self.session.commit()
+
+    async def mark_failed(
+        self,
+        entry: SocialOutbox,
+        error: str,
+        retry_delay_seconds: float,
+        max_attempts: int
+    ) -> None:
+        """Record a failed attempt (back to pending with a delay, or failed when exhausted)"""
+        exhausted = entry.attempts >= max_attempts
+        await self.session.execute(
+            update(SocialOutbox)
+            .where(SocialOutbox.id == entry.id)
+            .values(
+                status=SocialOutboxStatus.FAILED if exhausted else SocialOutboxStatus.PENDING,
+                next_attempt_at=datetime.utcnow() + timedelta(seconds=retry_delay_seconds),
+                locked_at=None,
+                last_error=error,
+                updated_at=datetime.utcnow()
+            )
+        )
+        await self.session.commit()
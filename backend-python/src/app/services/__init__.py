@@ -1,13 +1,25 @@
 """Services package"""
 
 from app.services.pdf_processor_service import PDFProcessorService
-from app.services.storage_service import StorageService
+from app.services.pdf_cache_service import PDFCacheService
+from app.services.storage_service import (
+    StorageService,
+    SupabaseStorageService,
+    LocalStorageService,
+    get_storage_service,
+)
 from app.services.ai_news_generator_service import AINewsGeneratorService
+from app.services.container import ServiceContainer
 from app.services.news_orchestrator_service import NewsOrchestratorService
 
 __all__ = [
     "PDFProcessorService",
+    "PDFCacheService",
     "StorageService",
+    "SupabaseStorageService",
+    "LocalStorageService",
+    "get_storage_service",
     "AINewsGeneratorService",
+    "ServiceContainer",
     "NewsOrchestratorService"
 ]
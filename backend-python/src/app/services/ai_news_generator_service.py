@@ -1,14 +1,30 @@
 """AI News Generator Service using Pydantic AI"""
 
 from pydantic_ai import Agent
+from pydantic_ai.models import Model
 from pydantic_ai.models.openai import OpenAIModel
 from pydantic import BaseModel, Field
-from typing import List, Literal
+from typing import List, Literal, Optional, Tuple
+import asyncio
 import logging
-from app.models.ai_prompts import SYSTEM_PROMPT, FULL_CONTENT_PROMPT
+from app.core.config import config
+from app.models.ai_prompts import (
+    SYSTEM_PROMPT,
+    FULL_CONTENT_PROMPT,
+    SECTION_SYSTEM_PROMPT,
+    SECTION_SUMMARY_PROMPT,
+    SUMMARIZED_DOCUMENT_HEADER
+)
+from app.services.document_chunker import count_tokens, split_legislative_text, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
+# Words per section summary (keeps the combined summaries within the direct limit)
+SECTION_SUMMARY_WORDS = 250
+
+# Reduce passes over the section summaries before falling back to truncation
+MAX_REDUCE_PASSES = 3
+
 
 class NewsOutput(BaseModel):
     """Output structure for AI-generated news"""
@@ -21,16 +37,40 @@ class NewsOutput(BaseModel):
 
 
 class AINewsGeneratorService:
-    """Service for generating news articles using Pydantic AI"""
-    
-    def __init__(self):
+    """
+    Service for generating news articles using Pydantic AI.
+
+    Documents up to direct_max_tokens go to the model as they are. Longer ones
+    are split into article-aware chunks (map: each chunk summarized
+    concurrently), and the news is written from the ordered summaries
+    (reduce). At most token_budget document tokens are read per proposition.
+    """
+
+    def __init__(
+        self,
+        model: Optional[Model] = None,
+        direct_max_tokens: int = config.news_direct_max_tokens,
+        chunk_max_tokens: int = config.news_chunk_max_tokens,
+        token_budget: int = config.news_document_token_budget,
+        map_concurrency: int = config.news_map_concurrency
+    ):
+        model = model or OpenAIModel('gpt-4o-mini')
         self.agent = Agent(
-            model=OpenAIModel('gpt-4o-mini'),
+            model=model,
             output_type=NewsOutput,
             system_prompt=SYSTEM_PROMPT,
             output_retries=3  # Allow 3 retries for validation
         )
-    
+        self.section_agent = Agent(
+            model=model,
+            output_type=str,
+            system_prompt=SECTION_SYSTEM_PROMPT
+        )
+        self.direct_max_tokens = direct_max_tokens
+        self.chunk_max_tokens = chunk_max_tokens
+        self.token_budget = token_budget
+        self.map_concurrency = map_concurrency
+
     async def generate_news(
         self,
         pdf_text: str,
@@ -38,39 +78,129 @@ class AINewsGeneratorService:
     ) -> NewsOutput:
         """
         Generate news article from proposition PDF text.
-        
+
         Args:
             pdf_text: Extracted text from PDF
             proposition_data: Dict with proposition metadata from BigQuery
-            
+
         Returns:
             NewsOutput with title, summary, full_content, tags, etc.
         """
         try:
-            # Limit text to avoid token limits
-            truncated_text = pdf_text[:8000] if len(pdf_text) > 8000 else pdf_text
-            
+            proposition_number = f"{proposition_data.get('sigla', '')} {proposition_data.get('numero', '')}/{proposition_data.get('ano', '')}"
+
+            # Fit the document to the prompt (summarizing long ones)
+            document_text = await self.prepare_document(pdf_text, proposition_number, proposition_data.get("ementa", ""))
+
             # Build prompt
             prompt = FULL_CONTENT_PROMPT.format(
-                document_text=truncated_text,
+                document_text=document_text,
                 proposition_type=proposition_data.get("sigla", ""),
-                proposition_number=f"{proposition_data.get('sigla', '')} {proposition_data.get('numero', '')}/{proposition_data.get('ano', '')}",
+                proposition_number=proposition_number,
                 author_name=proposition_data.get("nome_autor", ""),
                 party=proposition_data.get("sigla_partido", ""),
                 uf=proposition_data.get("sigla_uf_autor", ""),
                 presentation_date=proposition_data.get("dataApresentacao", ""),
                 ementa=proposition_data.get("ementa", "")
             )
-            
+
             logger.info(f"Generating news for proposition {proposition_data.get('id_proposicao')}")
-            
+
             # Generate with Pydantic AI
             result = await self.agent.run(prompt)
-            
+
             logger.info(f"News generated successfully: {result.output.title[:50]}...")
-            
+
             return result.output
-            
+
         except Exception as e:
             logger.error(f"Error generating news: {e}")
             raise
+
+    async def prepare_document(self, pdf_text: str, proposition_number: str, ementa: str) -> str:
+        """
+        Document text for the news prompt, within direct_max_tokens.
+
+        Args:
+            pdf_text: Extracted text from PDF
+            proposition_number: e.g. "PL 1234/2025" (context for the section prompts)
+            ementa: Official summary (context for the section prompts)
+
+        Returns:
+            The text itself if it fits, otherwise the ordered section summaries
+        """
+        # Tokenizing a whole PDF is CPU-bound, keep it off the event loop
+        total_tokens, chunks, kept, used = await asyncio.to_thread(self._select_chunks, pdf_text)
+        if not chunks:
+            return pdf_text
+
+        if len(kept) < len(chunks):
+            logger.warning(
+                f"{proposition_number}: token budget {self.token_budget} reached, "
+                f"summarizing {len(kept)}/{len(chunks)} chunks ({used}/{total_tokens} tokens)"
+            )
+        else:
+            logger.info(f"{proposition_number}: summarizing {len(kept)} chunks ({total_tokens} tokens)")
+
+        sections = await self._summarize_sections(kept, proposition_number, ementa)
+        document = self._join_sections(sections)
+
+        # Reduce: summarize groups of summaries until they fit the news prompt
+        passes = 0
+        while (
+            len(sections) > 1 and passes < MAX_REDUCE_PASSES
+            and await asyncio.to_thread(count_tokens, document) > self.direct_max_tokens
+        ):
+            groups = await asyncio.to_thread(split_legislative_text, "\n\n".join(sections), self.chunk_max_tokens)
+            sections = await self._summarize_sections(groups, proposition_number, ementa)
+            document = self._join_sections(sections)
+            passes += 1
+
+        return await asyncio.to_thread(truncate_to_tokens, document, self.direct_max_tokens)
+
+    def _select_chunks(self, pdf_text: str) -> Tuple[int, List[str], List[str], int]:
+        """
+        Split the document and apply the token budget (blocking).
+
+        Returns:
+            (document tokens, all chunks, chunks within the budget, tokens of
+            those chunks); no chunks if the document fits the direct limit
+        """
+        total_tokens = count_tokens(pdf_text)
+        if total_tokens <= self.direct_max_tokens:
+            return total_tokens, [], [], 0
+
+        chunks = split_legislative_text(pdf_text, self.chunk_max_tokens)
+
+        # Token budget per proposition: later chunks (usually annexes) are dropped
+        kept, used = [], 0
+        for chunk in chunks:
+            tokens = count_tokens(chunk)
+            if kept and used + tokens > self.token_budget:
+                break
+            kept.append(chunk)
+            used += tokens
+        return total_tokens, chunks, kept, used
+
+    async def _summarize_sections(self, chunks: List[str], proposition_number: str, ementa: str) -> List[str]:
+        """Summarize chunks concurrently (at most map_concurrency model calls), in order"""
+        semaphore = asyncio.Semaphore(max(1, self.map_concurrency))
+
+        async def summarize(index: int, chunk: str) -> str:
+            async with semaphore:
+                result = await self.section_agent.run(SECTION_SUMMARY_PROMPT.format(
+                    part=index + 1,
+                    total_parts=len(chunks),
+                    proposition_number=proposition_number,
+                    ementa=ementa,
+                    section_text=chunk,
+                    max_words=SECTION_SUMMARY_WORDS
+                ))
+                return result.output
+
+        return list(await asyncio.gather(*(summarize(i, chunk) for i, chunk in enumerate(chunks))))
+
+    @staticmethod
+    def _join_sections(sections: List[str]) -> str:
+        parts = [f"[Parte {i}/{len(sections)}]\n{section.strip()}" for i, section in enumerate(sections, 1)]
+        return SUMMARIZED_DOCUMENT_HEADER.strip() + "\n\n" + "\n\n".join(parts)
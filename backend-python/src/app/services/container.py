@@ -0,0 +1,39 @@
+"""Service container - process-wide services shared by requests and jobs"""
+
+from app.services.pdf_processor_service import (
+    PDFProcessorService,
+    close_http_client,
+    shutdown_extraction_pool
+)
+from app.services.pdf_cache_service import PDFCacheService
+from app.services.storage_service import StorageService, get_storage_service, close_storage_service
+from app.services.ai_news_generator_service import AINewsGeneratorService
+from app.services.embedding_service import EmbeddingService, get_embedding_service, close_embedding_service
+from app.services.response_cache_service import close_response_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """
+    Builds the stateless services once per process (AI agent, embedder,
+    storage backend, PDF processor and cache). Per-request state such as the AsyncSession is
+    passed in by the caller.
+    """
+
+    def __init__(self):
+        self.pdf_processor = PDFProcessorService()
+        self.pdf_cache = PDFCacheService()
+        self.storage: StorageService = get_storage_service()
+        self.ai_generator = AINewsGeneratorService()
+        self.embedder: EmbeddingService = get_embedding_service()
+        logger.info("Service container initialized")
+
+    async def close(self):
+        """Release the shared HTTP clients and the extraction process pool"""
+        await close_http_client()
+        await close_storage_service()
+        await close_embedding_service()
+        await close_response_cache()
+        shutdown_extraction_pool()
@@ -0,0 +1,120 @@
+"""Token-aware chunking of legislative documents for the news generator"""
+
+from functools import lru_cache
+from typing import List, Optional
+import logging
+import math
+import re
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Tokenizer of the gpt-4o family (used by the news generator)
+ENCODING_NAME = "o200k_base"
+
+# Estimate used when the tokenizer files cannot be loaded (tiktoken downloads them once)
+CHARS_PER_TOKEN = 4
+
+# Lines that open a structural unit of Brazilian legislative text
+STRUCTURE_BOUNDARY = re.compile(
+    r"^[ \t]*(?:"
+    r"LIVRO|T[ÍI]TULO|CAP[ÍI]TULO|SE[ÇC][ÃA]O|Se[çc][ãa]o|SUBSE[ÇC][ÃA]O|Subse[çc][ãa]o|ANEXO"
+    r"|Art\.?\s*\d|§\s*\d|Par[áa]grafo\s+[úu]nico"
+    r")",
+    re.MULTILINE
+)
+PARAGRAPH_BOUNDARY = re.compile(r"\n\s*\n")
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Optional[tiktoken.Encoding]:
+    try:
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:
+        logger.warning(f"Tokenizer {ENCODING_NAME} unavailable, estimating {CHARS_PER_TOKEN} chars per token: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of model tokens in text"""
+    encoding = _encoding()
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _token_windows(text: str, max_tokens: int) -> List[str]:
+    """Consecutive pieces of text of max_tokens tokens each"""
+    encoding = _encoding()
+    if encoding is None:
+        size = max_tokens * CHARS_PER_TOKEN
+        return [text[i:i + size] for i in range(0, len(text), size)]
+    tokens = encoding.encode(text, disallowed_special=())
+    return [encoding.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """First max_tokens tokens of text"""
+    if count_tokens(text) <= max_tokens:
+        return text
+    return _token_windows(text, max_tokens)[0]
+
+
+def _split_at(text: str, pattern: re.Pattern) -> List[str]:
+    """Split text before every match of pattern (the matched line starts the next part)"""
+    starts = [0] + [m.start() for m in pattern.finditer(text) if m.start() > 0]
+    return [part for part in (text[a:b] for a, b in zip(starts, starts[1:] + [len(text)])) if part.strip()]
+
+
+def _split_oversized(segment: str, max_tokens: int) -> List[str]:
+    """Break a segment longer than max_tokens by paragraphs, lines, then raw token windows"""
+    for pattern in (PARAGRAPH_BOUNDARY, re.compile(r"\n")):
+        parts = [part for part in pattern.split(segment) if part.strip()]
+        if len(parts) > 1:
+            return _pack(parts, max_tokens, separator="\n\n" if pattern is PARAGRAPH_BOUNDARY else "\n")
+
+    return _token_windows(segment, max_tokens)
+
+
+def _pack(segments: List[str], max_tokens: int, separator: str = "") -> List[str]:
+    """Greedily join consecutive segments into chunks of at most max_tokens"""
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    separator_tokens = count_tokens(separator)
+    for segment in segments:
+        tokens = count_tokens(segment) + separator_tokens
+        if tokens > max_tokens:
+            if current:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            chunks.extend(_split_oversized(segment, max_tokens))
+            continue
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(separator.join(current))
+            current, current_tokens = [], 0
+        current.append(segment)
+        current_tokens += tokens
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+def split_legislative_text(text: str, max_tokens: int) -> List[str]:
+    """
+    Split a legislative document into chunks of at most max_tokens tokens.
+
+    Chunks break before structural units (TÍTULO, CAPÍTULO, Seção, Art., §,
+    Parágrafo único, ANEXO), so an article is only split when it alone is
+    larger than max_tokens (then by paragraphs, lines and finally tokens).
+
+    Args:
+        text: Full document text
+        max_tokens: Token limit per chunk
+
+    Returns:
+        Chunks in document order
+    """
+    if not text.strip():
+        return []
+    return _pack(_split_at(text, STRUCTURE_BOUNDARY), max_tokens)
@@ -0,0 +1,130 @@
+"""Embedding Services for semantic search over news (OpenAI or deterministic local)"""
+
+from abc import ABC, abstractmethod
+from app.core.config import config
+from app.db.models.news import EMBEDDING_DIMENSIONS
+from openai import AsyncOpenAI
+from typing import List, Optional
+import hashlib
+import logging
+import math
+import re
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+
+def news_embedding_text(title: str, summary: str, tags: Optional[List[str]] = None) -> str:
+    """Text embedded for a news article (title, tags and summary)"""
+    parts = [title or ""]
+    if tags:
+        parts.append(", ".join(tags))
+    parts.append(summary or "")
+    return "\n".join(parts)
+
+
+class EmbeddingService(ABC):
+    """Turns texts into fixed-size vectors (EMBEDDING_DIMENSIONS)"""
+
+    dimensions = EMBEDDING_DIMENSIONS
+
+    @abstractmethod
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts, preserving order"""
+
+    async def embed_query(self, text: str) -> List[float]:
+        """Embed a search query"""
+        return (await self.embed_documents([text]))[0]
+
+    async def close(self):
+        """Release connections held by the backend"""
+
+
+class OpenAIEmbeddingService(EmbeddingService):
+    """OpenAI embeddings API, sending up to batch_size texts per request"""
+
+    # Keep inputs well below the model's token limit
+    MAX_INPUT_CHARS = 8000
+
+    def __init__(
+        self,
+        model: str = config.embedding_model,
+        batch_size: int = config.embedding_batch_size
+    ):
+        self.model = model
+        self.batch_size = batch_size
+        self._client: Optional[AsyncOpenAI] = None
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI()
+        return self._client
+
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = [text[:self.MAX_INPUT_CHARS] or " " for text in texts[start:start + self.batch_size]]
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=batch,
+                dimensions=self.dimensions
+            )
+            vectors.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+        logger.info(f"Embedded {len(texts)} texts with {self.model}")
+        return vectors
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class HashEmbeddingService(EmbeddingService):
+    """
+    Deterministic bag-of-words embedder (feature hashing), no network access.
+
+    Meant for tests and local development: texts sharing words end up close,
+    but there is no real semantic understanding.
+    """
+
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        normalized = unicodedata.normalize("NFKD", text.lower())
+        normalized = "".join(char for char in normalized if not unicodedata.combining(char))
+        for token in re.findall(r"\w+", normalized):
+            digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            vector[value % self.dimensions] += 1.0 if value >> 63 else -1.0
+
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            # pgvector can't compute cosine distance to a zero vector
+            vector[0] = 1.0
+            return vector
+        return [x / norm for x in vector]
+
+
+_embedder: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Process-wide embedder selected by EMBEDDING_BACKEND ("openai" or "hash")"""
+    global _embedder
+    if _embedder is None:
+        if config.embedding_backend == "hash":
+            _embedder = HashEmbeddingService()
+        else:
+            _embedder = OpenAIEmbeddingService()
+    return _embedder
+
+
+async def close_embedding_service():
+    """Close the shared embedder (call on application shutdown)"""
+    global _embedder
+    if _embedder is not None:
+        await _embedder.close()
+        _embedder = None
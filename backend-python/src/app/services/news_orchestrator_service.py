@@ -1,10 +1,13 @@
 """News Orchestrator Service - coordinates the entire news generation pipeline"""
 
-from app.services.pdf_processor_service import PDFProcessorService
-from app.services.storage_service import StorageService
-from app.services.ai_news_generator_service import AINewsGeneratorService
+from app.services.pdf_cache_service import PDFCacheService
+from app.services.ai_news_generator_service import NewsOutput
+from app.services.container import ServiceContainer
+from app.services.embedding_service import news_embedding_text
 from app.repositories.news_repository import NewsRepository
+from app.core.config import config
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable, Optional
 import asyncio
 import logging
 from datetime import datetime
@@ -15,10 +18,14 @@ logger = logging.getLogger(__name__)
 class NewsOrchestratorService:
     """Orchestrates the complete news generation pipeline"""
     
-    def __init__(self, db_session: AsyncSession):
-        self.pdf_processor = PDFProcessorService()
-        self.storage = StorageService()
-        self.ai_generator = AINewsGeneratorService()
+    def __init__(self, db_session: AsyncSession, services: Optional[ServiceContainer] = None):
+        # Reuse the process-wide services when given; building them is expensive
+        services = services or ServiceContainer()
+        self.pdf_processor = services.pdf_processor
+        self.pdf_cache = services.pdf_cache
+        self.storage = services.storage
+        self.ai_generator = services.ai_generator
+        self.embedder = services.embedder
         self.news_repo = NewsRepository(db_session)
         self.db_session = db_session
     
@@ -61,88 +68,37 @@ class NewsOrchestratorService:
             # 2. Download PDF
             print(f"[2/6] 📥 Downloading PDF from {proposition['url_teor_proposicao'][:50]}...")
             logger.info(f"Downloading PDF for proposition {prop_id}")
-            pdf_bytes = await self.pdf_processor.download_pdf(
-                proposition["url_teor_proposicao"]
-            )
+            pdf_bytes = await self._download(proposition)
             print(f"   ✓ PDF downloaded successfully ({len(pdf_bytes)} bytes)")
             
             # 3. Extract text
             print(f"[3/6] 📄 Extracting text from PDF...")
             logger.info(f"Extracting text from PDF {prop_id}")
-            extracted = await self.pdf_processor.extract_text(pdf_bytes)
+            extracted = await self._extract(pdf_bytes)
             print(f"   ✓ Extracted {extracted['metadata']['word_count']} words from {extracted['metadata']['pages']} pages")
             
             # 4. Upload to Supabase Storage
             print(f"[4/6] ☁️  Uploading PDF to Supabase Storage...")
             logger.info(f"Uploading PDF to Supabase {prop_id}")
-            filename = f"{proposition['sigla']}_{proposition['numero']}_{proposition['ano']}"
-            pdf_url = await self.storage.upload_pdf(
-                pdf_bytes,
-                proposition["id_proposicao"],
-                filename,
-                year=proposition.get("ano")
-            )
+            pdf_url = await self._upload(proposition, pdf_bytes)
             
             print(f"   ✓ PDF uploaded to: {pdf_url[:60]}...")
             
             # 5. Generate news with AI
             print(f"[5/6] 🤖 Generating news content with AI (this may take 20-30s)...")
             logger.info(f"Generating news content with AI {prop_id}")
-            news_content = await self.ai_generator.generate_news(
-                extracted["full_text"],
-                proposition
-            )
+            news_content = await self._generate(proposition, extracted)
             print(f"   ✓ AI generated: {news_content.title[:50]}...")
             
             # 6. Save to database
             print(f"[6/6] 💾 Saving news to database...")
             logger.info(f"Saving news to database {prop_id}")
             
-            # Parse presentation date
-            presentation_date = None
-            if proposition.get("dataApresentacao"):
-                try:
-                    presentation_date = datetime.fromisoformat(
-                        proposition["dataApresentacao"].replace("Z", "+00:00")
-                    ).date()
-                except:
-                    presentation_date = datetime.utcnow().date()
-            else:
-                presentation_date = datetime.utcnow().date()
-            
-            news_data = {
-                "title": news_content.title,
-                "summary": news_content.summary,
-                "full_content": news_content.full_content,
-                "proposition_id": proposition["id_proposicao"],
-                "proposition_number": f"{proposition['sigla']} {proposition['numero']}/{proposition['ano']}",
-                "presentation_date": presentation_date,
-                "uf_author": proposition.get("sigla_uf_autor"),
-                "author_name": proposition.get("nome_autor"),
-                "party": proposition.get("sigla_partido"),
-                "author_type": proposition.get("tipo_autor"),
-                "news_type": proposition["sigla"],
-                "original_ementa": proposition.get("ementa") or "",
-                "pdf_storage_url": pdf_url,
-                "original_pdf_url": proposition["url_teor_proposicao"],
-                "upvotes": 0,
-                "downvotes": 0,
-                "engagement_score": 0,
-                "published_to_social": False,
-                "extra_metadata": {
-                    "tags": news_content.tags,
-                    "impact_level": news_content.impact_level,
-                    "target_audience": news_content.target_audience,
-                    "pdf_pages": extracted["metadata"]["pages"],
-                    "word_count": extracted["metadata"]["word_count"],
-                    "has_tables": extracted["metadata"].get("has_tables", False)
-                }
-            }
+            news_data = self._build_news_data(proposition, extracted, pdf_url, news_content)
+            await self._embed([news_data])
             
             created_news = await self.news_repo.create(news_data)
             
-            await self.db_session.commit()
-            
             print(f"   ✓ News saved with ID: {created_news.id}")
             print(f"\n✅ SUCCESS! News generated for proposition {prop_id}")
             print(f"{'='*60}\n")
@@ -166,17 +122,128 @@ class NewsOrchestratorService:
                 "proposition_id": proposition.get("id_proposicao")
             }
     
+    async def _download(self, proposition: dict) -> bytes:
+        """Stage: download the proposition PDF (served from the local cache when seen before)"""
+        url = proposition["url_teor_proposicao"]
+        cached = await self.pdf_cache.get_pdf(url)
+        if cached is not None:
+            logger.info(f"PDF cache hit for {url}")
+            return cached
+        
+        pdf_bytes = await self.pdf_processor.download_pdf(url)
+        await self.pdf_cache.put_pdf(url, pdf_bytes)
+        return pdf_bytes
+    
+    async def _extract(self, pdf_bytes: bytes) -> dict:
+        """Stage: extract text and metadata from the PDF (cached by content hash)"""
+        content_hash = PDFCacheService.content_hash(pdf_bytes)
+        cached = await self.pdf_cache.get_extracted(content_hash)
+        if cached is not None:
+            logger.info(f"Extracted text cache hit for PDF {content_hash[:12]}")
+            return cached
+        
+        extracted = await self.pdf_processor.extract_text(pdf_bytes)
+        await self.pdf_cache.put_extracted(content_hash, extracted)
+        return extracted
+    
+    async def _upload(self, proposition: dict, pdf_bytes: bytes) -> str:
+        """Stage: upload the PDF to storage and return its public URL"""
+        filename = f"{proposition['sigla']}_{proposition['numero']}_{proposition['ano']}"
+        return await self.storage.upload_pdf(
+            pdf_bytes,
+            proposition["id_proposicao"],
+            filename,
+            year=proposition.get("ano")
+        )
+    
+    async def _generate(self, proposition: dict, extracted: dict) -> NewsOutput:
+        """Stage: generate news content with AI"""
+        return await self.ai_generator.generate_news(extracted["full_text"], proposition)
+    
+    async def _embed(self, news_items: list[dict]):
+        """
+        Stage: add the semantic search embedding to news rows, in one call.
+        
+        Failures are logged and leave embedding empty (the backfill job fills
+        it later) so a flaky embeddings API never loses a generated article.
+        """
+        texts = [
+            news_embedding_text(n["title"], n["summary"], n["extra_metadata"].get("tags"))
+            for n in news_items
+        ]
+        try:
+            embeddings = await self.embedder.embed_documents(texts)
+        except Exception as e:
+            logger.warning(f"Embedding failed for {len(news_items)} news, leaving it to the backfill: {e}")
+            embeddings = [None] * len(news_items)
+        for news_data, embedding in zip(news_items, embeddings):
+            news_data["embedding"] = embedding
+    
+    @staticmethod
+    def _build_news_data(
+        proposition: dict,
+        extracted: dict,
+        pdf_url: str,
+        news_content: NewsOutput
+    ) -> dict:
+        """Build the News row from the pipeline outputs"""
+        # Parse presentation date
+        presentation_date = None
+        if proposition.get("dataApresentacao"):
+            try:
+                presentation_date = datetime.fromisoformat(
+                    proposition["dataApresentacao"].replace("Z", "+00:00")
+                ).date()
+            except:
+                presentation_date = datetime.utcnow().date()
+        else:
+            presentation_date = datetime.utcnow().date()
+        
+        return {
+            "title": news_content.title,
+            "summary": news_content.summary,
+            "full_content": news_content.full_content,
+            "proposition_id": proposition["id_proposicao"],
+            "proposition_number": f"{proposition['sigla']} {proposition['numero']}/{proposition['ano']}",
+            "presentation_date": presentation_date,
+            "uf_author": proposition.get("sigla_uf_autor"),
+            "author_name": proposition.get("nome_autor"),
+            "party": proposition.get("sigla_partido"),
+            "author_type": proposition.get("tipo_autor"),
+            "news_type": proposition["sigla"],
+            "original_ementa": proposition.get("ementa") or "",
+            "pdf_storage_url": pdf_url,
+            "original_pdf_url": proposition["url_teor_proposicao"],
+            "upvotes": 0,
+            "downvotes": 0,
+            "engagement_score": 0,
+            "published_to_social": False,
+            "extra_metadata": {
+                "tags": news_content.tags,
+                "impact_level": news_content.impact_level,
+                "target_audience": news_content.target_audience,
+                "pdf_pages": extracted["metadata"]["pages"],
+                "word_count": extracted["metadata"]["word_count"],
+                "has_tables": extracted["metadata"].get("has_tables", False)
+            }
+        }
+    
     async def batch_process(
         self, 
         propositions: list[dict],
         max_concurrent: int = 3
     ) -> list[dict]:
         """
-        Process multiple propositions in parallel with concurrency control.
+        Process multiple propositions through a staged pipeline.
+        
+        Each stage (download, extract, upload, generate, persist) has its own
+        bounded queue and worker pool, so PDF downloads and uploads keep
+        flowing while items wait on the LLM. Generated news are inserted in
+        batches with a single INSERT ... ON CONFLICT DO NOTHING per batch.
         
         Args:
             propositions: List of proposition dicts from BigQuery
-            max_concurrent: Maximum number of concurrent processing tasks
+            max_concurrent: Maximum number of concurrent AI generations
             
         Returns:
             List of result dicts for each proposition
@@ -184,34 +251,186 @@ class NewsOrchestratorService:
         # Import here to avoid circular imports
         from app.db.session import async_session_maker
         
-        semaphore = asyncio.Semaphore(max_concurrent)
+        results: list[Optional[dict]] = [None] * len(propositions)
+        
+        async def download(item: dict) -> bool:
+            item["pdf_bytes"] = await self._download(item["proposition"])
+            return True
+        
+        async def extract(item: dict) -> bool:
+            item["extracted"] = await self._extract(item["pdf_bytes"])
+            return True
         
-        async def process_with_limit(prop):
-            async with semaphore:
-                # Create a new session for each task to avoid "concurrent operations" error
-                # SQLAlchemy AsyncSession is not thread/task safe for concurrent operations
-                async with async_session_maker() as session:
-                    # Create a new orchestrator instance for this task with its own session
-                    task_orchestrator = NewsOrchestratorService(session)
-                    return await task_orchestrator.process_proposition(prop)
+        async def upload(item: dict) -> bool:
+            item["pdf_url"] = await self._upload(item["proposition"], item["pdf_bytes"])
+            # Release the PDF bytes while the item waits for the LLM
+            item.pop("pdf_bytes")
+            return True
+        
+        async def generate(item: dict) -> bool:
+            item["news_content"] = await self._generate(item["proposition"], item["extracted"])
+            return True
+        
+        async def persist_batch(items: list[dict]):
+            news_items = [
+                self._build_news_data(
+                    item["proposition"],
+                    item["extracted"],
+                    item["pdf_url"],
+                    item["news_content"]
+                )
+                for item in items
+            ]
+            await self._embed(news_items)
+            async with async_session_maker() as session:
+                repo = NewsRepository(session)
+                inserted = await repo.bulk_create(news_items)
+                # Rows skipped by ON CONFLICT were created concurrently by someone else
+                skipped = [n["proposition_id"] for n in news_items if n["proposition_id"] not in inserted]
+                existing = await repo.get_ids_by_proposition_ids(skipped)
+            logger.info(f"Persisted {len(inserted)} news ({len(existing)} already existed)")
+            
+            for item in items:
+                prop_id = item["proposition"]["id_proposicao"]
+                if prop_id in inserted:
+                    results[item["index"]] = {
+                        "success": True,
+                        "news_id": str(inserted[prop_id]),
+                        "proposition_id": prop_id,
+                        "title": item["news_content"].title
+                    }
+                elif prop_id in existing:
+                    results[item["index"]] = {
+                        "success": True,
+                        "news_id": str(existing[prop_id]),
+                        "proposition_id": prop_id,
+                        "message": "Already processed"
+                    }
+        
+        stages: list[tuple[str, Callable[[dict], Awaitable[bool]], int]] = [
+            ("download", download, config.pipeline_download_workers),
+            ("extract", extract, config.pipeline_extract_workers),
+            ("upload", upload, config.pipeline_upload_workers),
+            ("generate", generate, max_concurrent),
+        ]
+        # One extra queue feeds the persist stage
+        queues = [asyncio.Queue(maxsize=config.pipeline_queue_size) for _ in range(len(stages) + 1)]
+        
+        async def stage_worker(index: int):
+            name, handler, _ = stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1]
+            while True:
+                item = await inbox.get()
+                if item is None:
+                    return
+                try:
+                    forward = await handler(item)
+                except Exception as e:
+                    prop_id = item["proposition"].get("id_proposicao", "unknown")
+                    logger.error(f"Error in {name} stage for proposition {prop_id}: {e}", exc_info=True)
+                    results[item["index"]] = {
+                        "success": False,
+                        "error": str(e),
+                        "proposition_id": item["proposition"].get("id_proposicao")
+                    }
+                    continue
+                if forward:
+                    await outbox.put(item)
+        
+        async def persist_worker():
+            """Collect generated items and insert them in batches (single worker)"""
+            inbox = queues[-1]
+            loop = asyncio.get_running_loop()
+            finished = False
+            while not finished:
+                item = await inbox.get()
+                if item is None:
+                    return
+                batch = [item]
+                # Linger briefly so items finishing close together share one INSERT
+                deadline = loop.time() + config.pipeline_persist_flush_seconds
+                while len(batch) < config.pipeline_persist_batch_size:
+                    try:
+                        item = await asyncio.wait_for(inbox.get(), timeout=max(deadline - loop.time(), 0))
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        finished = True
+                        break
+                    batch.append(item)
+                
+                try:
+                    await persist_batch(batch)
+                except Exception as e:
+                    logger.error(f"Error in persist stage for {len(batch)} propositions: {e}", exc_info=True)
+                    for failed in batch:
+                        results[failed["index"]] = {
+                            "success": False,
+                            "error": str(e),
+                            "proposition_id": failed["proposition"].get("id_proposicao")
+                        }
         
         logger.info(f"Starting batch processing of {len(propositions)} propositions")
         
-        results = await asyncio.gather(*[
-            process_with_limit(prop) for prop in propositions
-        ], return_exceptions=True)
-        
-        # Convert exceptions to error dicts
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                final_results.append({
-                    "success": False,
-                    "error": str(result),
-                    "proposition_id": propositions[i].get("id_proposicao")
-                })
+        # Filter already processed propositions with one query before scheduling any download
+        # (SQLAlchemy AsyncSession is not task safe, so the stages open their own sessions)
+        async with async_session_maker() as session:
+            existing = await NewsRepository(session).get_ids_by_proposition_ids(
+                [p["id_proposicao"] for p in propositions if p.get("id_proposicao") is not None]
+            )
+        
+        pending = []
+        # Repeated propositions in the same batch share the result of the first occurrence
+        first_index: dict = {}
+        duplicates = []
+        for index, prop in enumerate(propositions):
+            prop_id = prop.get("id_proposicao")
+            if prop_id in existing:
+                results[index] = {
+                    "success": True,
+                    "news_id": str(existing[prop_id]),
+                    "proposition_id": prop_id,
+                    "message": "Already processed"
+                }
+            elif prop_id is not None and prop_id in first_index:
+                duplicates.append((index, first_index[prop_id]))
             else:
-                final_results.append(result)
+                first_index[prop_id] = index
+                pending.append((index, prop))
+        logger.info(f"{len(existing)} propositions already processed, scheduling {len(pending)}")
+        
+        workers = [
+            [asyncio.create_task(stage_worker(i)) for _ in range(max(1, count))]
+            for i, (_, _, count) in enumerate(stages)
+        ]
+        workers.append([asyncio.create_task(persist_worker())])
+        
+        try:
+            for index, prop in pending:
+                await queues[0].put({"index": index, "proposition": prop})
+            
+            # Drain stages in order: once a stage's workers exit, nothing else reaches the next one
+            for queue, stage_workers in zip(queues, workers):
+                for _ in stage_workers:
+                    await queue.put(None)
+                await asyncio.gather(*stage_workers)
+        except BaseException:
+            for task in (t for stage_workers in workers for t in stage_workers):
+                task.cancel()
+            raise
+        
+        for index, original in duplicates:
+            results[index] = results[original]
+        
+        final_results = [
+            result if result is not None else {
+                "success": False,
+                "error": "Proposition was not processed",
+                "proposition_id": propositions[i].get("id_proposicao")
+            }
+            for i, result in enumerate(results)
+        ]
         
         # Log summary
         successful = sum(1 for r in final_results if r.get("success"))
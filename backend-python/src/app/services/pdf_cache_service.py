@@ -0,0 +1,168 @@
+"""PDF Cache Service - content-addressed on-disk cache for PDFs and extracted text"""
+
+from app.core.config import config
+from pathlib import Path
+from typing import Dict, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PDFCacheService:
+    """
+    On-disk cache for downloaded PDFs and their extract_text results.
+    
+    Layout under cache_dir:
+        urls/{sha256(url)}            -> content hash of the PDF served at that URL
+        pdfs/{content_hash}.pdf       -> raw PDF bytes
+        extracted/{content_hash}.json -> extract_text result (text + metadata)
+    
+    Entries are evicted least-recently-used first once the cache grows past
+    max_bytes. Cache errors are logged and treated as misses.
+    """
+    
+    _eviction_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        cache_dir: str = config.pdf_cache_dir,
+        max_bytes: int = config.pdf_cache_max_bytes
+    ):
+        self.root = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = bool(cache_dir) and max_bytes > 0
+    
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        """SHA-256 hex digest used as the cache key for a PDF"""
+        return hashlib.sha256(data).hexdigest()
+    
+    async def get_pdf(self, url: str) -> Optional[bytes]:
+        """Return the cached PDF for a URL, or None on a miss"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self._get_pdf, url)
+    
+    async def put_pdf(self, url: str, pdf_bytes: bytes) -> str:
+        """Store a downloaded PDF and return its content hash"""
+        content_hash = self.content_hash(pdf_bytes)
+        if self.enabled:
+            await asyncio.to_thread(self._put_pdf, url, pdf_bytes, content_hash)
+        return content_hash
+    
+    async def get_extracted(self, content_hash: str) -> Optional[Dict]:
+        """Return the cached extract_text result for a PDF hash, or None on a miss"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self._get_extracted, content_hash)
+    
+    async def put_extracted(self, content_hash: str, extracted: Dict):
+        """Store the extract_text result for a PDF hash"""
+        if self.enabled:
+            await asyncio.to_thread(self._put_extracted, content_hash, extracted)
+    
+    def _url_path(self, url: str) -> Path:
+        return self.root / "urls" / hashlib.sha256(url.encode()).hexdigest()
+    
+    def _pdf_path(self, content_hash: str) -> Path:
+        return self.root / "pdfs" / f"{content_hash}.pdf"
+    
+    def _extracted_path(self, content_hash: str) -> Path:
+        return self.root / "extracted" / f"{content_hash}.json"
+    
+    def _get_pdf(self, url: str) -> Optional[bytes]:
+        try:
+            content_hash = self._url_path(url).read_text().strip()
+            pdf_bytes = self._read(self._pdf_path(content_hash))
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"PDF cache read failed for {url}: {e}")
+            return None
+        
+        # Drop corrupted entries instead of serving them
+        if self.content_hash(pdf_bytes) != content_hash:
+            logger.warning(f"PDF cache entry {content_hash} is corrupted, discarding")
+            self._pdf_path(content_hash).unlink(missing_ok=True)
+            return None
+        return pdf_bytes
+    
+    def _put_pdf(self, url: str, pdf_bytes: bytes, content_hash: str):
+        try:
+            pdf_path = self._pdf_path(content_hash)
+            if not pdf_path.exists():
+                self._write(pdf_path, pdf_bytes)
+            self._write(self._url_path(url), content_hash.encode())
+            self._evict()
+        except OSError as e:
+            logger.warning(f"PDF cache write failed for {url}: {e}")
+    
+    def _get_extracted(self, content_hash: str) -> Optional[Dict]:
+        try:
+            return json.loads(self._read(self._extracted_path(content_hash)))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Extracted text cache read failed for {content_hash}: {e}")
+            return None
+    
+    def _put_extracted(self, content_hash: str, extracted: Dict):
+        try:
+            self._write(
+                self._extracted_path(content_hash),
+                json.dumps(extracted, ensure_ascii=False).encode()
+            )
+            self._evict()
+        except OSError as e:
+            logger.warning(f"Extracted text cache write failed for {content_hash}: {e}")
+    
+    @staticmethod
+    def _read(path: Path) -> bytes:
+        data = path.read_bytes()
+        # Reads refresh the mtime, which is what the LRU eviction orders by
+        os.utime(path)
+        return data
+    
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        # Write to a temp file and rename so readers never see partial entries
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+    
+    def _evict(self):
+        """Delete least recently used PDFs/extractions until the cache fits max_bytes"""
+        with self._eviction_lock:
+            entries = []
+            total = 0
+            for subdir in ("pdfs", "extracted"):
+                directory = self.root / subdir
+                if not directory.exists():
+                    continue
+                for entry in os.scandir(directory):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            
+            if total <= self.max_bytes:
+                return
+            
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                Path(path).unlink(missing_ok=True)
+                total -= size
+            logger.info(f"PDF cache evicted entries, now {total} bytes")
@@ -1,26 +1,42 @@
 """PDF Processor Service for downloading and extracting text from PDFs"""
 
 import httpx
-import PyPDF2
 import pdfplumber
 from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from app.core.config import config
+from app.core.retry import compute_backoff
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import asyncio
 import logging
-from typing import Dict
+import multiprocessing
+import os
+import signal
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class PDFTooLargeError(ValueError):
+    """Raised when a PDF exceeds the configured download size limit"""
+
+
 class PDFProcessorService:
     """Service for downloading and extracting text from PDF documents"""
     
     def __init__(self):
-        self.timeout = httpx.Timeout(30.0, connect=10.0)
-        self.max_retries = 3
+        self.max_retries = config.pdf_download_max_retries
+        self.max_bytes = config.pdf_download_max_bytes
     
     async def download_pdf(self, url: str) -> bytes:
         """
         Download PDF from URL with retry logic.
         
+        Uses the shared HTTP client, streams the body with a size cutoff and
+        retries transient failures with exponential backoff (honoring Retry-After).
+        
         Args:
             url: URL of the PDF document
             
@@ -29,32 +45,67 @@ class PDFProcessorService:
             
         Raises:
             httpx.HTTPError: If download fails after retries
+            PDFTooLargeError: If the PDF is larger than the configured limit
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for attempt in range(self.max_retries):
-                try:
-                    logger.info(f"Downloading PDF from {url} (attempt {attempt + 1})")
-                    response = await client.get(url, follow_redirects=True)
-                    response.raise_for_status()
-                    
-                    # Validate content type
-                    content_type = response.headers.get("content-type", "")
-                    if "pdf" not in content_type.lower() and len(response.content) < 100:
-                        raise ValueError(f"Invalid PDF content type: {content_type}")
-                    
-                    logger.info(f"PDF downloaded successfully ({len(response.content)} bytes)")
-                    return response.content
-                    
-                except (httpx.HTTPError, ValueError) as e:
-                    logger.warning(f"Download attempt {attempt + 1} failed: {e}")
-                    if attempt == self.max_retries - 1:
-                        raise
-                    continue
+        client = get_http_client()
+        host = httpx.URL(url).host
+        
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                logger.info(f"Downloading PDF from {url} (attempt {attempt})")
+                async with _get_host_semaphore(host):
+                    pdf_bytes = await self._stream_pdf(client, url)
+                
+                logger.info(f"PDF downloaded successfully ({len(pdf_bytes)} bytes)")
+                return pdf_bytes
+                
+            except (httpx.HTTPError, ValueError) as e:
+                if attempt == self.max_retries or not _is_retryable(e):
+                    logger.warning(f"Download attempt {attempt} failed: {e}")
+                    raise
+                
+                delay = _retry_after_seconds(e)
+                if delay is None:
+                    delay = compute_backoff(
+                        attempt,
+                        config.pdf_download_backoff_base_seconds,
+                        config.pdf_download_backoff_max_seconds
+                    )
+                logger.warning(f"Download attempt {attempt} failed: {e}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    async def _stream_pdf(self, client: httpx.AsyncClient, url: str) -> bytes:
+        """Stream the response body, aborting as soon as it exceeds max_bytes"""
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            
+            content_length = response.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+                raise PDFTooLargeError(f"PDF too large: {content_length} bytes (limit {self.max_bytes})")
+            
+            chunks = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise PDFTooLargeError(f"PDF too large: over {self.max_bytes} bytes")
+                chunks.append(chunk)
+            content = b"".join(chunks)
+            
+            # Validate content type
+            content_type = response.headers.get("content-type", "")
+            if "pdf" not in content_type.lower() and len(content) < 100:
+                raise ValueError(f"Invalid PDF content type: {content_type}")
+            
+            return content
     
     async def extract_text(self, pdf_bytes: bytes) -> Dict:
         """
         Extract text from PDF using pdfplumber (primary) or PyPDF2 (fallback).
         
+        Parsing is CPU-bound, so it runs in the shared process pool instead of
+        on the event loop.
+        
         Args:
             pdf_bytes: PDF content as bytes
             
@@ -62,69 +113,248 @@ class PDFProcessorService:
             Dict with:
                 - full_text: Extracted text content
                 - metadata: {pages, has_tables, word_count}
+                
+        Raises:
+            TimeoutError: If extraction takes longer than the configured timeout
+            RuntimeError: If the worker pool was reset while the extraction
+                was pending (another document timed out); safe to retry
         """
+        loop = asyncio.get_running_loop()
+        pool = get_extraction_pool()
+        future = loop.run_in_executor(
+            pool,
+            extract_text_sync,
+            pdf_bytes,
+            config.pdf_extract_max_pages
+        )
         try:
-            # Try pdfplumber first (better for tables)
-            return await self._extract_with_pdfplumber(pdf_bytes)
-        except Exception as e:
-            logger.warning(f"pdfplumber extraction failed: {e}, trying PyPDF2")
-            return await self._extract_with_pypdf2(pdf_bytes)
+            return await asyncio.wait_for(future, timeout=config.pdf_extract_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.error(f"PDF extraction timed out after {config.pdf_extract_timeout_seconds}s")
+            # A busy worker process can't be interrupted: kill the pool and start a fresh one
+            reset_extraction_pool(pool)
+            raise TimeoutError(
+                f"PDF extraction timed out after {config.pdf_extract_timeout_seconds}s"
+            )
+        except BrokenProcessPool as e:
+            # Another document's timeout killed the pool (or a worker crashed); retryable
+            reset_extraction_pool(pool)
+            raise RuntimeError(f"PDF extraction aborted, worker pool was reset: {e}") from e
+        except asyncio.CancelledError as e:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            # Only the executor future was cancelled (pool shut down), not this task
+            raise RuntimeError("PDF extraction cancelled by a worker pool shutdown") from e
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """HTTP client shared by all PDF downloads (HTTP/2, keep-alive pooling)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=config.pdf_download_max_connections,
+                max_keepalive_connections=config.pdf_download_max_connections,
+                keepalive_expiry=60.0
+            )
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (call on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _host_semaphores.clear()
+
+
+def _get_host_semaphore(host: str) -> asyncio.Semaphore:
+    """Limit concurrent downloads per host so one origin can't take the whole pool"""
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(config.pdf_download_max_connections_per_host)
+    return _host_semaphores[host]
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Retry transport errors, timeouts, 429 and 5xx; give up on other 4xx and size limits"""
+    if isinstance(error, PDFTooLargeError):
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status in (408, 429) or status >= 500
+    return True
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Delay requested by the server via Retry-After (seconds or HTTP date)"""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    retry_after = error.response.headers.get("retry-after")
+    if not retry_after:
+        return None
     
-    async def _extract_with_pdfplumber(self, pdf_bytes: bytes) -> Dict:
-        """Extract text using pdfplumber"""
-        pdf_file = BytesIO(pdf_bytes)
-        full_text = []
-        has_tables = False
-        
-        with pdfplumber.open(pdf_file) as pdf:
-            num_pages = len(pdf.pages)
-            
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    full_text.append(text)
-                
-                # Check for tables
-                if page.extract_tables():
-                    has_tables = True
-            
-            combined_text = "\n\n".join(full_text)
-            word_count = len(combined_text.split())
-            
-            logger.info(f"Extracted {word_count} words from {num_pages} pages using pdfplumber")
-            
-            return {
-                "full_text": combined_text,
-                "metadata": {
-                    "pages": num_pages,
-                    "has_tables": has_tables,
-                    "word_count": word_count
-                }
-            }
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
     
-    async def _extract_with_pypdf2(self, pdf_bytes: bytes) -> Dict:
-        """Extract text using PyPDF2 as fallback"""
-        pdf_file = BytesIO(pdf_bytes)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        num_pages = len(pdf_reader.pages)
-        full_text = []
+    return min(max(delay, 0.0), config.pdf_download_backoff_max_seconds)
+
+
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+# Worker PIDs reported by the current pool's processes (see _report_worker_pid)
+_extraction_worker_pids = None
+
+
+def _report_worker_pid(pids):
+    """Pool initializer: runs once in each worker process, before any extraction"""
+    pids.put(os.getpid())
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all PDFProcessorService instances (created lazily)"""
+    global _extraction_pool, _extraction_worker_pids
+    if _extraction_pool is None:
+        _extraction_worker_pids = multiprocessing.SimpleQueue()
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=config.pdf_extract_workers or None,
+            initializer=_report_worker_pid,
+            initargs=(_extraction_worker_pids,)
+        )
+    return _extraction_pool
+
+
+def reset_extraction_pool(pool: Optional[ProcessPoolExecutor] = None):
+    """
+    Kill the worker processes of the current pool and drop it; the next
+    extraction starts a fresh one.
+
+    Queued and running extractions of the killed pool fail with
+    BrokenProcessPool instead of being cancelled.
+
+    Args:
+        pool: Only reset if this is still the current pool (it may already
+            have been replaced by a concurrent reset)
+    """
+    global _extraction_pool, _extraction_worker_pids
+    if _extraction_pool is None or (pool is not None and pool is not _extraction_pool):
+        return
+    pool, pids = _extraction_pool, _extraction_worker_pids
+    _extraction_pool, _extraction_worker_pids = None, None
+
+    # Processes stuck in a parser never check for shutdown, so they are killed
+    while not pids.empty():
+        try:
+            os.kill(pids.get(), signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    pool.shutdown(wait=False)
+    pids.close()
+
+
+def shutdown_extraction_pool():
+    """Stop the pool workers (call on application shutdown)"""
+    global _extraction_pool, _extraction_worker_pids
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=True, cancel_futures=True)
+        _extraction_worker_pids.close()
+        _extraction_pool, _extraction_worker_pids = None, None
+
+
+def extract_text_sync(pdf_bytes: bytes, max_pages: int = 0) -> Dict:
+    """
+    Extract text in a worker process: pdfplumber first, PyPDF2 as fallback.
+    
+    Args:
+        pdf_bytes: PDF content as bytes
+        max_pages: Only parse the first N pages (0 = no limit)
+    """
+    try:
+        # Try pdfplumber first (better for tables)
+        return _extract_with_pdfplumber(pdf_bytes, max_pages)
+    except Exception as e:
+        logger.warning(f"pdfplumber extraction failed: {e}, trying PyPDF2")
+        return _extract_with_pypdf2(pdf_bytes, max_pages)
+
+
+def _extract_with_pdfplumber(pdf_bytes: bytes, max_pages: int = 0) -> Dict:
+    """Extract text using pdfplumber"""
+    pdf_file = BytesIO(pdf_bytes)
+    full_text = []
+    has_tables = False
+    
+    with pdfplumber.open(pdf_file) as pdf:
+        num_pages = len(pdf.pages)
+        pages = pdf.pages[:max_pages] if max_pages else pdf.pages
         
-        for page in pdf_reader.pages:
+        for page in pages:
             text = page.extract_text()
             if text:
                 full_text.append(text)
+            
+            # Check for tables
+            if not has_tables and page.extract_tables():
+                has_tables = True
+            
+            # Release the parsed page objects as we go
+            page.flush_cache()
         
         combined_text = "\n\n".join(full_text)
         word_count = len(combined_text.split())
         
-        logger.info(f"Extracted {word_count} words from {num_pages} pages using PyPDF2")
+        logger.info(f"Extracted {word_count} words from {len(pages)}/{num_pages} pages using pdfplumber")
         
         return {
             "full_text": combined_text,
             "metadata": {
                 "pages": num_pages,
-                "has_tables": False,
+                "has_tables": has_tables,
                 "word_count": word_count
             }
         }
+
+
+def _extract_with_pypdf2(pdf_bytes: bytes, max_pages: int = 0) -> Dict:
+    """Extract text using PyPDF2 as fallback"""
+    # Only imported by the worker processes that need the fallback
+    import PyPDF2
+
+    pdf_file = BytesIO(pdf_bytes)
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+    
+    num_pages = len(pdf_reader.pages)
+    pages = pdf_reader.pages[:max_pages] if max_pages else pdf_reader.pages
+    full_text = []
+    
+    for page in pages:
+        text = page.extract_text()
+        if text:
+            full_text.append(text)
+    
+    combined_text = "\n\n".join(full_text)
+    word_count = len(combined_text.split())
+    
+    logger.info(f"Extracted {word_count} words from {len(pages)}/{num_pages} pages using PyPDF2")
+    
+    return {
+        "full_text": combined_text,
+        "metadata": {
+            "pages": num_pages,
+            "has_tables": False,
+            "word_count": word_count
+        }
+    }
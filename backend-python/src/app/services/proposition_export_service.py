@@ -0,0 +1,97 @@
+"""Proposition Export Service - streams the BigQuery propositions as NDJSON or Parquet"""
+
+from app.core.config import config
+from google.cloud import bigquery
+from app.services.proposition_service import base_query, get_bigquery_client, serialize_row
+from typing import BinaryIO, Iterator, Optional
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "parquet")
+
+
+def run_export_query(
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    page_size: int = config.proposition_export_page_size
+):
+    """
+    Run the propositions query and return its RowIterator (rows are fetched page by page).
+
+    Blocking; query and credential errors are raised here, before any row
+    is written.
+
+    No ORDER BY: a full export does not need one, and sorting the whole
+    result would force BigQuery to finish it on a single worker.
+    """
+    query = base_query()
+    params = []
+    if from_year is not None:
+        query += "\nAND prop.ano >= @from_year"
+        params.append(bigquery.ScalarQueryParameter("from_year", "INT64", from_year))
+    if to_year is not None:
+        query += "\nAND prop.ano <= @to_year"
+        params.append(bigquery.ScalarQueryParameter("to_year", "INT64", to_year))
+
+    job = get_bigquery_client().query(query, job_config=bigquery.QueryJobConfig(query_parameters=params))
+    return job.result(page_size=page_size)
+
+
+def iter_ndjson(rows) -> Iterator[bytes]:
+    """
+    Rows of run_export_query as NDJSON, one chunk per result page.
+
+    Memory stays bounded by page_size rows whatever the export size.
+    Blocking: iterate it from a worker thread (StreamingResponse does).
+    """
+    for page in rows.pages:
+        yield "".join(
+            json.dumps(serialize_row(dict(row)), ensure_ascii=False) + "\n"
+            for row in page
+        ).encode()
+
+
+def write_ndjson(
+    output: BinaryIO,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    page_size: int = config.proposition_export_page_size
+) -> None:
+    """Write propositions as NDJSON to a binary file, page by page"""
+    for chunk in iter_ndjson(run_export_query(from_year, to_year, page_size)):
+        output.write(chunk)
+
+
+def write_parquet(
+    path: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    page_size: int = config.proposition_export_page_size
+) -> int:
+    """
+    Write propositions to a Parquet file, one row group per Arrow record batch.
+
+    Requires pyarrow (`pip install .[export]`).
+
+    Returns:
+        Number of rows written
+    """
+    # Optional dependency, only needed for Parquet exports
+    import pyarrow.parquet as pq
+
+    rows = run_export_query(from_year, to_year, page_size)
+    writer = None
+    total = 0
+    try:
+        for batch in rows.to_arrow_iterable():
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema)
+            writer.write_batch(batch)
+            total += batch.num_rows
+            logger.info(f"Exported {total} propositions so far")
+    finally:
+        if writer is not None:
+            writer.close()
+    return total
@@ -1,11 +1,114 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
 from pathlib import Path
+from app.core.config import config
+from app.services.proposition_source import group_authors
 import os
 import json
+import threading
+import time
 from google.cloud import bigquery
 from google.oauth2 import service_account
 from app.models.proposition import Proposition
 
+SQL_PATH = Path(__file__).resolve().parent.parent / "queries" / "get_propositions.sql"
+
+# Base query, read once at import (None if the file is missing)
+_base_query: Optional[str] = SQL_PATH.read_text() if SQL_PATH.exists() else None
+
+
+def base_query() -> str:
+    """Propositions query without filters (queries/get_propositions.sql)"""
+    if _base_query is None:
+        raise FileNotFoundError(f"Query file not found at {SQL_PATH}")
+    return _base_query
+
+
+def serialize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """BigQuery row as a JSON-serializable dict (dates/datetimes as ISO strings)"""
+    return {
+        key: value.isoformat() if hasattr(value, 'isoformat') else value
+        for key, value in row.items()
+    }
+
+
+_client: Optional[bigquery.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_bigquery_client() -> bigquery.Client:
+    """Process-wide BigQuery client (credentials are parsed once)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            # Execute query using BigQuery Client with credentials from .env
+            billing_project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
+            credentials_json = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_JSON")
+
+            if not billing_project_id:
+                raise ValueError("GOOGLE_CLOUD_PROJECT environment variable not set")
+
+            # Try to get credentials from JSON env var first, fallback to file path
+            if credentials_json:
+                try:
+                    credentials_info = json.loads(credentials_json)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid GOOGLE_APPLICATION_CREDENTIALS_JSON format: {e}")
+                credentials = service_account.Credentials.from_service_account_info(credentials_info)
+                _client = bigquery.Client(project=billing_project_id, credentials=credentials)
+            else:
+                # Fallback to file path (GOOGLE_APPLICATION_CREDENTIALS env var)
+                _client = bigquery.Client(project=billing_project_id)
+        return _client
+
+
+def close_bigquery_client():
+    """Close the shared BigQuery client (call on application shutdown)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+class TTLCache:
+    """Thread-safe LRU with a fixed TTL (queries run in worker threads)"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple, value: Any):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_results = TTLCache(config.proposition_cache_ttl_seconds, config.proposition_cache_max_entries)
+
+
 class PropositionService:
     def list_propositions(
         self,
@@ -15,66 +118,42 @@ class PropositionService:
         page: int = 1,
         per_page: int = 20
     ) -> List[Dict[str, Any]]:
-        
-        # Construct path to SQL file
-        base_path = Path(__file__).resolve().parent.parent
-        sql_path = base_path / "queries" / "get_propositions.sql"
-        
-        if not sql_path.exists():
-             raise FileNotFoundError(f"Query file not found at {sql_path}")
-
-        with open(sql_path, "r") as f:
-            query = f.read()
-            
-        # Add filters
+        """
+        Propositions from BigQuery, cached for PROPOSITION_CACHE_TTL_SECONDS.
+
+        Blocking (BigQuery client is synchronous); call it from a worker thread.
+        """
+        cache_key = (keywords, uf, type, page, per_page)
+        cached = _results.get(cache_key)
+        if cached is not None:
+            return cached
+
+        query = base_query()
+        params = []
+
+        # Add filters (as query parameters, so equal filters reuse BigQuery's cached results too)
         if keywords:
-            safe_keywords = keywords.replace("'", "''")
-            query += f"\nAND LOWER(palavra_chave) LIKE '%{safe_keywords.lower()}%'"
-            
+            query += "\nAND LOWER(palavra_chave) LIKE CONCAT('%', @keywords, '%')"
+            params.append(bigquery.ScalarQueryParameter("keywords", "STRING", keywords.lower()))
+
         if uf:
-            safe_uf = uf.replace("'", "''")
-            query += f"\nAND autor.sigla_uf_autor = '{safe_uf}'"
-            
+            query += "\nAND EXISTS (SELECT 1 FROM UNNEST(autor.autores) a WHERE a.sigla_uf_autor = @uf)"
+            params.append(bigquery.ScalarQueryParameter("uf", "STRING", uf))
+
         if type:
-            safe_type = type.replace("'", "''")
-            query += f"\nAND prop.sigla = '{safe_type}'"
-            
-        limit = per_page
-        offset = (page - 1) * per_page
-        query += f"\nORDER BY ano DESC\nLIMIT {limit} OFFSET {offset}"
-        
-        # Execute query using BigQuery Client with credentials from .env
-        billing_project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
-        credentials_json = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_JSON")
-        
-        if not billing_project_id:
-            raise ValueError("GOOGLE_CLOUD_PROJECT environment variable not set")
-        
-        # Try to get credentials from JSON env var first, fallback to file path
-        if credentials_json:
-            try:
-                credentials_info = json.loads(credentials_json)
-                credentials = service_account.Credentials.from_service_account_info(credentials_info)
-                client = bigquery.Client(project=billing_project_id, credentials=credentials)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid GOOGLE_APPLICATION_CREDENTIALS_JSON format: {e}")
-        else:
-            # Fallback to file path (GOOGLE_APPLICATION_CREDENTIALS env var)
-            client = bigquery.Client(project=billing_project_id)
-        
-        query_job = client.query(query)
+            query += "\nAND prop.sigla = @type"
+            params.append(bigquery.ScalarQueryParameter("type", "STRING", type))
+
+        query += "\nORDER BY ano DESC\nLIMIT @limit OFFSET @offset"
+        params.append(bigquery.ScalarQueryParameter("limit", "INT64", per_page))
+        params.append(bigquery.ScalarQueryParameter("offset", "INT64", (page - 1) * per_page))
+
+        client = get_bigquery_client()
+        query_job = client.query(query, job_config=bigquery.QueryJobConfig(query_parameters=params))
         results = query_job.result()
-        
-        # Convert to list of dicts
-        rows = [dict(row) for row in results]
-        
-        # Handle potential serialization issues
-        final_results = []
-        for row in rows:
-            # Convert dates/datetimes to string
-            for key, value in row.items():
-                if hasattr(value, 'isoformat'):
-                    row[key] = value.isoformat()
-            final_results.append(row)
-        
+
+        # Convert to JSON-serializable dicts in a single pass
+        final_results = [serialize_row(row) for row in group_authors([dict(row) for row in results])]
+
+        _results.set(cache_key, final_results)
         return final_results
@@ -0,0 +1,144 @@
+"""Proposition Sources for the incremental sync (BigQuery or a local fixture file)"""
+
+from abc import ABC, abstractmethod
+from app.core.config import config
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+import asyncio
+import json
+
+# (dataApresentacao, id_proposicao) of the last staged proposition
+Watermark = Tuple[datetime, int]
+
+
+def parse_presentation_date(value) -> datetime:
+    """dataApresentacao as a naive datetime (BigQuery returns datetime, fixtures ISO strings)"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).replace(tzinfo=None)
+
+
+AUTHOR_FIELDS = ["nome_autor", "sigla_uf_autor", "sigla_partido", "tipo_autor"]
+
+
+def _author_sort_key(author: Dict[str, Any]) -> Tuple:
+    # Same ordering as the ARRAY_AGG in the queries: NULLs first, then alphabetical
+    return tuple(author.get(field) or "" for field in ["nome_autor", "sigla_partido", "sigla_uf_autor", "tipo_autor"])
+
+
+def group_authors(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    One row per id_proposicao, keeping the first occurrence's order.
+
+    Rows fanned out by an author JOIN (one per author) are merged: all distinct
+    authors go to `autores`, and the primary author (first in a deterministic
+    order) fills the flat author columns. Rows already aggregated by the
+    queries pass through with their `autores`.
+    """
+    grouped: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        authors = row.get("autores")
+        if authors is None:
+            authors = [{field: row.get(field) for field in AUTHOR_FIELDS}]
+
+        merged = grouped.get(row["id_proposicao"])
+        if merged is None:
+            merged = grouped[row["id_proposicao"]] = {**row, "autores": []}
+        for author in authors:
+            author = {field: author.get(field) for field in AUTHOR_FIELDS}
+            if author not in merged["autores"]:
+                merged["autores"].append(author)
+
+    for merged in grouped.values():
+        merged["autores"].sort(key=_author_sort_key)
+        if merged["autores"]:
+            merged.update(merged["autores"][0])
+    return list(grouped.values())
+
+
+def start_watermark() -> Watermark:
+    """Watermark used before the first sync (PROPOSITION_SYNC_START_DATE)"""
+    return datetime.fromisoformat(config.proposition_sync_start_date), 0
+
+
+class PropositionSource(ABC):
+    """Where the proposition sync reads from"""
+
+    name = "propositions"
+
+    @abstractmethod
+    async def fetch_since(self, after: Watermark, limit: int) -> List[Dict[str, Any]]:
+        """
+        Propositions strictly after the watermark, ordered by
+        (dataApresentacao, id_proposicao).
+
+        Args:
+            after: (dataApresentacao, id_proposicao) of the last staged row
+            limit: Maximum rows to return
+
+        Returns:
+            One row per proposition in the BigQuery format (dataApresentacao
+            as datetime, all authors in `autores`)
+        """
+
+
+class BigQueryPropositionSource(PropositionSource):
+    """Câmara propositions from the basedosdados BigQuery dataset"""
+
+    SQL_PATH = Path(__file__).resolve().parent.parent / "queries" / "get_propositions_since.sql"
+
+    def __init__(self):
+        self.query = self.SQL_PATH.read_text()
+
+    async def fetch_since(self, after: Watermark, limit: int) -> List[Dict[str, Any]]:
+        # BigQuery client is blocking, keep it off the event loop
+        return await asyncio.to_thread(self._fetch_since, after, limit)
+
+    def _fetch_since(self, after: Watermark, limit: int) -> List[Dict[str, Any]]:
+        from google.cloud import bigquery
+        from app.services.proposition_service import get_bigquery_client
+
+        since_date, since_id = after
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("since_date", "DATETIME", since_date),
+            bigquery.ScalarQueryParameter("since_id", "INT64", since_id),
+            bigquery.ScalarQueryParameter("limit", "INT64", limit),
+        ])
+        results = get_bigquery_client().query(self.query, job_config=job_config).result()
+        return [dict(row) for row in results]
+
+
+class FixturePropositionSource(PropositionSource):
+    """
+    Propositions from a local JSON array or NDJSON file (same fields as the
+    BigQuery rows), for tests and development without Google credentials.
+    """
+
+    def __init__(self, path: str = config.proposition_fixture_path):
+        if not path:
+            raise ValueError("PROPOSITION_FIXTURE_PATH must be set when PROPOSITION_SOURCE=fixture")
+        self.path = Path(path)
+
+    def _load(self) -> List[Dict[str, Any]]:
+        text = self.path.read_text()
+        if text.lstrip().startswith("["):
+            rows = json.loads(text)
+        else:
+            rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+        for row in rows:
+            row["dataApresentacao"] = parse_presentation_date(row["dataApresentacao"])
+        # Fixtures may hold one row per author, like the raw author JOIN
+        return group_authors(rows)
+
+    async def fetch_since(self, after: Watermark, limit: int) -> List[Dict[str, Any]]:
+        # Read on every call, so rows appended to the file show up in the next sync
+        rows = sorted(self._load(), key=lambda row: (row["dataApresentacao"], row["id_proposicao"]))
+        return [row for row in rows if (row["dataApresentacao"], row["id_proposicao"]) > after][:limit]
+
+
+def get_proposition_source() -> PropositionSource:
+    """Proposition source selected by PROPOSITION_SOURCE ("bigquery" or "fixture")"""
+    if config.proposition_source == "fixture":
+        return FixturePropositionSource()
+    return BigQueryPropositionSource()
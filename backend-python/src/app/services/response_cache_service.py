@@ -0,0 +1,233 @@
+"""Response Cache Services for hot read endpoints (in-process LRU or Redis)"""
+
+from abc import ABC, abstractmethod
+from app.core.config import config
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+import hashlib
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Invalidation tags
+FEED_TAG = "feed"
+TOP_TAG = "top"
+
+
+def news_tag(news_id) -> str:
+    """Tag of everything rendered from a single news"""
+    return f"news:{news_id}"
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+@dataclass
+class CachedResponse:
+    """
+    A serialized response and the versions of the tags it was built from.
+
+    The entry is only valid while every tag is still at the stored version;
+    invalidating a tag bumps its version, which orphans all entries using it.
+    """
+    body: bytes
+    etag: str
+    versions: Dict[str, int] = field(default_factory=dict)
+
+
+class ResponseCache(ABC):
+    """Key/value cache of serialized responses with tag-based invalidation"""
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Cached response for key, or None if missing, expired or invalidated"""
+        entry = await self._get_entry(key)
+        if entry is None:
+            return None
+        if entry.versions and await self.versions(entry.versions) != entry.versions:
+            return None
+        return entry
+
+    @abstractmethod
+    async def _get_entry(self, key: str) -> Optional[CachedResponse]:
+        """Stored entry for key (not checked against tag versions)"""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        """
+        Store an entry. Take entry.versions with versions() BEFORE reading the
+        data, so a write that lands in between invalidates the new entry.
+        """
+
+    @abstractmethod
+    async def versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Current version of each tag"""
+
+    @abstractmethod
+    async def invalidate(self, *tags: str) -> None:
+        """Invalidate every entry built from any of the tags"""
+
+    async def close(self):
+        """Release connections held by the backend"""
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    Per-process LRU with TTL. Invalidations only reach the process that made
+    them; writes made by other processes (workers) show up after the TTL.
+
+    Tag versions are kept for at most max_entries tags (LRU). Versions come
+    from one increasing counter, and an untracked tag reads as the highest
+    version evicted so far, so evicting a tag invalidates the entries built
+    from untracked tags instead of reviving stale ones.
+    """
+
+    def __init__(self, max_entries: int = config.response_cache_max_entries):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, CachedResponse]]" = OrderedDict()
+        self._versions: "OrderedDict[str, int]" = OrderedDict()
+        self._counter = 0
+        self._evicted_version = 0
+
+    async def _get_entry(self, key: str) -> Optional[CachedResponse]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        return {tag: self._versions.get(tag, self._evicted_version) for tag in tags}
+
+    async def invalidate(self, *tags: str) -> None:
+        for tag in tags:
+            self._counter += 1
+            self._versions[tag] = self._counter
+            self._versions.move_to_end(tag)
+        while len(self._versions) > self.max_entries:
+            _, version = self._versions.popitem(last=False)
+            self._evicted_version = max(self._evicted_version, version)
+
+
+class RedisResponseCache(ResponseCache):
+    """
+    Cache shared by all API processes and workers (requires the redis package).
+
+    Tag version keys expire version_ttl_seconds after their last
+    invalidation. That outlives every entry built from the old version, so a
+    version that restarts from 0 can't match a live entry.
+    """
+
+    PREFIX = "response-cache"
+
+    def __init__(
+        self,
+        url: str = config.response_cache_redis_url,
+        version_ttl_seconds: float = 2 * max(
+            config.response_cache_list_ttl_seconds,
+            config.response_cache_detail_ttl_seconds
+        ) + 3600
+    ):
+        # Optional dependency, only needed for this backend
+        from redis.asyncio import Redis
+
+        self.client = Redis.from_url(url)
+        self.version_ttl_ms = int(version_ttl_seconds * 1000)
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.PREFIX}:entry:{key}"
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.PREFIX}:version:{tag}"
+
+    async def _get_entry(self, key: str) -> Optional[CachedResponse]:
+        raw = await self.client.get(self._entry_key(key))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CachedResponse(body=data["body"].encode(), etag=data["etag"], versions=data["versions"])
+
+    async def set(self, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        raw = json.dumps({"body": entry.body.decode(), "etag": entry.etag, "versions": entry.versions})
+        await self.client.set(self._entry_key(key), raw, px=max(int(ttl_seconds * 1000), 1))
+
+    async def versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        tags = list(tags)
+        if not tags:
+            return {}
+        values = await self.client.mget([self._version_key(tag) for tag in tags])
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+    async def invalidate(self, *tags: str) -> None:
+        if not tags:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(self._version_key(tag))
+                pipe.pexpire(self._version_key(tag), self.version_ttl_ms)
+            await pipe.execute()
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class NullResponseCache(ResponseCache):
+    """Caching disabled (RESPONSE_CACHE_BACKEND=off)"""
+
+    async def _get_entry(self, key: str) -> Optional[CachedResponse]:
+        return None
+
+    async def set(self, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        pass
+
+    async def versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        return {}
+
+    async def invalidate(self, *tags: str) -> None:
+        pass
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide response cache selected by RESPONSE_CACHE_BACKEND ("memory", "redis" or "off")"""
+    global _cache
+    if _cache is None:
+        if config.response_cache_backend == "redis":
+            _cache = RedisResponseCache()
+        elif config.response_cache_backend == "off":
+            _cache = NullResponseCache()
+        else:
+            _cache = MemoryResponseCache()
+    return _cache
+
+
+async def close_response_cache():
+    """Close the shared response cache (call on application shutdown)"""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
+
+
+async def invalidate_responses(*tags: str):
+    """Invalidate cached responses, logging instead of failing the write that triggered it"""
+    try:
+        await get_response_cache().invalidate(*tags)
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed for {tags}: {e}")
@@ -1,6 +1,13 @@
-"""Supabase Storage Service for PDF uploads"""
+"""Storage Services for PDF uploads (Supabase Storage or local filesystem)"""
 
-from supabase import create_client, Client
+from abc import ABC, abstractmethod
+from app.core.config import config
+from pathlib import Path
+from urllib.parse import quote
+import asyncio
+import base64
+import hashlib
+import httpx
 import os
 from typing import Optional
 import logging
@@ -8,63 +15,261 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class StorageService:
-    """Service for uploading and managing PDFs in Supabase Storage"""
-    
-    def __init__(self):
-        self.client: Client = create_client(
-            os.getenv("SUPABASE_URL", ""),
-            os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-        )
-        self.bucket = os.getenv("SUPABASE_BUCKET_NAME", "proposition-pdfs")
-    
+def build_pdf_path(proposition_id: int, filename: str, year: Optional[int] = None) -> str:
+    """
+    Object path for a proposition PDF.
+
+    Path structure: propositions/{year}/{id_proposicao}/{filename}.pdf
+    """
+    if year:
+        return f"propositions/{year}/{proposition_id}/{filename}.pdf"
+    return f"propositions/{proposition_id}/{filename}.pdf"
+
+
+class StorageService(ABC):
+    """Blob storage interface for proposition PDFs"""
+
     async def upload_pdf(
-        self, 
-        file_bytes: bytes, 
+        self,
+        file_bytes: bytes,
         proposition_id: int,
         filename: str,
         year: Optional[int] = None
     ) -> str:
         """
-        Upload PDF to Supabase Storage and return public URL.
-        
-        Path structure: propositions/{year}/{id_proposicao}/{filename}.pdf
+        Upload PDF and return its public URL.
+
+        Skips the upload when an object with the same content is already stored
+        (e.g. on retries) and overwrites it when the content changed.
         """
+        file_path = build_pdf_path(proposition_id, filename, year)
         try:
-            # Build file path
-            if year:
-                file_path = f"propositions/{year}/{proposition_id}/{filename}.pdf"
-            else:
-                file_path = f"propositions/{proposition_id}/{filename}.pdf"
-            
-            # Upload file
-            self.client.storage.from_(self.bucket).upload(
-                path=file_path,
-                file=file_bytes,
-                file_options={"content-type": "application/pdf"}
-            )
-            
-            # Get public URL
-            public_url = self.get_public_url(file_path)
-            
-            logger.info(f"PDF uploaded successfully: {file_path}")
-            return public_url
-            
+            uploaded = await self.put_if_changed(file_path, file_bytes, "application/pdf")
         except Exception as e:
             logger.error(f"Error uploading PDF: {e}")
             raise
-    
+
+        if uploaded:
+            logger.info(f"PDF uploaded successfully: {file_path}")
+        else:
+            logger.info(f"PDF already stored, skipping upload: {file_path}")
+        return self.get_public_url(file_path)
+
+    @abstractmethod
+    async def put_if_changed(self, path: str, data: bytes, content_type: str) -> bool:
+        """Store data at path unless identical content is already there; True if written"""
+
+    @abstractmethod
     def get_public_url(self, path: str) -> str:
         """Get public URL for a file in storage"""
-        url = self.client.storage.from_(self.bucket).get_public_url(path)
-        return url
-    
+
+    @abstractmethod
     async def delete_pdf(self, file_path: str) -> bool:
         """Delete PDF from storage"""
+
+    async def close(self):
+        """Release connections held by the backend"""
+
+
+class SupabaseStorageService(StorageService):
+    """
+    Supabase Storage backend using the Storage REST API over a pooled httpx client.
+
+    Objects larger than the multipart threshold go through the resumable
+    (TUS) endpoint in fixed-size chunks.
+    """
+
+    # Supabase requires 6 MB chunks for resumable uploads
+    CHUNK_SIZE = 6 * 1024 * 1024
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        bucket: Optional[str] = None,
+        multipart_threshold: int = config.storage_multipart_threshold_bytes
+    ):
+        url = url or os.getenv("SUPABASE_URL", "")
+        key = key or os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+        bucket = bucket or os.getenv("SUPABASE_BUCKET_NAME", "proposition-pdfs")
+        self.base_url = f"{url.rstrip('/')}/storage/v1"
+        self.bucket = bucket
+        self.multipart_threshold = multipart_threshold
+        self._headers = {"Authorization": f"Bearer {key}", "apikey": key}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                http2=True,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=config.storage_max_connections,
+                    max_keepalive_connections=config.storage_max_connections
+                )
+            )
+        return self._client
+
+    async def put_if_changed(self, path: str, data: bytes, content_type: str) -> bool:
+        existing = await self._get_object_metadata(path)
+        if existing is not None and self._is_same_content(existing, data):
+            return False
+
+        upsert = existing is not None
+        if len(data) > self.multipart_threshold:
+            await self._upload_resumable(path, data, content_type, upsert)
+        else:
+            response = await self.client.post(
+                f"/object/{self.bucket}/{quote(path)}",
+                content=data,
+                headers={"content-type": content_type, "x-upsert": "true" if upsert else "false"}
+            )
+            response.raise_for_status()
+        return True
+
+    async def _get_object_metadata(self, path: str) -> Optional[dict]:
+        """Return the stored object's metadata (eTag, size), or None if it doesn't exist"""
+        folder, name = path.rsplit("/", 1)
+        response = await self.client.post(
+            f"/object/list/{self.bucket}",
+            json={"prefix": folder, "search": name, "limit": 100, "offset": 0}
+        )
+        response.raise_for_status()
+        for item in response.json():
+            if item.get("name") == name:
+                return item.get("metadata") or {}
+        return None
+
+    @staticmethod
+    def _is_same_content(metadata: dict, data: bytes) -> bool:
+        """Compare the stored eTag (MD5 for single-part uploads) and size with the new bytes"""
+        etag = (metadata.get("eTag") or "").strip('"')
+        if etag and "-" not in etag:
+            return etag == hashlib.md5(data).hexdigest()
+        # Multipart eTags aren't a plain MD5, fall back to the size
+        return metadata.get("size") == len(data)
+
+    async def _upload_resumable(self, path: str, data: bytes, content_type: str, upsert: bool):
+        """Upload in CHUNK_SIZE parts through the TUS resumable endpoint"""
+
+        def encode(value: str) -> str:
+            return base64.b64encode(value.encode()).decode()
+
+        tus_headers = {"Tus-Resumable": "1.0.0"}
+        response = await self.client.post(
+            "/upload/resumable",
+            headers={
+                **tus_headers,
+                "Upload-Length": str(len(data)),
+                "Upload-Metadata": ",".join([
+                    f"bucketName {encode(self.bucket)}",
+                    f"objectName {encode(path)}",
+                    f"contentType {encode(content_type)}",
+                ]),
+                "x-upsert": "true" if upsert else "false"
+            }
+        )
+        response.raise_for_status()
+        upload_url = response.headers["location"]
+
+        for offset in range(0, len(data), self.CHUNK_SIZE):
+            response = await self.client.patch(
+                upload_url,
+                content=data[offset:offset + self.CHUNK_SIZE],
+                headers={
+                    **tus_headers,
+                    "Upload-Offset": str(offset),
+                    "content-type": "application/offset+octet-stream"
+                }
+            )
+            response.raise_for_status()
+
+    def get_public_url(self, path: str) -> str:
+        return f"{self.base_url}/object/public/{self.bucket}/{quote(path)}"
+
+    async def delete_pdf(self, file_path: str) -> bool:
         try:
-            self.client.storage.from_(self.bucket).remove([file_path])
+            response = await self.client.request(
+                "DELETE",
+                f"/object/{self.bucket}",
+                json={"prefixes": [file_path]}
+            )
+            response.raise_for_status()
             logger.info(f"PDF deleted: {file_path}")
             return True
         except Exception as e:
             logger.error(f"Error deleting PDF: {e}")
             return False
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class LocalStorageService(StorageService):
+    """Stores PDFs on the local filesystem (development and tests)"""
+
+    def __init__(
+        self,
+        root_dir: str = config.storage_local_dir,
+        base_url: str = config.storage_local_base_url
+    ):
+        self.root = Path(root_dir)
+        self.base_url = base_url
+
+    async def put_if_changed(self, path: str, data: bytes, content_type: str) -> bool:
+        return await asyncio.to_thread(self._write_if_changed, path, data)
+
+    def _write_if_changed(self, file_path: str, file_bytes: bytes) -> bool:
+        target = self.root / file_path
+        if target.exists():
+            existing_hash = hashlib.sha256(target.read_bytes()).hexdigest()
+            if existing_hash == hashlib.sha256(file_bytes).hexdigest():
+                return False
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_suffix(".tmp")
+        tmp_path.write_bytes(file_bytes)
+        os.replace(tmp_path, target)
+        return True
+
+    def get_public_url(self, path: str) -> str:
+        """URL for a stored file (base_url if configured, file:// otherwise)"""
+        if self.base_url:
+            return f"{self.base_url.rstrip('/')}/{path}"
+        return (self.root / path).resolve().as_uri()
+
+    async def delete_pdf(self, file_path: str) -> bool:
+        try:
+            await asyncio.to_thread((self.root / file_path).unlink)
+            logger.info(f"PDF deleted: {file_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting PDF: {e}")
+            return False
+
+
+_storage: Optional[StorageService] = None
+
+
+def get_storage_service() -> StorageService:
+    """Process-wide storage backend selected by STORAGE_BACKEND ("supabase" or "local")"""
+    global _storage
+    if _storage is None:
+        if config.storage_backend == "local":
+            _storage = LocalStorageService()
+        else:
+            _storage = SupabaseStorageService()
+    return _storage
+
+
+async def close_storage_service():
+    """Close the shared storage backend (call on application shutdown)"""
+    global _storage
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
@@ -2,6 +2,7 @@
 
 import tweepy
 import logging
+from typing import Optional
 from app.core.config import config
 from app.db.models.news import News
 
@@ -13,6 +14,7 @@ class TwitterService:
     
     def __init__(self):
         """Initialize Twitter API client"""
+        self._username: Optional[str] = None
         if not all([
             config.twitter_api_key,
             config.twitter_api_secret,
@@ -59,11 +61,7 @@ class TwitterService:
             response = self.client.create_tweet(text=tweet_text)
             tweet_id = response.data['id']
             
-            # Get username for URL construction
-            me = self.client.get_me()
-            username = me.data.username
-            
-            tweet_url = f"https://x.com/{username}/status/{tweet_id}"
+            tweet_url = f"https://x.com/{self._get_username()}/status/{tweet_id}"
             logger.info(f"Successfully posted news {news.id} to Twitter: {tweet_url}")
             
             return tweet_url
@@ -75,6 +73,17 @@ class TwitterService:
             logger.error(f"Failed to post to Twitter: {e}")
             raise Exception(f"Twitter posting failed: {str(e)}")
     
+    def _get_username(self) -> str:
+        """Account username for URL construction (fetched once per client)"""
+        if self._username is None:
+            self._username = self.client.get_me().data.username
+        return self._username
+    
+    @staticmethod
+    def build_content_footer(tweet_url: str) -> str:
+        """Footer appended to the news full_content once it is posted"""
+        return f"\n\n---\n📱 Acompanhe a discussão no X: {tweet_url}"
+    
     def _build_tweet_text(self, news: News) -> str:
         """
         Build tweet text from news data
@@ -93,3 +102,4 @@ class TwitterService:
             tweet = tweet[:297] + "..."
         
         return tweet
+
@@ -0,0 +1,107 @@
+"""Vote Buffer Service - write-behind aggregation of votes for hot news"""
+
+from app.repositories.news_repository import NewsRepository
+from app.core.config import config
+from app.services.response_cache_service import TOP_TAG, invalidate_responses, news_tag
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class VoteBufferService:
+    """
+    Merges vote increments per news in memory and flushes them periodically.
+
+    Each flush is one UPDATE ... FROM (VALUES ...) for every news voted on
+    since the previous flush, so a burst of votes on a viral item costs one
+    row update instead of one transaction per vote.
+
+    News whose total votes cross the social threshold in a flush get a post
+    queued in the social outbox within the same transaction; the dispatcher
+    worker publishes it off the request path.
+    """
+
+    def __init__(
+        self,
+        session_maker,
+        flush_interval_ms: int = config.vote_buffer_flush_ms,
+        vote_threshold: int = config.twitter_vote_threshold
+    ):
+        self.session_maker = session_maker
+        self.flush_interval = flush_interval_ms / 1000
+        self.vote_threshold = vote_threshold
+        self._pending: Dict[UUID, List[int]] = {}
+        self._in_flight: Dict[UUID, List[int]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, news_id: UUID, vote_type: str):
+        """Buffer one vote (flushed within flush_interval)"""
+        counts = self._pending.setdefault(news_id, [0, 0])
+        if vote_type == "upvote":
+            counts[0] += 1
+        elif vote_type == "downvote":
+            counts[1] += 1
+
+    def pending(self, news_id: UUID) -> Tuple[int, int]:
+        """(upvotes, downvotes) accepted for a news but not yet committed"""
+        up, down = 0, 0
+        for source in (self._pending, self._in_flight):
+            counts = source.get(news_id)
+            if counts:
+                up += counts[0]
+                down += counts[1]
+        return up, down
+
+    async def start(self):
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and write out whatever is still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Vote buffer flush failed: {e}", exc_info=True)
+
+    async def flush(self):
+        """Write all buffered votes in one statement"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            # Swap buffers so votes arriving during the flush go to the next one
+            self._in_flight, self._pending = self._pending, {}
+            deltas = {news_id: (up, down) for news_id, (up, down) in self._in_flight.items()}
+
+            try:
+                async with self.session_maker() as session:
+                    await NewsRepository(session).apply_vote_deltas(deltas, self.vote_threshold)
+            except Exception:
+                # Put the votes back so the next flush retries them
+                for news_id, (up, down) in deltas.items():
+                    counts = self._pending.setdefault(news_id, [0, 0])
+                    counts[0] += up
+                    counts[1] += down
+                raise
+            finally:
+                self._in_flight = {}
+
+            await invalidate_responses(TOP_TAG, *(news_tag(news_id) for news_id in deltas))
+            logger.info(f"Flushed {sum(u + d for u, d in deltas.values())} votes for {len(deltas)} news")
@@ -0,0 +1,65 @@
+"""Embedding backfill - embeds news created without an embedding
+
+Run once after enabling semantic search (or periodically, it is idempotent):
+
+    python -m app.workers.embedding_backfill
+"""
+
+from app.db.session import async_session_maker
+from app.repositories.news_repository import NewsRepository
+from app.services.embedding_service import (
+    EmbeddingService,
+    get_embedding_service,
+    close_embedding_service,
+    news_embedding_text
+)
+from app.core.config import config
+from app.core.logging import setup_logging
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_embeddings(
+    embedder: EmbeddingService,
+    batch_size: int = config.embedding_batch_size
+) -> int:
+    """
+    Embed every news without an embedding, batch_size rows per embedder call.
+
+    Returns:
+        Number of news embedded
+    """
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            repo = NewsRepository(session)
+            rows = await repo.list_without_embedding(batch_size)
+            if not rows:
+                break
+
+            texts = [
+                news_embedding_text(title, summary, (extra_metadata or {}).get("tags"))
+                for _, title, summary, extra_metadata in rows
+            ]
+            embeddings = await embedder.embed_documents(texts)
+            await repo.set_embeddings({row[0]: embedding for row, embedding in zip(rows, embeddings)})
+
+        total += len(rows)
+        logger.info(f"Embedded {total} news so far")
+
+    return total
+
+
+async def main():
+    setup_logging()
+    try:
+        total = await backfill_embeddings(get_embedding_service())
+        logger.info(f"Embedding backfill complete: {total} news embedded")
+    finally:
+        await close_embedding_service()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""News generation worker - consumes the durable news_jobs queue
+
+Run as a separate process (one or more replicas):
+
+    python -m app.workers.news_worker
+"""
+
+from app.db.session import async_session_maker
+from app.db.models.news_job import NewsJob
+from app.repositories.news_job_repository import NewsJobRepository
+from app.services.news_orchestrator_service import NewsOrchestratorService
+from app.services.container import ServiceContainer
+from app.services.response_cache_service import FEED_TAG, TOP_TAG, invalidate_responses
+from app.core.config import config
+from app.core.logging import setup_logging
+from app.core.retry import compute_backoff
+from typing import Optional
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+logger = logging.getLogger(__name__)
+
+
+class NewsWorker:
+    """Claims queued jobs and runs the news generation pipeline for each one"""
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        services: Optional[ServiceContainer] = None,
+        concurrency: int = config.news_worker_concurrency,
+        poll_interval: float = config.news_worker_poll_interval_seconds
+    ):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.services = services or ServiceContainer()
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stop = asyncio.Event()
+        self._running: set[asyncio.Task] = set()
+
+    def stop(self):
+        """Request a graceful shutdown (in-flight jobs are finished)"""
+        self._stop.set()
+
+    async def run_forever(self):
+        """Keep `concurrency` jobs in flight until stopped"""
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency})")
+
+        while not self._stop.is_set():
+            free_slots = self.concurrency - len(self._running)
+            claimed = 0
+
+            if free_slots > 0:
+                try:
+                    claimed = await self._claim_and_start(free_slots)
+                except Exception as e:
+                    logger.error(f"Failed to claim jobs: {e}", exc_info=True)
+
+            if self._running and (claimed or free_slots == 0):
+                # Wake up as soon as a slot frees (or poll again on timeout)
+                await asyncio.wait(
+                    self._running,
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+            elif not claimed:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        if self._running:
+            logger.info(f"Waiting for {len(self._running)} in-flight jobs to finish...")
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _claim_and_start(self, limit: int) -> int:
+        async with async_session_maker() as session:
+            jobs = await NewsJobRepository(session).claim(
+                self.worker_id,
+                limit,
+                config.news_job_lock_timeout_seconds
+            )
+
+        for job in jobs:
+            task = asyncio.create_task(self._run_job(job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+        return len(jobs)
+
+    async def _run_job(self, job: NewsJob):
+        logger.info(f"Processing job {job.id} (proposition {job.proposition_id}, attempt {job.attempts}/{job.max_attempts})")
+
+        async with async_session_maker() as session:
+            try:
+                orchestrator = NewsOrchestratorService(session, self.services)
+                result = await orchestrator.process_proposition(job.payload)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+            # Discard any half-finished transaction left by a failed pipeline
+            await session.rollback()
+            job_repo = NewsJobRepository(session)
+
+            if result.get("success"):
+                await job_repo.mark_done(job.id, result.get("news_id"))
+                await invalidate_responses(FEED_TAG, TOP_TAG)
+                logger.info(f"Job {job.id} done (news {result.get('news_id')})")
+                return
+
+            delay = compute_backoff(
+                job.attempts,
+                config.news_job_backoff_base_seconds,
+                config.news_job_backoff_max_seconds
+            )
+            await job_repo.mark_failed(job, result.get("error") or "Processing failed", delay)
+
+            if job.attempts >= job.max_attempts:
+                logger.error(f"Job {job.id} failed permanently after {job.attempts} attempts: {result.get('error')}")
+            else:
+                logger.warning(f"Job {job.id} failed (attempt {job.attempts}), retrying in {delay:.0f}s: {result.get('error')}")
+
+
+async def main():
+    setup_logging()
+    services = ServiceContainer()
+    worker = NewsWorker(services=services)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run_forever()
+    finally:
+        await services.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
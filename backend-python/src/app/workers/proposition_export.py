@@ -0,0 +1,50 @@
+"""Proposition export - streams the BigQuery propositions to NDJSON or Parquet
+
+Rows are fetched one result page at a time (PROPOSITION_EXPORT_PAGE_SIZE) and
+written as they arrive, so full historical exports run in constant memory:
+
+    python -m app.workers.proposition_export --output propositions.ndjson
+    python -m app.workers.proposition_export --format parquet --output propositions.parquet --from-year 2000
+
+Parquet requires pyarrow (`pip install .[export]`). `--output -` writes NDJSON to stdout.
+"""
+
+from app.services.proposition_export_service import EXPORT_FORMATS, write_ndjson, write_parquet
+from app.services.proposition_service import close_bigquery_client
+from app.core.config import config
+from app.core.logging import setup_logging
+import argparse
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--output", required=True, help="output file ('-' for stdout, NDJSON only)")
+    parser.add_argument("--from-year", type=int, default=None, help="first presentation year (inclusive)")
+    parser.add_argument("--to-year", type=int, default=None, help="last presentation year (inclusive)")
+    parser.add_argument("--page-size", type=int, default=config.proposition_export_page_size, help="rows per result page")
+    args = parser.parse_args()
+
+    setup_logging()
+    try:
+        if args.format == "parquet":
+            if args.output == "-":
+                parser.error("Parquet cannot be written to stdout")
+            total = write_parquet(args.output, args.from_year, args.to_year, args.page_size)
+            logger.info(f"Exported {total} propositions to {args.output}")
+        elif args.output == "-":
+            write_ndjson(sys.stdout.buffer, args.from_year, args.to_year, args.page_size)
+        else:
+            with open(args.output, "wb") as output:
+                write_ndjson(output, args.from_year, args.to_year, args.page_size)
+            logger.info(f"Exported propositions to {args.output}")
+    finally:
+        close_bigquery_client()
+
+
+if __name__ == "__main__":
+    main()
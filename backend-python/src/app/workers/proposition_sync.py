@@ -0,0 +1,114 @@
+"""Proposition sync - incremental copy of new propositions into Postgres
+
+Pulls only propositions presented after the stored watermark
+(dataApresentacao, id_proposicao), in keyset batches, and stages them in the
+local `propositions` table. With --enqueue, the staged propositions are also
+queued for news generation (processed by app.workers.news_worker).
+
+    python -m app.workers.proposition_sync [--enqueue] [--interval SECONDS]
+
+With --interval (or PROPOSITION_SYNC_INTERVAL_SECONDS) the sync repeats
+until stopped, as the docker-compose service does; otherwise it runs once.
+
+PROPOSITION_SOURCE=fixture reads PROPOSITION_FIXTURE_PATH instead of BigQuery.
+"""
+
+from app.db.session import async_session_maker
+from app.repositories.proposition_repository import PropositionRepository
+from app.repositories.news_job_repository import NewsJobRepository
+from app.services.proposition_source import PropositionSource, get_proposition_source, start_watermark
+from app.services.proposition_service import close_bigquery_client
+from app.core.config import config
+from app.core.logging import setup_logging
+import argparse
+import asyncio
+import logging
+import signal
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_propositions(
+    source: PropositionSource,
+    batch_size: int = config.proposition_sync_batch_size,
+    enqueue: bool = False
+) -> int:
+    """
+    Stage every proposition newer than the watermark, batch_size rows per query.
+
+    Each batch and its new watermark are committed together, so an
+    interrupted sync resumes where it stopped.
+
+    Returns:
+        Number of source rows read
+    """
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            repo = PropositionRepository(session)
+            watermark = await repo.get_watermark(source.name) or start_watermark()
+
+            rows = await source.fetch_since(watermark, batch_size)
+            if not rows:
+                break
+
+            last = rows[-1]
+            await repo.stage(source.name, rows, (last["dataApresentacao"], last["id_proposicao"]))
+
+            if enqueue:
+                payloads = await repo.get_payloads(list({row["id_proposicao"] for row in rows}))
+                queued = await NewsJobRepository(session).enqueue(payloads, max_attempts=config.news_job_max_attempts)
+                logger.info(f"Queued {len(queued)} propositions for news generation")
+
+        total += len(rows)
+        logger.info(f"Synced {total} rows so far (watermark {last['dataApresentacao']}, {last['id_proposicao']})")
+
+        if len(rows) < batch_size:
+            break
+
+    return total
+
+
+async def sync_periodically(source: PropositionSource, interval: float, stop: asyncio.Event, enqueue: bool = False):
+    """Sync every `interval` seconds until stop is set; a failed run is retried on the next one"""
+    logger.info(f"Proposition sync started (every {interval:.0f}s)")
+    while not stop.is_set():
+        try:
+            total = await sync_propositions(source, enqueue=enqueue)
+            logger.info(f"Proposition sync complete: {total} rows read")
+        except Exception as e:
+            logger.error(f"Proposition sync failed: {e}", exc_info=True)
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("Proposition sync stopped")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--enqueue", action="store_true", help="queue staged propositions for news generation")
+    parser.add_argument(
+        "--interval", type=float, default=config.proposition_sync_interval_seconds,
+        help="repeat the sync every N seconds until stopped (0 = run once)"
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    try:
+        if args.interval > 0:
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, stop.set)
+            await sync_periodically(get_proposition_source(), args.interval, stop, enqueue=args.enqueue)
+        else:
+            total = await sync_propositions(get_proposition_source(), enqueue=args.enqueue)
+            logger.info(f"Proposition sync complete: {total} rows read")
+    finally:
+        close_bigquery_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""Social outbox dispatcher - publishes queued social media posts
+
+Run as a separate process (a single replica is enough; claims use
+SKIP LOCKED, so extra replicas are safe):
+
+    python -m app.workers.social_dispatcher
+"""
+
+from app.db.session import async_session_maker
+from app.db.models.social_outbox import SocialOutbox
+from app.repositories.news_repository import NewsRepository
+from app.repositories.social_outbox_repository import SocialOutboxRepository
+from app.services.twitter_service import TwitterService
+from app.services.response_cache_service import (
+    FEED_TAG,
+    TOP_TAG,
+    close_response_cache,
+    invalidate_responses,
+    news_tag
+)
+from app.core.config import config
+from app.core.logging import setup_logging
+from app.core.retry import compute_backoff
+from typing import Optional
+import asyncio
+import logging
+import signal
+
+logger = logging.getLogger(__name__)
+
+
+class SocialDispatcher:
+    """Claims pending outbox entries, posts them and writes the post URL back"""
+
+    def __init__(
+        self,
+        twitter_service: Optional[TwitterService] = None,
+        batch_size: int = config.social_outbox_batch_size,
+        poll_interval: float = config.social_outbox_poll_interval_seconds
+    ):
+        self.twitter_service = twitter_service or TwitterService()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        """Request a graceful shutdown (the current batch is finished)"""
+        self._stop.set()
+
+    async def run_forever(self):
+        """Dispatch batches until stopped, polling while the outbox is empty"""
+        if not self.twitter_service.client:
+            # Idle instead of exiting, so `restart: always` doesn't loop
+            logger.warning("Twitter client not initialized - outbox entries stay pending")
+            await self._stop.wait()
+            return
+
+        logger.info("Social dispatcher started")
+
+        while not self._stop.is_set():
+            dispatched = 0
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception as e:
+                logger.error(f"Failed to dispatch outbox entries: {e}", exc_info=True)
+
+            if dispatched < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        logger.info("Social dispatcher stopped")
+
+    async def dispatch_batch(self) -> int:
+        """Claim and publish one batch; returns the number of entries claimed"""
+        async with async_session_maker() as session:
+            entries = await SocialOutboxRepository(session).claim(self.batch_size)
+
+        for entry in entries:
+            await self._dispatch(entry)
+
+        return len(entries)
+
+    async def _dispatch(self, entry: SocialOutbox):
+        async with async_session_maker() as session:
+            outbox_repo = SocialOutboxRepository(session)
+            news = await NewsRepository(session).get_by_id(entry.news_id)
+
+            if news and news.twitter_post_url:
+                # Already published (e.g. before the outbox existed)
+                await outbox_repo.mark_sent(entry, news.twitter_post_url)
+                return
+
+            try:
+                if not news:
+                    raise ValueError("News not found")
+                # tweepy is synchronous
+                tweet_url = await asyncio.to_thread(self.twitter_service.post_news_to_twitter, news)
+            except Exception as e:
+                delay = compute_backoff(
+                    entry.attempts,
+                    config.social_outbox_backoff_base_seconds,
+                    config.social_outbox_backoff_max_seconds
+                )
+                await outbox_repo.mark_failed(entry, str(e), delay, config.social_outbox_max_attempts)
+                logger.warning(f"Posting news {entry.news_id} failed (attempt {entry.attempts}): {e}")
+                return
+
+            await outbox_repo.mark_sent(entry, tweet_url, TwitterService.build_content_footer(tweet_url))
+            await invalidate_responses(FEED_TAG, TOP_TAG, news_tag(entry.news_id))
+            logger.info(f"News {entry.news_id} posted to Twitter: {tweet_url}")
+
+
+async def main():
+    setup_logging()
+    dispatcher = SocialDispatcher()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, dispatcher.stop)
+
+    try:
+        await dispatcher.run_forever()
+    finally:
+        await close_response_cache()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
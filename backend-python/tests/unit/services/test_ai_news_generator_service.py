@@ -0,0 +1,96 @@
+import asyncio
+
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from app.services.ai_news_generator_service import AINewsGeneratorService
+from app.services.document_chunker import count_tokens, split_legislative_text
+
+NEWS = {
+    "title": "Proposta altera regras",
+    "summary": "Resumo " * 20,
+    "full_content": "Conteúdo " * 80,
+    "tags": ["teste"],
+    "impact_level": "medium",
+    "target_audience": ["cidadãos"],
+}
+
+PROPOSITION = {"id_proposicao": 1, "sigla": "PL", "numero": 10, "ano": 2025, "ementa": "Dispõe sobre testes."}
+
+
+def long_document(articles: int) -> str:
+    body = "Texto do dispositivo com detalhes sobre prazos e valores. " * 40
+    return "CAPÍTULO I\nDISPOSIÇÕES GERAIS\n" + "\n".join(f"Art. {i}º {body}" for i in range(1, articles + 1))
+
+
+class FakeModel:
+    """Records the prompts sent by the service and how many section calls overlap"""
+
+    def __init__(self):
+        self.section_prompts = []
+        self.news_prompts = []
+        self.running = 0
+        self.max_running = 0
+
+    async def respond(self, messages, info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1].content
+        if info.output_tools:
+            self.news_prompts.append(prompt)
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, NEWS)])
+
+        self.section_prompts.append(prompt)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return ModelResponse(parts=[TextPart("Resumo da parte.")])
+
+
+def make_service(fake: FakeModel, **kwargs) -> AINewsGeneratorService:
+    options = dict(direct_max_tokens=2000, chunk_max_tokens=1000, token_budget=100_000, map_concurrency=2)
+    options.update(kwargs)
+    return AINewsGeneratorService(model=FunctionModel(fake.respond), **options)
+
+
+def test_chunks_break_before_articles():
+    chunks = split_legislative_text(long_document(12), 1000)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 1000 for chunk in chunks)
+    assert all(chunk.lstrip().startswith(("Art.", "CAPÍTULO")) for chunk in chunks)
+
+
+def test_short_document_is_sent_directly():
+    fake = FakeModel()
+
+    news = asyncio.run(make_service(fake).generate_news("Art. 1º Esta lei entra em vigor.", PROPOSITION))
+
+    assert news.title == NEWS["title"]
+    assert fake.section_prompts == []
+    assert "Art. 1º Esta lei entra em vigor." in fake.news_prompts[0]
+
+
+def test_long_document_is_summarized_concurrently():
+    fake = FakeModel()
+    text = long_document(30)
+
+    asyncio.run(make_service(fake).generate_news(text, PROPOSITION))
+
+    assert len(fake.section_prompts) == len(split_legislative_text(text, 1000))
+    assert fake.max_running == 2
+    assert "[Parte 1/" in fake.news_prompts[0]
+    assert text not in fake.news_prompts[0]
+
+
+def test_token_budget_limits_summarized_chunks():
+    fake = FakeModel()
+    text = long_document(30)
+
+    chunks = split_legislative_text(text, 1000)
+    within_budget = 0
+    while within_budget < len(chunks) and sum(count_tokens(c) for c in chunks[:within_budget + 1]) <= 2500:
+        within_budget += 1
+
+    asyncio.run(make_service(fake, token_budget=2500).generate_news(text, PROPOSITION))
+
+    assert 1 <= len(fake.section_prompts) == within_budget < len(chunks)
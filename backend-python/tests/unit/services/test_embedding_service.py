@@ -0,0 +1,91 @@
+import asyncio
+import math
+from contextlib import asynccontextmanager
+
+from app.services.embedding_service import HashEmbeddingService, news_embedding_text
+from app.workers import embedding_backfill
+
+
+def embed(*texts):
+    return asyncio.run(HashEmbeddingService().embed_documents(list(texts)))
+
+
+def cosine(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+def test_same_text_gives_same_vector():
+    first, second = embed("Reforma tributária", "Reforma tributária")
+
+    assert first == second
+    assert len(first) == HashEmbeddingService.dimensions
+
+
+def test_vectors_are_unit_norm_with_fallback_for_empty_text():
+    vector, empty = embed("Merenda escolar nas escolas públicas", "")
+
+    assert math.isclose(math.sqrt(sum(x * x for x in vector)), 1.0)
+    assert empty == [1.0] + [0.0] * (HashEmbeddingService.dimensions - 1)
+
+
+def test_texts_sharing_words_are_closer():
+    query, related, unrelated = embed(
+        "reforma tributária",
+        "Proposta altera a reforma tributaria e os impostos",
+        "Programa de transporte gratuito para estudantes"
+    )
+
+    assert cosine(query, related) > cosine(query, unrelated)
+
+
+def test_news_embedding_text_includes_tags():
+    assert news_embedding_text("Título", "Resumo", ["saúde", "SUS"]) == "Título\nsaúde, SUS\nResumo"
+    assert news_embedding_text("Título", "Resumo") == "Título\nResumo"
+
+
+class FakeNewsRepository:
+    """News rows without embedding, shared across sessions"""
+
+    rows = {}
+
+    def __init__(self, session):
+        pass
+
+    async def list_without_embedding(self, limit):
+        pending = [
+            (news_id, title, summary, {"tags": []})
+            for news_id, (title, summary, embedding) in self.rows.items()
+            if embedding is None
+        ]
+        return pending[:limit]
+
+    async def set_embeddings(self, embeddings):
+        for news_id, embedding in embeddings.items():
+            title, summary, _ = self.rows[news_id]
+            self.rows[news_id] = (title, summary, embedding)
+
+
+class CountingEmbedder(HashEmbeddingService):
+    def __init__(self):
+        self.batches = []
+
+    async def embed_documents(self, texts):
+        self.batches.append(len(texts))
+        return await super().embed_documents(texts)
+
+
+def test_backfill_embeds_in_batches(monkeypatch):
+    @asynccontextmanager
+    async def session_maker():
+        yield None
+
+    FakeNewsRepository.rows = {i: (f"Notícia {i}", "Resumo", None) for i in range(5)}
+    monkeypatch.setattr(embedding_backfill, "async_session_maker", session_maker)
+    monkeypatch.setattr(embedding_backfill, "NewsRepository", FakeNewsRepository)
+    embedder = CountingEmbedder()
+
+    total = asyncio.run(embedding_backfill.backfill_embeddings(embedder, batch_size=2))
+
+    assert total == 5
+    assert embedder.batches == [2, 2, 1]
+    assert all(row[-1] is not None for row in FakeNewsRepository.rows.values())
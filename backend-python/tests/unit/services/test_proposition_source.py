@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from app.services.proposition_source import FixturePropositionSource, group_authors
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "propositions.ndjson"
+
+START = (datetime(2025, 1, 1), 0)
+
+
+def fetch(after, limit):
+    return asyncio.run(FixturePropositionSource(str(FIXTURE_PATH)).fetch_since(after, limit))
+
+
+def watermark(row):
+    return row["dataApresentacao"], row["id_proposicao"]
+
+
+def test_fetch_since_orders_by_keyset_and_applies_limit():
+    rows = fetch(START, 3)
+
+    assert [row["id_proposicao"] for row in rows] == [2480001, 2480002, 2480107]
+    assert [watermark(row) for row in rows] == sorted(watermark(row) for row in rows)
+
+
+def test_fetch_since_resumes_after_watermark():
+    first = fetch(START, 1)
+    # Same dataApresentacao as the last staged row: only higher ids follow
+    rest = fetch(watermark(first[-1]), 10)
+
+    assert [row["id_proposicao"] for row in first] == [2480001]
+    assert [row["id_proposicao"] for row in rest] == [2480002, 2480107, 2480210]
+    assert fetch(watermark(rest[-1]), 10) == []
+
+
+def test_fetch_since_merges_fanned_out_authors():
+    rows = fetch(START, 10)
+    co_authored = next(row for row in rows if row["id_proposicao"] == 2480002)
+
+    assert len(rows) == 4
+    assert [author["sigla_uf_autor"] for author in co_authored["autores"]] == ["MG", "RJ"]
+    assert co_authored["nome_autor"] == "Deputada Coautora"
+    assert co_authored["sigla_uf_autor"] == "MG"
+
+
+def test_group_authors_keeps_aggregated_rows_and_drops_duplicate_authors():
+    author = {"nome_autor": "A", "sigla_uf_autor": "SP", "sigla_partido": "P", "tipo_autor": "Deputado(a)"}
+    rows = [
+        {"id_proposicao": 2, **author},
+        {"id_proposicao": 1, "autores": [author]},
+        {"id_proposicao": 2, **author},
+    ]
+
+    grouped = group_authors(rows)
+
+    assert [row["id_proposicao"] for row in grouped] == [2, 1]
+    assert grouped[0]["autores"] == [author]
+    assert grouped[1]["autores"] == [author]
+    assert grouped[1]["sigla_uf_autor"] == "SP"
@@ -13,4 +13,9 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
+# Tables with Postgres-only column types (full-text search, pgvector) can't be created on SQLite
+POSTGRES_ONLY_TABLES = {"news"}
+Base.metadata.create_all(
+    bind=engine,
+    tables=[table for table in Base.metadata.sorted_tables if table.name not in POSTGRES_ONLY_TABLES],
+)
\ No newline at end of file
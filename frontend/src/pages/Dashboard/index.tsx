@@ -65,6 +65,9 @@ export default function Dashboard() {
     totalPages: 1,
   });
 
+  // Cursor da próxima página (paginação por keyset no scroll infinito)
+  const nextCursorRef = useRef<{ page: number; cursor: string } | null>(null);
+
   const form = useForm<NewsSchemaDto>({
     resolver: zodResolver(newsSchema),
     defaultValues: {
@@ -179,9 +182,15 @@ export default function Dashboard() {
           ...overrideFilters,
         };
 
+        const cursor =
+          !isInitial && nextCursorRef.current?.page === page
+            ? nextCursorRef.current.cursor
+            : undefined;
+
         const response = await api.get<PaginatedNewsResponse>('/api/v1/news', {
           params: {
             page: page,
+            cursor,
             limit: 6,
             keywords: keywords || undefined,
             uf: uf || undefined,
@@ -208,9 +217,15 @@ export default function Dashboard() {
           };
         });
 
+        nextCursorRef.current = apiPagination.next_cursor
+          ? { page: page + 1, cursor: apiPagination.next_cursor }
+          : null;
+
         setPagination((prev) => ({
           ...prev,
-          totalPages: apiPagination.pages,
+          totalPages:
+            apiPagination.pages ??
+            (apiPagination.has_next ? page + 1 : page),
         }));
 
         if (isInitial) {
@@ -69,12 +69,13 @@ export interface NewsDetail {
 }
 
 export interface Pagination {
-  page: number;
+  page?: number | null;
   limit: number;
-  total: number;
-  pages: number;
+  total?: number | null;
+  pages?: number | null;
   has_next: boolean;
   has_prev: boolean;
+  next_cursor?: string | null;
 }
 
 export interface PaginatedNewsResponse {
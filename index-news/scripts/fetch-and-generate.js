@@ -24,29 +24,13 @@ async function fetchPropositions(page) {
   }
 }
 
-// Verifica se uma proposição já foi processada consultando a API
-async function isPropositionProcessed(propositionId) {
-  try {
-    await api.get(`/api/v1/news/proposition/${propositionId}`);
-    return true;
-  } catch (error) {
-    if (error.response?.status === 404) {
-      return false;
-    }
-    throw error;
-  }
-}
-
-// Filtra apenas as proposições que ainda não foram processadas
+// Filtra apenas as proposições que ainda não foram processadas (uma única requisição)
 async function filterUnprocessedPropositions(propositions) {
-  const unprocessed = [];
-  for (const prop of propositions) {
-    const isProcessed = await isPropositionProcessed(prop.id_proposicao);
-    if (!isProcessed) {
-      unprocessed.push(prop);
-    }
-  }
-  return unprocessed;
+  const response = await api.post("/api/v1/news/propositions/missing", {
+    proposition_ids: propositions.map((prop) => prop.id_proposicao),
+  });
+  const missing = new Set(response.data.missing);
+  return propositions.filter((prop) => missing.has(prop.id_proposicao));
 }
 
 // Formata tempo em milissegundos para formato mm:ss